@@ -1,5 +1,7 @@
 from .client import Client
 from .index import Index
+from .search_plan import SearchPlan
+from .bulk_loader import BulkLoader
 from .types import (
     HostPort,
     Key,
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import sys
-from typing import Any, Optional, Union
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 import warnings
 
 import grpc
@@ -11,8 +11,11 @@ from .. import types
 from .internal import channel_provider
 from ..shared.client_helpers import BaseClient as BaseClientMixin
 from ..shared.client_helpers import _patch_public_methods, _raise_closed
+from ..shared.client_helpers import DEFAULT_MAX_IN_FLIGHT
+from ..shared.proto_generated import transact_pb2
 from ..shared.admin_helpers import BaseClient as AdminBaseClientMixin
 from ..shared.conversions import fromIndexStatusResponse
+from .search_plan import SearchPlan
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +55,45 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
     :param certificate_chain: The PEM-encoded certificate chain as a byte string. Defaults to None.
     :type certificate_chain: Optional[bytes]
 
-    :raises AVSClientError: Raised when no seed host is provided.
+    :param record_cache: Enables a client-side cache for :meth:`get` results. Records are cached per key and projection,
+        and dropped when this client writes to or deletes the record. Writes made by other clients are only
+        picked up once an entry's ttl passes. If None, get always reads from the server. Defaults to None.
+    :type record_cache: Optional[types.CacheConfig]
+
+    :param search_cache: Enables a client-side cache for :meth:`vector_search` results. Cached searches for a namespace
+        are dropped when this client writes to or deletes a record in that namespace. Writes made by other clients
+        are only picked up once an entry's ttl passes. If None, vector_search always queries the server. Defaults to None.
+    :type search_cache: Optional[types.SearchCacheConfig]
+
+    :param load_balancing_policy: How requests are spread across the discovered cluster nodes.
+        Defaults to LoadBalancingPolicy.LEAST_OUTSTANDING.
+    :type load_balancing_policy: Union[types.LoadBalancingPolicy, str]
+
+    :param channels_per_node: The number of gRPC channels, each with its own connection, opened to every
+        discovered cluster node. Raise this when many concurrent requests saturate a single connection.
+        Channels beyond the first are connected by cluster tending and used once they are ready. Defaults to 1.
+    :type channels_per_node: int
+
+    :param tend_interval: Seconds between cluster tends, which discover nodes joining or leaving the cluster.
+        A call to a node that fails with UNAVAILABLE starts the next tend early. Defaults to 1.0.
+    :type tend_interval: float
+
+    :param tend_jitter: Fraction of tend_interval by which each wait between tends is randomly shortened
+        or lengthened, so that clients started together do not tend in lockstep. Defaults to 0.1.
+    :type tend_jitter: float
+
+    :param channel_options: gRPC settings, such as keepalive, flow control, message size limits and compression,
+        applied to every channel the client opens. If None, gRPC defaults are used. Defaults to None.
+    :type channel_options: Optional[types.ChannelOptions]
+
+    :param raw_codec: If True, :meth:`get`, :meth:`vector_search` and the write methods encode their requests
+        straight from the given Python and NumPy values and decode responses straight into result objects,
+        without building intermediate protobuf messages. The bytes sent and the results returned are the same
+        as without it. Defaults to False.
+    :type raw_codec: bool
+
+    :raises AVSClientError: Raised when no seed host is provided, load_balancing_policy is invalid,
+        channels_per_node is less than 1, tend_interval is not positive or tend_jitter is not in [0, 1).
 
     """
 
@@ -69,6 +110,14 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
         private_key: Optional[str] = None,
         service_config_path: Optional[str] = None,
         ssl_target_name_override: Optional[str] = None,
+        record_cache: Optional[types.CacheConfig] = None,
+        search_cache: Optional[types.SearchCacheConfig] = None,
+        load_balancing_policy: Union[types.LoadBalancingPolicy, str] = types.LoadBalancingPolicy.LEAST_OUTSTANDING,
+        channels_per_node: int = 1,
+        tend_interval: float = 1.0,
+        tend_jitter: float = 0.1,
+        channel_options: Optional[types.ChannelOptions] = None,
+        raw_codec: bool = False,
     ) -> None:
 
         seeds = self._prepare_seeds(seeds)
@@ -83,7 +132,15 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
             private_key,
             service_config_path,
             ssl_target_name_override,
+            load_balancing_policy=load_balancing_policy,
+            channels_per_node=channels_per_node,
+            tend_interval=tend_interval,
+            tend_jitter=tend_jitter,
+            channel_options=channel_options,
         )
+        self._record_cache = self._prepare_record_cache(record_cache)
+        self._search_cache = self._prepare_search_cache(search_cache)
+        self._raw_codec = raw_codec
         self.closed = False
 
     async def insert(
@@ -146,6 +203,8 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
         except grpc.RpcError as e:
             logger.error("Failed to insert vector with error: %s", e)
             raise types.AVSServerError(rpc_error=e)
+        finally:
+            self._invalidate_record(namespace, set_name, key)
 
     async def update(
         self,
@@ -207,6 +266,8 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
         except grpc.RpcError as e:
             logger.error("Failed to update vector with error: %s", e)
             raise types.AVSServerError(rpc_error=e)
+        finally:
+            self._invalidate_record(namespace, set_name, key)
 
     async def upsert(
         self,
@@ -268,6 +329,170 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
         except grpc.RpcError as e:
             logger.error("Failed to upsert vector with error: %s", e)
             raise types.AVSServerError(rpc_error=e)
+        finally:
+            self._invalidate_record(namespace, set_name, key)
+
+    async def insert_many(
+        self,
+        *,
+        namespace: str,
+        records: Iterable[tuple[Union[int, str, bytes, bytearray, np.generic, np.ndarray], dict[str, Any]]],
+        set_name: Optional[str] = None,
+        ignore_mem_queue_full: Optional[bool] = False,
+        timeout: Optional[int] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> list[types.BatchRecordResult]:
+        """
+        Insert many records into Aerospike Vector Search.
+
+        Up to max_in_flight insert requests are sent concurrently, spread across the discovered cluster nodes.
+        A failed record does not stop the batch; each record's outcome is reported in the returned list.
+
+        :param namespace: The namespace for the records.
+        :type namespace: str
+
+        :param records: An iterable of (key, record_data) pairs. The iterable is consumed lazily.
+        :type records: Iterable[tuple[Union[int, str, bytes, bytearray, np.generic, np.ndarray], dict[str, Any]]]
+
+        :param set_name: The name of the set to which the records belong. Defaults to None.
+        :type set_name: Optional[str]
+
+        :param ignore_mem_queue_full: Ignore the in-memory queue full error. These records will be written to storage
+            and later, the index healer will pick them for indexing. Defaults to False.
+        :type ignore_mem_queue_full: int
+
+        :param timeout: Time in seconds each insert request will wait before failing with an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
+        :type timeout: Optional[int]
+
+        :param max_in_flight: The maximum number of insert requests in flight at once. Defaults to 64.
+        :type max_in_flight: int
+
+        Returns:
+            list[types.BatchRecordResult]: The outcome of each insert, in the same order as records.
+
+        Raises:
+            AVSClientError: Raised if max_in_flight is less than 1.
+        """
+
+        await self._channel_provider._is_ready()
+
+        return await self._put_many(
+            namespace,
+            records,
+            set_name,
+            transact_pb2.WriteType.INSERT_ONLY,
+            ignore_mem_queue_full,
+            timeout,
+            max_in_flight,
+        )
+
+    async def update_many(
+        self,
+        *,
+        namespace: str,
+        records: Iterable[tuple[Union[int, str, bytes, bytearray, np.generic, np.ndarray], dict[str, Any]]],
+        set_name: Optional[str] = None,
+        ignore_mem_queue_full: Optional[bool] = False,
+        timeout: Optional[int] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> list[types.BatchRecordResult]:
+        """
+        Update many records in Aerospike Vector Search.
+
+        Up to max_in_flight update requests are sent concurrently, spread across the discovered cluster nodes.
+        A failed record does not stop the batch; each record's outcome is reported in the returned list.
+
+        :param namespace: The namespace for the records.
+        :type namespace: str
+
+        :param records: An iterable of (key, record_data) pairs. The iterable is consumed lazily.
+        :type records: Iterable[tuple[Union[int, str, bytes, bytearray, np.generic, np.ndarray], dict[str, Any]]]
+
+        :param set_name: The name of the set to which the records belong. Defaults to None.
+        :type set_name: Optional[str]
+
+        :param ignore_mem_queue_full: Ignore the in-memory queue full error. These records will be written to storage
+            and later, the index healer will pick them for indexing. Defaults to False.
+        :type ignore_mem_queue_full: int
+
+        :param timeout: Time in seconds each update request will wait before failing with an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
+        :type timeout: Optional[int]
+
+        :param max_in_flight: The maximum number of update requests in flight at once. Defaults to 64.
+        :type max_in_flight: int
+
+        Returns:
+            list[types.BatchRecordResult]: The outcome of each update, in the same order as records.
+
+        Raises:
+            AVSClientError: Raised if max_in_flight is less than 1.
+        """
+
+        await self._channel_provider._is_ready()
+
+        return await self._put_many(
+            namespace,
+            records,
+            set_name,
+            transact_pb2.WriteType.UPDATE_ONLY,
+            ignore_mem_queue_full,
+            timeout,
+            max_in_flight,
+        )
+
+    async def upsert_many(
+        self,
+        *,
+        namespace: str,
+        records: Iterable[tuple[Union[int, str, bytes, bytearray, np.generic, np.ndarray], dict[str, Any]]],
+        set_name: Optional[str] = None,
+        ignore_mem_queue_full: Optional[bool] = False,
+        timeout: Optional[int] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> list[types.BatchRecordResult]:
+        """
+        Upsert many records in Aerospike Vector Search.
+
+        Up to max_in_flight upsert requests are sent concurrently, spread across the discovered cluster nodes.
+        A failed record does not stop the batch; each record's outcome is reported in the returned list.
+
+        :param namespace: The namespace for the records.
+        :type namespace: str
+
+        :param records: An iterable of (key, record_data) pairs. The iterable is consumed lazily.
+        :type records: Iterable[tuple[Union[int, str, bytes, bytearray, np.generic, np.ndarray], dict[str, Any]]]
+
+        :param set_name: The name of the set to which the records belong. Defaults to None.
+        :type set_name: Optional[str]
+
+        :param ignore_mem_queue_full: Ignore the in-memory queue full error. These records will be written to storage
+            and later, the index healer will pick them for indexing. Defaults to False.
+        :type ignore_mem_queue_full: int
+
+        :param timeout: Time in seconds each upsert request will wait before failing with an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
+        :type timeout: Optional[int]
+
+        :param max_in_flight: The maximum number of upsert requests in flight at once. Defaults to 64.
+        :type max_in_flight: int
+
+        Returns:
+            list[types.BatchRecordResult]: The outcome of each upsert, in the same order as records.
+
+        Raises:
+            AVSClientError: Raised if max_in_flight is less than 1.
+        """
+
+        await self._channel_provider._is_ready()
+
+        return await self._put_many(
+            namespace,
+            records,
+            set_name,
+            transact_pb2.WriteType.UPSERT,
+            ignore_mem_queue_full,
+            timeout,
+            max_in_flight,
+        )
 
     async def get(
         self,
@@ -278,6 +503,7 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
         exclude_fields: Optional[list[str]] = None,
         set_name: Optional[str] = None,
         timeout: Optional[int] = None,
+        vector_format: Union[types.VectorFormat, str] = types.VectorFormat.LIST,
     ) -> types.RecordWithKey:
         """
         Read a record from Aerospike Vector Search.
@@ -308,17 +534,32 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
         :param timeout: Time in seconds this operation will wait before raising an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
         :type timeout: Optional[int]
 
+        :param vector_format: How vector fields are returned. :attr:`VectorFormat.LIST <aerospike_vector_search.types.VectorFormat.LIST>` returns lists of Python floats or bools,
+            :attr:`VectorFormat.NUMPY <aerospike_vector_search.types.VectorFormat.NUMPY>` returns 1-D float32 or bool NumPy arrays decoded without a Python object per element.
+            The strings "list" and "numpy" are also accepted. Defaults to VectorFormat.LIST.
+        :type vector_format: Union[types.VectorFormat, str]
+
         Returns:
             types.RecordWithKey: A record with its associated key.
 
         Raises:
+            AVSClientError: Raised if vector_format is not a valid VectorFormat.
             AVSServerError: Raised if an error occurs during the RPC communication with the server while attempting to get a vector.
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
 
         """
         await self._channel_provider._is_ready()
 
-        (transact_stub, key, get_request, kwargs) = self._prepare_get(
+        vector_format = self._get_vector_format(vector_format)
+
+        if self._record_cache is not None:
+            (cache_key, generation, record) = self._record_cache.lookup(
+                namespace, set_name, key, include_fields, exclude_fields, vector_format
+            )
+            if record is not None:
+                return record
+
+        (transact_stub, pb_key, get_request, kwargs) = self._prepare_get(
             namespace, key, include_fields, exclude_fields, set_name, timeout, logger
         )
 
@@ -330,7 +571,10 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
             logger.error("Failed to get vector with error: %s", e)
             raise types.AVSServerError(rpc_error=e)
 
-        return self._respond_get(response, key)
+        record = self._respond_get(response, pb_key, vector_format)
+        if self._record_cache is not None:
+            self._record_cache.store(cache_key, generation, record)
+        return record
 
     async def exists(
         self,
@@ -422,6 +666,192 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
         except grpc.RpcError as e:
             logger.error("Failed to delete vector with error: %s", e)
             raise types.AVSServerError(rpc_error=e)
+        finally:
+            self._invalidate_record(namespace, set_name, key)
+
+    async def get_many(
+        self,
+        *,
+        namespace: str,
+        keys: Iterable[Union[int, str, bytes, bytearray, np.generic, np.ndarray]],
+        include_fields: Optional[list[str]] = None,
+        exclude_fields: Optional[list[str]] = None,
+        set_name: Optional[str] = None,
+        timeout: Optional[int] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        vector_format: Union[types.VectorFormat, str] = types.VectorFormat.LIST,
+    ) -> list[types.BatchRecordResult]:
+        """
+        Read many records from Aerospike Vector Search.
+
+        Up to max_in_flight get requests are sent concurrently, spread across the discovered cluster nodes.
+        A failed read does not stop the batch; each key's outcome is reported in the returned list.
+
+        :param namespace: The namespace for the records.
+        :type namespace: str
+
+        :param keys: The keys of the records. The iterable is consumed lazily.
+        :type keys: Iterable[Union[int, str, bytes, bytearray, np.generic, np.ndarray]]
+
+        :param include_fields: A list of field names to retrieve from the records.
+            When used, fields that are not included are not sent by the server,
+            saving on network traffic.
+            If a field is listed in both include_fields and exclude_fields,
+            exclude_fields takes priority, and the field is not returned.
+            If None, all fields are retrieved. Defaults to None.
+        :type include_fields: Optional[list[str]]
+
+        :param exclude_fields: A list of field names to exclude from the records.
+            When used, the excluded fields are not sent by the server,
+            saving on network traffic.
+            If None, all fields are retrieved. Defaults to None.
+        :type exclude_fields: Optional[list[str]]
+
+        :param set_name: The name of the set from which to read the records. Defaults to None.
+        :type set_name: Optional[str]
+
+        :param timeout: Time in seconds each get request will wait before failing with an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
+        :type timeout: Optional[int]
+
+        :param max_in_flight: The maximum number of get requests in flight at once. Defaults to 64.
+        :type max_in_flight: int
+
+        :param vector_format: How vector fields are returned. :attr:`VectorFormat.LIST <aerospike_vector_search.types.VectorFormat.LIST>` returns lists of Python floats or bools,
+            :attr:`VectorFormat.NUMPY <aerospike_vector_search.types.VectorFormat.NUMPY>` returns 1-D float32 or bool NumPy arrays decoded without a Python object per element.
+            The strings "list" and "numpy" are also accepted. Defaults to VectorFormat.LIST.
+        :type vector_format: Union[types.VectorFormat, str]
+
+        Returns:
+            list[types.BatchRecordResult]: The outcome of each read, in the same order as keys.
+            The result of a successful read is a :class:`RecordWithKey <aerospike_vector_search.types.RecordWithKey>`.
+
+        Raises:
+            AVSClientError: Raised if max_in_flight is less than 1 or vector_format is not a valid VectorFormat.
+        """
+
+        await self._channel_provider._is_ready()
+
+        self._check_max_in_flight(max_in_flight)
+        vector_format = self._get_vector_format(vector_format)
+
+        operations = self._prepare_get_many(
+            namespace, keys, include_fields, exclude_fields, set_name, timeout, logger
+        )
+
+        return await self._execute_batch(
+            operations,
+            "Get",
+            lambda response, request: self._respond_get(
+                response, self._request_key(request), vector_format
+            ),
+            max_in_flight,
+        )
+
+    async def exists_many(
+        self,
+        *,
+        namespace: str,
+        keys: Iterable[Union[int, str, bytes, bytearray, np.generic, np.ndarray]],
+        set_name: Optional[str] = None,
+        timeout: Optional[int] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> list[types.BatchRecordResult]:
+        """
+        Check if many records exist in Aerospike Vector Search.
+
+        Up to max_in_flight exists requests are sent concurrently, spread across the discovered cluster nodes.
+        A failed check does not stop the batch; each key's outcome is reported in the returned list.
+
+        :param namespace: The namespace for the records.
+        :type namespace: str
+
+        :param keys: The keys of the records. The iterable is consumed lazily.
+        :type keys: Iterable[Union[int, str, bytes, bytearray, np.generic, np.ndarray]]
+
+        :param set_name: The name of the set to which the records belong. Defaults to None.
+        :type set_name: Optional[str]
+
+        :param timeout: Time in seconds each exists request will wait before failing with an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
+        :type timeout: Optional[int]
+
+        :param max_in_flight: The maximum number of exists requests in flight at once. Defaults to 64.
+        :type max_in_flight: int
+
+        Returns:
+            list[types.BatchRecordResult]: The outcome of each check, in the same order as keys.
+            The result of a successful check is True if the record exists, False otherwise.
+
+        Raises:
+            AVSClientError: Raised if max_in_flight is less than 1.
+        """
+
+        await self._channel_provider._is_ready()
+
+        self._check_max_in_flight(max_in_flight)
+
+        operations = self._prepare_exists_many(
+            namespace, keys, set_name, timeout, logger
+        )
+
+        return await self._execute_batch(
+            operations,
+            "Exists",
+            lambda response, request: self._respond_exists(response),
+            max_in_flight,
+        )
+
+    async def delete_many(
+        self,
+        *,
+        namespace: str,
+        keys: Iterable[Union[int, str, bytes, bytearray, np.generic, np.ndarray]],
+        set_name: Optional[str] = None,
+        timeout: Optional[int] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> list[types.BatchRecordResult]:
+        """
+        Delete many records from Aerospike Vector Search.
+
+        Up to max_in_flight delete requests are sent concurrently, spread across the discovered cluster nodes.
+        A failed delete does not stop the batch; each key's outcome is reported in the returned list.
+
+        :param namespace: The namespace for the records.
+        :type namespace: str
+
+        :param keys: The keys of the records. The iterable is consumed lazily.
+        :type keys: Iterable[Union[int, str, bytes, bytearray, np.generic, np.ndarray]]
+
+        :param set_name: The name of the set to which the records belong. Defaults to None.
+        :type set_name: Optional[str]
+
+        :param timeout: Time in seconds each delete request will wait before failing with an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
+        :type timeout: Optional[int]
+
+        :param max_in_flight: The maximum number of delete requests in flight at once. Defaults to 64.
+        :type max_in_flight: int
+
+        Returns:
+            list[types.BatchRecordResult]: The outcome of each delete, in the same order as keys.
+
+        Raises:
+            AVSClientError: Raised if max_in_flight is less than 1.
+        """
+
+        await self._channel_provider._is_ready()
+
+        self._check_max_in_flight(max_in_flight)
+
+        operations = self._prepare_delete_many(
+            namespace, keys, set_name, timeout, logger
+        )
+
+        return await self._execute_batch(
+            operations,
+            "Delete",
+            lambda response, request: None,
+            max_in_flight,
+            on_complete=lambda key: self._invalidate_record(namespace, set_name, key),
+        )
 
     async def is_indexed(
         self,
@@ -579,7 +1009,9 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
         include_fields: Optional[list[str]] = None,
         exclude_fields: Optional[list[str]] = None,
         timeout: Optional[int] = None,
-    ) -> list[types.Neighbor]:
+        result_format: Union[types.SearchResultFormat, str] = types.SearchResultFormat.NEIGHBORS,
+        vector_format: Union[types.VectorFormat, str] = types.VectorFormat.LIST,
+    ) -> Union[list[types.Neighbor], types.SearchResult]:
         """
         Perform a Hierarchical Navigable Small World (HNSW) vector search in Aerospike Vector Search.
 
@@ -616,15 +1048,45 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
         :param timeout: Time in seconds this operation will wait before raising an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
         :type timeout: Optional[int]
 
+        :param result_format: How the results are returned. :attr:`SearchResultFormat.NEIGHBORS <aerospike_vector_search.types.SearchResultFormat.NEIGHBORS>` returns Neighbor objects,
+            :attr:`SearchResultFormat.LAZY_NEIGHBORS <aerospike_vector_search.types.SearchResultFormat.LAZY_NEIGHBORS>` returns Neighbor objects that decode their key and fields on first access,
+            :attr:`SearchResultFormat.ARRAYS <aerospike_vector_search.types.SearchResultFormat.ARRAYS>` returns a columnar :class:`SearchResult <aerospike_vector_search.types.SearchResult>`.
+            The strings "neighbors", "lazy_neighbors" and "arrays" are also accepted. Defaults to SearchResultFormat.NEIGHBORS.
+        :type result_format: Union[types.SearchResultFormat, str]
+
+        :param vector_format: How vector fields of Neighbor results are returned. :attr:`VectorFormat.LIST <aerospike_vector_search.types.VectorFormat.LIST>` returns lists of Python floats or bools,
+            :attr:`VectorFormat.NUMPY <aerospike_vector_search.types.VectorFormat.NUMPY>` returns 1-D float32 or bool NumPy arrays decoded without a Python object per element.
+            The strings "list" and "numpy" are also accepted. Defaults to VectorFormat.LIST.
+        :type vector_format: Union[types.VectorFormat, str]
+
         Returns:
-            list[types.Neighbor]: A list of neighbors records found by the search.
+            Union[list[types.Neighbor], types.SearchResult]: The neighbor records found by the search, in the requested result_format.
 
         Raises:
+            AVSClientError: Raised if result_format is not a valid SearchResultFormat or vector_format is not a valid VectorFormat.
             AVSServerError: Raised if an error occurs during the RPC communication with the server while attempting to vector search.
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
         """
         await self._channel_provider._is_ready()
 
+        result_format = self._get_search_result_format(result_format)
+        vector_format = self._get_vector_format(vector_format)
+
+        if self._search_cache is not None:
+            (cache_key, generation, results) = self._search_cache.lookup(
+                namespace,
+                index_name,
+                query,
+                limit,
+                search_params,
+                include_fields,
+                exclude_fields,
+                result_format,
+                vector_format,
+            )
+            if results is not None:
+                return results
+
         (transact_stub, vector_search_request, kwargs) = self._prepare_vector_search(
             namespace,
             index_name,
@@ -638,8 +1100,8 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
         )
 
         try:
-            return [
-                self._respond_neighbor(result)
+            results = [
+                result
                 async for result in transact_stub.VectorSearch(
                     vector_search_request,
                     credentials=self._channel_provider.get_token(),
@@ -650,6 +1112,230 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
             logger.error("Failed to vector search with error: %s", e)
             raise types.AVSServerError(rpc_error=e)
 
+        results = self._respond_neighbors(results, result_format, vector_format)
+        if self._search_cache is not None:
+            self._search_cache.store(cache_key, generation, results)
+        return results
+
+    async def vector_search_many(
+        self,
+        *,
+        namespace: str,
+        index_name: str,
+        queries: Union[np.ndarray, Iterable[Union[list[Union[bool, float]], np.ndarray]]],
+        limit: int = 10,
+        search_params: Optional[types.HnswSearchParams] = None,
+        include_fields: Optional[list[str]] = None,
+        exclude_fields: Optional[list[str]] = None,
+        timeout: Optional[int] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        result_format: Union[types.SearchResultFormat, str] = types.SearchResultFormat.NEIGHBORS,
+        vector_format: Union[types.VectorFormat, str] = types.VectorFormat.LIST,
+    ) -> Union[list[list[types.Neighbor]], list[types.SearchResult]]:
+        """
+        Perform many Hierarchical Navigable Small World (HNSW) vector searches in Aerospike Vector Search.
+
+        Up to max_in_flight searches run concurrently, spread across the discovered cluster nodes.
+        When the client has a search cache, each query is looked up and stored in it as in :meth:`vector_search`.
+
+        :param namespace: The namespace for the records.
+        :type namespace: str
+
+        :param index_name: The name of the index.
+        :type index_name: str
+
+        :param queries: The query vectors for the searches, for example a 2-dimensional array of shape (n, dimensions).
+        :type queries: Union[np.ndarray, Iterable[Union[list[Union[bool, float]], np.ndarray]]]
+
+        :param limit: An optional maximum number of neighbors to return for each query. K value. Defaults to 10.
+        :type limit: int
+
+        :param search_params: Parameters for the HNSW algorithm.
+            If None, the default parameters for the index are used. Defaults to None.
+        :type search_params: Optional[types_pb2.HnswSearchParams]
+
+        :param include_fields: A list of field names to retrieve from the results.
+            When used, fields that are not included are not sent by the server,
+            saving on network traffic.
+            If a field is listed in both include_fields and exclude_fields,
+            exclude_fields takes priority, and the field is not returned.
+            If None, all fields are retrieved. Defaults to None.
+        :type include_fields: Optional[list[str]]
+
+        :param exclude_fields: A list of field names to exclude from the results.
+            When used, the excluded fields are not sent by the server,
+            saving on network traffic.
+            If None, all fields are retrieved. Defaults to None.
+        :type exclude_fields: Optional[list[str]]
+
+        :param timeout: Time in seconds each search will wait before raising an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
+        :type timeout: Optional[int]
+
+        :param max_in_flight: The maximum number of searches in flight at once. Defaults to 64.
+        :type max_in_flight: int
+
+        :param result_format: How the results are returned. :attr:`SearchResultFormat.NEIGHBORS <aerospike_vector_search.types.SearchResultFormat.NEIGHBORS>` returns Neighbor objects,
+            :attr:`SearchResultFormat.LAZY_NEIGHBORS <aerospike_vector_search.types.SearchResultFormat.LAZY_NEIGHBORS>` returns Neighbor objects that decode their key and fields on first access,
+            :attr:`SearchResultFormat.ARRAYS <aerospike_vector_search.types.SearchResultFormat.ARRAYS>` returns a columnar :class:`SearchResult <aerospike_vector_search.types.SearchResult>`.
+            The strings "neighbors", "lazy_neighbors" and "arrays" are also accepted. Defaults to SearchResultFormat.NEIGHBORS.
+        :type result_format: Union[types.SearchResultFormat, str]
+
+        :param vector_format: How vector fields of Neighbor results are returned. :attr:`VectorFormat.LIST <aerospike_vector_search.types.VectorFormat.LIST>` returns lists of Python floats or bools,
+            :attr:`VectorFormat.NUMPY <aerospike_vector_search.types.VectorFormat.NUMPY>` returns 1-D float32 or bool NumPy arrays decoded without a Python object per element.
+            The strings "list" and "numpy" are also accepted. Defaults to VectorFormat.LIST.
+        :type vector_format: Union[types.VectorFormat, str]
+
+        Returns:
+            Union[list[list[types.Neighbor]], list[types.SearchResult]]: The neighbors found for each query, in the same order as queries.
+
+        Raises:
+            AVSClientError: Raised if max_in_flight is less than 1, queries is not 2-dimensional, result_format is not a valid SearchResultFormat or vector_format is not a valid VectorFormat.
+            AVSServerError: Raised if an error occurs during the RPC communication with the server while attempting to vector search.
+            This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
+        """
+
+        await self._channel_provider._is_ready()
+
+        self._check_max_in_flight(max_in_flight)
+        self._check_queries(queries)
+        result_format = self._get_search_result_format(result_format)
+        vector_format = self._get_vector_format(vector_format)
+
+        results: list = []
+        misses: list = []
+        prepared = self._prepare_vector_search_many(
+            namespace,
+            index_name,
+            self._uncached_queries(
+                queries,
+                results,
+                misses,
+                namespace,
+                index_name,
+                limit,
+                search_params,
+                include_fields,
+                exclude_fields,
+                result_format,
+                vector_format,
+            ),
+            limit,
+            search_params,
+            include_fields,
+            exclude_fields,
+            timeout,
+            logger,
+        )
+
+        async def search(miss, transact_stub, vector_search_request, kwargs):
+            (index, cache_key, generation) = miss
+            responses = [
+                result
+                async for result in transact_stub.VectorSearch(
+                    vector_search_request,
+                    credentials=self._channel_provider.get_token(),
+                    **kwargs,
+                )
+            ]
+            results[index] = self._respond_neighbors(responses, result_format, vector_format)
+            self._store_search(cache_key, generation, results[index])
+
+        tasks: list[asyncio.Task] = []
+        pending: set[asyncio.Task] = set()
+        try:
+            for (transact_stub, vector_search_request, kwargs) in prepared:
+                # _uncached_queries recorded this query's result slot before yielding it.
+                miss = misses.pop()
+                if len(pending) >= max_in_flight:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        # surface failures before issuing more searches
+                        task.result()
+
+                task = asyncio.create_task(
+                    search(miss, transact_stub, vector_search_request, kwargs)
+                )
+                tasks.append(task)
+                pending.add(task)
+
+            await asyncio.gather(*tasks)
+            return results
+        except BaseException as e:
+            for task in tasks:
+                task.cancel()
+            if isinstance(e, grpc.RpcError):
+                logger.error("Failed to vector search with error: %s", e)
+                raise types.AVSServerError(rpc_error=e)
+            raise
+
+    def prepare_search(
+        self,
+        *,
+        namespace: str,
+        index_name: str,
+        limit: int = 10,
+        search_params: Optional[types.HnswSearchParams] = None,
+        include_fields: Optional[list[str]] = None,
+        exclude_fields: Optional[list[str]] = None,
+        result_format: Union[types.SearchResultFormat, str] = types.SearchResultFormat.NEIGHBORS,
+        vector_format: Union[types.VectorFormat, str] = types.VectorFormat.LIST,
+    ) -> SearchPlan:
+        """
+        Prepare a reusable vector search in which only the query changes between calls.
+
+        Everything the search sends except the query vector is serialized once.
+        Use the returned plan when running many searches with the same options, for example at high query rates.
+
+        :param namespace: The namespace for the records.
+        :type namespace: str
+
+        :param index_name: The name of the index.
+        :type index_name: str
+
+        :param limit: An optional maximum number of neighbors to return. K value. Defaults to 10.
+        :type limit: int
+
+        :param search_params: Parameters for the HNSW algorithm.
+            If None, the default parameters for the index are used. Defaults to None.
+        :type search_params: Optional[types_pb2.HnswSearchParams]
+
+        :param include_fields: A list of field names to retrieve from the results.
+            If a field is listed in both include_fields and exclude_fields,
+            exclude_fields takes priority, and the field is not returned.
+            If None, all fields are retrieved. Defaults to None.
+        :type include_fields: Optional[list[str]]
+
+        :param exclude_fields: A list of field names to exclude from the results.
+            If None, all fields are retrieved. Defaults to None.
+        :type exclude_fields: Optional[list[str]]
+
+        :param result_format: How the results are returned, as in :meth:`vector_search`. Defaults to SearchResultFormat.NEIGHBORS.
+        :type result_format: Union[types.SearchResultFormat, str]
+
+        :param vector_format: How vector fields of Neighbor results are returned, as in :meth:`vector_search`. Defaults to VectorFormat.LIST.
+        :type vector_format: Union[types.VectorFormat, str]
+
+        Returns:
+            SearchPlan: A plan whose :meth:`SearchPlan.vector_search <aerospike_vector_search.aio.search_plan.SearchPlan.vector_search>` runs the search for a query.
+
+        Raises:
+            AVSClientError: Raised if result_format is not a valid SearchResultFormat or vector_format is not a valid VectorFormat.
+        """
+        return SearchPlan(
+            client=self,
+            namespace=namespace,
+            index_name=index_name,
+            limit=limit,
+            search_params=search_params,
+            include_fields=include_fields,
+            exclude_fields=exclude_fields,
+            result_format=result_format,
+            vector_format=vector_format,
+            logger=logger,
+        )
+
     async def index_get_percent_unmerged(
         self,
         *,
@@ -1493,6 +2179,124 @@ class Client(BaseClientMixin, AdminBaseClientMixin):
 
                     raise types.AVSServerError(rpc_error=e)
 
+    async def _put_many(
+        self,
+        namespace: str,
+        records: Iterable[tuple[Any, dict[str, Any]]],
+        set_name: Optional[str],
+        write_type: transact_pb2.WriteType,
+        ignore_mem_queue_full: Optional[bool],
+        timeout: Optional[int],
+        max_in_flight: int,
+    ) -> list[types.BatchRecordResult]:
+        self._check_max_in_flight(max_in_flight)
+
+        operations = self._prepare_put_many(
+            namespace,
+            records,
+            set_name,
+            write_type,
+            ignore_mem_queue_full,
+            timeout,
+            logger,
+        )
+
+        return await self._execute_batch(
+            operations,
+            "Put",
+            lambda response, request: None,
+            max_in_flight,
+            on_complete=lambda key: self._invalidate_record(namespace, set_name, key),
+        )
+
+    async def _execute_batch(
+        self,
+        operations: Iterator[tuple[Any, Optional[tuple], Optional[types.AVSError]]],
+        method_name: str,
+        respond: Callable[[Any, Any], Any],
+        max_in_flight: int,
+        on_complete: Optional[Callable[[Any], None]] = None,
+    ) -> list[types.BatchRecordResult]:
+        """
+        Issue a unary RPC per operation as a task, keeping at most
+        max_in_flight calls outstanding. Results are returned in input order.
+        on_complete is called with the key of every operation that was sent,
+        once its call has finished or been cancelled.
+        """
+        results: list[Optional[types.BatchRecordResult]] = []
+        pending: set[asyncio.Task] = set()
+
+        async def run(index, key, stub, request, kwargs):
+            try:
+                response = await getattr(stub, method_name)(
+                    request, credentials=self._channel_provider.get_token(), **kwargs
+                )
+                results[index] = types.BatchRecordResult(
+                    key=key, result=respond(response, request)
+                )
+            except grpc.RpcError as e:
+                logger.debug("Batch %s failed for key %s with error: %s", method_name, key, e)
+                results[index] = types.BatchRecordResult(
+                    key=key, error=types.AVSServerError(rpc_error=e)
+                )
+            except Exception as e:
+                results[index] = types.BatchRecordResult(
+                    key=key, error=types.AVSClientError(message=str(e))
+                )
+            finally:
+                if on_complete is not None:
+                    on_complete(key)
+
+        try:
+            for index, (key, prepared, error) in enumerate(operations):
+                results.append(None)
+
+                if error is not None:
+                    results[index] = types.BatchRecordResult(key=key, error=error)
+                    continue
+
+                if len(pending) >= max_in_flight:
+                    _, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+
+                (stub, request, kwargs) = prepared
+                pending.add(asyncio.create_task(run(index, key, stub, request, kwargs)))
+
+            if pending:
+                await asyncio.wait(pending)
+        except BaseException:
+            # Don't leave calls running in the background if the batch is interrupted.
+            for task in pending:
+                task.cancel()
+            raise
+
+        return results
+
+    def record_cache_stats(self) -> Optional[types.CacheStats]:
+        """
+        Get statistics for the record cache.
+
+        Returns:
+            Optional[types.CacheStats]: Hit, miss and eviction counters for the record cache,
+            or None if the client was created without a record_cache.
+        """
+        if self._record_cache is None:
+            return None
+        return self._record_cache.stats()
+
+    def search_cache_stats(self) -> Optional[types.CacheStats]:
+        """
+        Get statistics for the vector search cache.
+
+        Returns:
+            Optional[types.CacheStats]: Hit, miss and eviction counters for the search cache,
+            or None if the client was created without a search_cache.
+        """
+        if self._search_cache is None:
+            return None
+        return self._search_cache.stats()
+
     async def close(self):
         """
         Close the Aerospike Vector Search Client.
@@ -1,7 +1,8 @@
 import re
+import time
 import asyncio
 import logging
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import google.protobuf.empty_pb2
 import grpc
@@ -10,13 +11,23 @@ from ... import types
 from ...shared.proto_generated import vector_db_pb2
 from ...shared.proto_generated import vector_db_pb2_grpc
 from ...shared import base_channel_provider
+from ...shared.base_channel_provider import (
+    CONNECTION_ATTEMPT_DELAY,
+    ENDPOINT_RACE_TIMEOUT,
+    TEND_MIN_INTERVAL,
+    ChannelAndEndpoints,
+)
+from ...shared.load_balancing import AsyncNodeStatsInterceptor, NodeStats
 from ...shared.token_manager import TokenManager
 
 empty = google.protobuf.empty_pb2.Empty()
 
 logger = logging.getLogger(__name__)
 
-TEND_INTERVAL : int = 1
+TEND_INTERVAL: float = 1.0
+# Fraction of TEND_INTERVAL by which each wait between tends is randomly
+# shortened or lengthened.
+TEND_JITTER: float = 0.1
 
 
 class ChannelProvider(base_channel_provider.BaseChannelProvider):
@@ -34,6 +45,11 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
         private_key: Optional[str] = None,
         service_config_path: Optional[str] = None,
         ssl_target_name_override: Optional[str] = None,
+        load_balancing_policy: Union[types.LoadBalancingPolicy, str] = types.LoadBalancingPolicy.LEAST_OUTSTANDING,
+        channels_per_node: int = 1,
+        tend_interval: float = TEND_INTERVAL,
+        tend_jitter: float = TEND_JITTER,
+        channel_options: Optional[types.ChannelOptions] = None,
     ) -> None:
 
         # Exception to progotate to main control flow from
@@ -51,11 +67,19 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
             private_key,
             service_config_path,
             ssl_target_name_override,
+            load_balancing_policy,
+            channels_per_node,
+            tend_interval,
+            tend_jitter,
+            channel_options,
         )
 
         # When set, client has concluded cluster tending
         self._tend_ended: asyncio.Event = asyncio.Event()
 
+        # When set, the tend loop stops waiting and tends now, or exits if closed
+        self._tend_wakeup: asyncio.Event = asyncio.Event()
+
         # When set, client has completed a cluster tend cycle, initialized auth, and verified client-server minimum compatibility
         self._ready: asyncio.Event = asyncio.Event()
 
@@ -66,7 +90,7 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
         self._token_manager.configure_async(self._auth_tending_lock)
 
         # initializes client tending processes
-        asyncio.create_task(self._start_tending())
+        self._tend_task = asyncio.create_task(self._start_tending())
 
     async def _is_ready(self):
         # Wait 1 round of cluster tending, auth token initialization, and server client compatibility verification
@@ -80,13 +104,13 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
     async def _start_tending(self):
 
         try:
-            auth_stub = self._get_auth_stub()
-            await self._token_manager.refresh_token_async(auth_stub)
+            # The auth stub is looked up on each refresh, since seed channels are closed once the cluster is known.
+            await self._token_manager.refresh_token_async(self._get_auth_stub)
 
             # verfies server is minimally compatible with client
             await self._check_server_version()
 
-            await self._tend_cluster()
+            tending = await self._tend_cluster()
 
             self._ready.set()
         except Exception as e:
@@ -94,14 +118,47 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
             self._tend_ended.set()
             self._ready.set()
             self._tend_exception = e
+            return
+
+        if tending:
+            await self._tend_loop()
 
-    async def _tend_cluster(self):
+    async def _tend_loop(self):
+        last_tend = time.monotonic()
+        try:
+            while True:
+                await self._wait_for_next_tend(last_tend)
+                last_tend = time.monotonic()
+                if not await self._tend_cluster():
+                    return
+        finally:
+            self._tend_ended.set()
+
+    async def _wait_for_next_tend(self, last_tend: float):
+        try:
+            await asyncio.wait_for(self._tend_wakeup.wait(), self._next_tend_delay())
+        except asyncio.TimeoutError:
+            return
+
+        # Woken by close or by a call that failed with UNAVAILABLE.
+        # Wakeups arriving until the clear below are served by the same tend.
+        if not self._closed:
+            remaining = last_tend + TEND_MIN_INTERVAL - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+        self._tend_wakeup.clear()
+
+    def _request_tend(self):
+        self._tend_wakeup.set()
+
+    async def _tend_cluster(self) -> bool:
+        # Runs one tend cycle. Returns False once tending has ended.
         try:
             (channels, end_tend_cluster) = self.init_tend_cluster()
 
             if end_tend_cluster:
                 self._tend_ended.set()
-                return
+                return False
 
             (cluster_info_stubs, tasks) = (
                 self._gather_new_cluster_ids_and_cluster_info_stubs(channels)
@@ -119,19 +176,25 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
 
             temp_endpoints = self._assign_temporary_endpoints(cluster_endpoints_list)
 
-            if update_endpoints_stubs:
+            if update_endpoints_stubs and temp_endpoints:
+
+                connected = await self._connect_nodes(
+                    self._nodes_to_connect(temp_endpoints)
+                )
+
+                self._add_new_channels_from_temp_endpoints(temp_endpoints, connected)
 
-                tasks = self._add_new_channels_from_temp_endpoints(temp_endpoints)
+                self._retire_old_channels_from_node_channels(temp_endpoints)
 
-                await asyncio.gather(*tasks)
+            await self._fill_channel_pools()
 
-                tasks = self._close_old_channels_from_node_channels(temp_endpoints)
+            self._park_seed_channels()
 
-                await asyncio.gather(*tasks)
+            tasks = self._close_drained_channels()
 
-            await asyncio.sleep(TEND_INTERVAL)
+            await asyncio.gather(*tasks)
 
-            asyncio.create_task(self._tend_cluster())
+            return True
 
         except Exception as e:
             logger.error("Unexpected tend failure: %s", e)
@@ -164,9 +227,100 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
                 "While tending, failed to get cluster endpoints with error: " + str(e)
             )
 
+    async def _connect_nodes(
+        self, nodes: dict[int, vector_db_pb2.ServerEndpointList]
+    ) -> dict[int, Optional[ChannelAndEndpoints]]:
+        connected = await asyncio.gather(
+            *(self._connect_node(endpoints) for endpoints in nodes.values())
+        )
+        return dict(zip(nodes, connected))
+
+    async def _connect_node(
+        self, endpoints: vector_db_pb2.ServerEndpointList
+    ) -> Optional[ChannelAndEndpoints]:
+        stats = NodeStats()
+        attempts = list(self._create_endpoint_channels(endpoints, stats))
+        if not attempts:
+            return None
+
+        winner = await self._race_endpoint_channels(
+            [channel for (_, channel) in attempts]
+        )
+
+        for i, (_, channel) in enumerate(attempts):
+            if i != winner:
+                await channel.close()
+        if winner is None:
+            logger.debug("While tending, no endpoint of a node became ready")
+            return None
+        return self._create_channel_and_endpoints(endpoints, stats, attempts[winner])
+
+    async def _race_endpoint_channels(
+        self, channels: list[grpc.aio.Channel]
+    ) -> Optional[int]:
+        # Starts connecting channel i at i * CONNECTION_ATTEMPT_DELAY and
+        # returns the index of the first that is ready, if any is by the deadline.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + ENDPOINT_RACE_TIMEOUT
+        tasks: list[asyncio.Task] = []
+        pending: set[asyncio.Task] = set()
+        try:
+            while True:
+                if len(tasks) < len(channels):
+                    tasks.append(asyncio.ensure_future(channels[len(tasks)].channel_ready()))
+                    pending.add(tasks[-1])
+
+                timeout = deadline - loop.time()
+                if len(tasks) < len(channels):
+                    timeout = min(timeout, CONNECTION_ATTEMPT_DELAY)
+                if timeout <= 0 or not pending:
+                    return None
+
+                (done, pending) = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for i, task in enumerate(tasks):
+                    if task in done and not task.cancelled() and task.exception() is None:
+                        return i
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fill_channel_pools(self) -> None:
+        # Connects the channels missing from each node's pool. A channel joins
+        # the node's rotation once it is ready. One that is not ready within
+        # ENDPOINT_RACE_TIMEOUT is closed, and the next tend tries again.
+        attempts = [
+            (channel_endpoints, channel)
+            for channel_endpoints in self._node_channels.values()
+            for channel in channel_endpoints.create_pool_channels()
+        ]
+        if not attempts:
+            return
+
+        ready = await asyncio.gather(
+            *(self._wait_for_ready(channel) for (_, channel) in attempts)
+        )
+
+        for (channel_endpoints, channel), is_ready in zip(attempts, ready):
+            if is_ready:
+                channel_endpoints.add_channel(channel)
+            else:
+                logger.debug("While tending, a pooled channel did not become ready")
+                await channel.close()
+
+    @staticmethod
+    async def _wait_for_ready(channel: grpc.aio.Channel) -> bool:
+        try:
+            await asyncio.wait_for(channel.channel_ready(), ENDPOINT_RACE_TIMEOUT)
+        except Exception:
+            return False
+        return True
+
     async def _close_on_channel_coroutine(self, channel_endpoints):
         try:
-            await channel_endpoints.channel.close()
+            for channel in channel_endpoints.channels:
+                await channel.close()
         except Exception as e:
             logger.debug("While tending, failed to close GRPC channel: " + str(e))
 
@@ -181,7 +335,7 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
 
     async def _check_server_version(self):
         try:
-            stub = vector_db_pb2_grpc.AboutServiceStub(self.get_channel())
+            stub = self.get_stub(vector_db_pb2_grpc.AboutServiceStub)
             about_request = vector_db_pb2.AboutRequest()
             response = await stub.Get(about_request, credentials=self._token_manager.get_token_credentials())
             self.current_server_version = response.version
@@ -196,10 +350,34 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
             self._tend_exception = e
             raise e
 
-    def _create_channel(self, host: str, port: int) -> grpc.Channel:
+    def _create_node_channel(self, host: str, port: int, stats: NodeStats) -> grpc.aio.Channel:
+        return self._create_channel(
+            host,
+            port,
+            interceptors=[AsyncNodeStatsInterceptor(stats, self._on_node_unavailable)],
+            extra_options=self._node_channel_options(),
+        )
+
+    def _create_channel(
+        self,
+        host: str,
+        port: int,
+        interceptors: Optional[list[grpc.aio.ClientInterceptor]] = None,
+        extra_options: Optional[list[tuple[str, Any]]] = None,
+    ) -> grpc.aio.Channel:
         host = re.sub(r"%.*", "", host)
+        if ":" in host and not host.startswith("["):
+            # IPv6 literal
+            host = f"[{host}]"
+
+        # interceptors can only be attached when an aio channel is created
+        kwargs = {}
+        if interceptors:
+            kwargs["interceptors"] = interceptors
+        if self._compression:
+            kwargs["compression"] = self._compression
 
-        options = []
+        options = self._channel_args + (list(extra_options) if extra_options else [])
 
         if self.ssl_target_name_override:
             options.append(
@@ -221,16 +399,22 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
             )
 
             return grpc.aio.secure_channel(
-                f"{host}:{port}", ssl_credentials, options=options
+                f"{host}:{port}",
+                ssl_credentials,
+                options=options,
+                **kwargs,
             )
 
         else:
-            return grpc.aio.insecure_channel(f"{host}:{port}", options=options)
+            return grpc.aio.insecure_channel(f"{host}:{port}", options=options, **kwargs)
 
     async def close(self):
         # signals to tend_cluster to end cluster tending
         self._closed = True
 
+        # wakes the tend loop so it exits without finishing its wait
+        self._tend_wakeup.set()
+
         # wait until cluster tending has ended
         await self._tend_ended.wait()
 
@@ -238,8 +422,16 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
             await channel.close()
 
         for k, channelEndpoints in self._node_channels.items():
-            if channelEndpoints.channel:
-                await channelEndpoints.channel.close()
-                
+            for channel in channelEndpoints.channels:
+                if channel:
+                    await channel.close()
+
+        for channelEndpoints, _ in self._retiring_channels:
+            for channel in channelEndpoints.channels:
+                if channel:
+                    await channel.close()
+
+        self._channel_stubs.clear()
+
         # Cancel token refresh
         await self._token_manager.cancel_refresh_async()
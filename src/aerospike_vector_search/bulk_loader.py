@@ -0,0 +1,176 @@
+import collections
+import logging
+import time
+from typing import Any, Iterable, Optional, Union
+
+import grpc
+import numpy as np
+
+from aerospike_vector_search.client import Client, types
+from .shared.bulk_loader import BaseBulkLoader
+
+logger = logging.getLogger(__name__)
+
+
+class BulkLoader(BaseBulkLoader):
+    """
+    BulkLoader streams records into Aerospike Vector Search as fast as the cluster can absorb them.
+
+    The loader keeps a window of upsert requests in flight and sizes that window with
+    additive-increase/multiplicative-decrease (AIMD) congestion control. Every successful write
+    grows the window a little. When the server pushes back, for example because an index's
+    in-memory queue is full, the window is halved and the rejected records are retried after a backoff.
+
+    .. code-block:: python
+
+        import aerospike_vector_search as avs
+
+        client = avs.Client(
+            seeds=avs.types.HostPort(host="127.0.0.1", port=5000),
+        )
+
+        loader = avs.BulkLoader(client=client, namespace="test")
+
+        records = (
+            (i, {"vector": [float(i)] * 128})
+            for i in range(1_000_000)
+        )
+        stats = loader.load(records)
+
+        print(stats.records_written, stats.throughput)
+
+    :param client: The client used to write records.
+    :type client: Client
+
+    :param namespace: The namespace for the records.
+    :type namespace: str
+
+    :param set_name: The name of the set to which the records belong. Defaults to None.
+    :type set_name: Optional[str]
+
+    :param initial_in_flight: The number of write requests in flight when loading starts. Defaults to 16.
+    :type initial_in_flight: int
+
+    :param min_in_flight: The lower bound for the number of write requests in flight. Defaults to 1.
+    :type min_in_flight: int
+
+    :param max_in_flight: The upper bound for the number of write requests in flight. Defaults to 256.
+    :type max_in_flight: int
+
+    :param additive_increase: How many requests the window grows by per round trip without backpressure. Defaults to 1.
+    :type additive_increase: float
+
+    :param decrease_factor: The factor the window is multiplied by when the server signals backpressure. Defaults to 0.5.
+    :type decrease_factor: float
+
+    :param max_retries: How many times a record rejected because of backpressure is retried before it is reported as failed. Defaults to 10.
+    :type max_retries: int
+
+    :param retry_backoff: Time in seconds to wait before the first retry of a record. Doubles with every retry. Defaults to 0.05.
+    :type retry_backoff: float
+
+    :param max_retry_backoff: Upper bound in seconds for the retry backoff. Defaults to 2.
+    :type max_retry_backoff: float
+
+    :param timeout: Time in seconds each write request will wait before failing. Defaults to None.
+    :type timeout: Optional[int]
+
+    :raises AVSClientError: Raised if the in-flight limits or decrease_factor are invalid.
+    """
+
+    def __init__(
+            self,
+            *,
+            client: Client,
+            namespace: str,
+            set_name: Optional[str] = None,
+            initial_in_flight: int = 16,
+            min_in_flight: int = 1,
+            max_in_flight: int = 256,
+            additive_increase: float = 1.0,
+            decrease_factor: float = 0.5,
+            max_retries: int = 10,
+            retry_backoff: float = 0.05,
+            max_retry_backoff: float = 2.0,
+            timeout: Optional[int] = None,
+        ):
+        super().__init__(
+            namespace=namespace,
+            set_name=set_name,
+            initial_in_flight=initial_in_flight,
+            min_in_flight=min_in_flight,
+            max_in_flight=max_in_flight,
+            additive_increase=additive_increase,
+            decrease_factor=decrease_factor,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+            max_retry_backoff=max_retry_backoff,
+            timeout=timeout,
+        )
+        self._client: Client = client
+
+    def load(
+            self,
+            records: Iterable[tuple[Union[int, str, bytes, bytearray, np.generic, np.ndarray], dict[str, Any]]],
+        ) -> types.BulkLoadStats:
+        """
+        Upsert every record produced by records.
+
+        The iterable is consumed lazily, so generators of any size can be loaded.
+        Records that fail are reported in the returned statistics instead of stopping the load.
+        While a load is running, :attr:`stats` holds live statistics.
+
+        :param records: An iterable of (key, record_data) pairs.
+        :type records: Iterable[tuple[Union[int, str, bytes, bytearray, np.generic, np.ndarray], dict[str, Any]]]
+
+        Returns:
+            types.BulkLoadStats: Throughput and error statistics for the load.
+        """
+        controller = self._start()
+        source = iter(records)
+        in_flight: collections.deque = collections.deque()
+
+        try:
+            while True:
+                now = time.monotonic()
+                while len(in_flight) < controller.limit:
+                    pending = self._next_record(source, now)
+                    if pending is None:
+                        break
+
+                    prepared = self._prepare_record(self._client, pending, logger)
+                    if prepared is None:
+                        continue
+
+                    (transact_stub, put_request, kwargs) = prepared
+                    future = transact_stub.Put.future(
+                        put_request,
+                        credentials=self._client._channel_provider.get_token(),
+                        **kwargs,
+                    )
+                    in_flight.append((pending, controller.next_sequence(), future))
+
+                if in_flight:
+                    (pending, sequence, future) = in_flight.popleft()
+                    try:
+                        future.result()
+                        self._record_success(controller)
+                    except grpc.RpcError as e:
+                        self._record_rpc_error(controller, pending, sequence, e, logger)
+                    finally:
+                        self._invalidate(pending)
+                    self._update_elapsed()
+                    continue
+
+                delay = self._next_retry_delay(time.monotonic())
+                if delay is None:
+                    break
+                time.sleep(delay)
+        except BaseException:
+            # Don't leave writes running in the background if the load is interrupted.
+            for (pending, _, future) in in_flight:
+                future.cancel()
+                self._invalidate(pending)
+            raise
+
+        return self._finish()
@@ -1,8 +1,12 @@
 import logging
-from typing import Union, Optional
+from typing import Iterable, Union, Optional
+
+import numpy as np
 
 from aerospike_vector_search.client import Client, types
 from .shared import helpers
+from .shared.client_helpers import DEFAULT_MAX_IN_FLIGHT
+from .search_plan import SearchPlan
 
 logger = logging.getLogger(__name__)
 
@@ -98,7 +102,9 @@ class Index():
             include_fields: Optional[list[str]] = None,
             exclude_fields: Optional[list[str]] = None,
             timeout: Optional[int] = None,
-        ) -> list[types.Neighbor]:
+            result_format: Union[types.SearchResultFormat, str] = types.SearchResultFormat.NEIGHBORS,
+            vector_format: Union[types.VectorFormat, str] = types.VectorFormat.LIST,
+        ) -> Union[list[types.Neighbor], types.SearchResult]:
         """
         Perform a vector search against this index.
         By default, the search results include all fields except the vector field.
@@ -131,10 +137,22 @@ class Index():
         :param timeout: Time in seconds this operation will wait before raising an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
         :type timeout: int
 
+        :param result_format: How the results are returned. :attr:`SearchResultFormat.NEIGHBORS <aerospike_vector_search.types.SearchResultFormat.NEIGHBORS>` returns Neighbor objects,
+            :attr:`SearchResultFormat.LAZY_NEIGHBORS <aerospike_vector_search.types.SearchResultFormat.LAZY_NEIGHBORS>` returns Neighbor objects that decode their key and fields on first access,
+            :attr:`SearchResultFormat.ARRAYS <aerospike_vector_search.types.SearchResultFormat.ARRAYS>` returns a columnar :class:`SearchResult <aerospike_vector_search.types.SearchResult>`.
+            The strings "neighbors", "lazy_neighbors" and "arrays" are also accepted. Defaults to SearchResultFormat.NEIGHBORS.
+        :type result_format: Union[types.SearchResultFormat, str]
+
+        :param vector_format: How vector fields of Neighbor results are returned. :attr:`VectorFormat.LIST <aerospike_vector_search.types.VectorFormat.LIST>` returns lists of Python floats or bools,
+            :attr:`VectorFormat.NUMPY <aerospike_vector_search.types.VectorFormat.NUMPY>` returns 1-D float32 or bool NumPy arrays decoded without a Python object per element.
+            The strings "list" and "numpy" are also accepted. Defaults to VectorFormat.LIST.
+        :type vector_format: Union[types.VectorFormat, str]
+
         Returns:
-            list[types.Neighbor]: A list of neighbors records found by the search.
+            Union[list[types.Neighbor], types.SearchResult]: The neighbor records found by the search, in the requested result_format.
 
         Raises:
+            AVSClientError: Raised if result_format is not a valid SearchResultFormat or vector_format is not a valid VectorFormat.
             AVSServerError: Raised if an error occurs during the RPC communication with the server while attempting to vector search.
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
         """
@@ -154,8 +172,159 @@ class Index():
             include_fields=include_fields,
             exclude_fields=exclusions,
             timeout=timeout,
+            result_format=result_format,
+            vector_format=vector_format,
         )
     
+    def vector_search_many(
+            self,
+            *,
+            queries: Union[np.ndarray, Iterable[Union[list[Union[bool, float]], np.ndarray]]],
+            limit: int = 10,
+            search_params: Optional[types.HnswSearchParams] = None,
+            include_fields: Optional[list[str]] = None,
+            exclude_fields: Optional[list[str]] = None,
+            timeout: Optional[int] = None,
+            max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+            result_format: Union[types.SearchResultFormat, str] = types.SearchResultFormat.NEIGHBORS,
+            vector_format: Union[types.VectorFormat, str] = types.VectorFormat.LIST,
+        ) -> Union[list[list[types.Neighbor]], list[types.SearchResult]]:
+        """
+        Perform many vector searches against this index concurrently.
+        By default, the search results include all fields except the vector field.
+        To include the vector field, add it to the include_fields list.
+
+        :param queries: The query vectors for the searches, for example a 2-dimensional array of shape (n, dimensions).
+        :type queries: Union[np.ndarray, Iterable[Union[list[Union[bool, float]], np.ndarray]]]
+
+        :param limit: The maximum number of neighbors to return for each query. K value. Defaults to 10.
+        :type limit: int
+
+        :param search_params: Parameters for the HNSW algorithm.
+            If None, the default parameters for the index are used. Defaults to None.
+        :type search_params: Optional[types_pb2.HnswSearchParams]
+
+        :param include_fields: A list of field names to retrieve from the results.
+            When used, fields that are not included are not sent by the server,
+            saving on network traffic.
+            If a field is listed in both include_fields and exclude_fields,
+            exclude_fields takes priority, and the field is not returned.
+            If None, all fields are retrieved. Defaults to None.
+        :type include_fields: Optional[list[str]]
+
+        :param exclude_fields: A list of field names to exclude from the results.
+            When used, the excluded fields are not sent by the server,
+            saving on network traffic.
+            If None, all fields are retrieved. Defaults to None.
+        :type exclude_fields: Optional[list[str]]
+
+        :param timeout: Time in seconds each search will wait before raising an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
+        :type timeout: int
+
+        :param max_in_flight: The maximum number of searches in flight at once. Defaults to 64.
+        :type max_in_flight: int
+
+        :param result_format: How the results are returned. :attr:`SearchResultFormat.NEIGHBORS <aerospike_vector_search.types.SearchResultFormat.NEIGHBORS>` returns Neighbor objects,
+            :attr:`SearchResultFormat.LAZY_NEIGHBORS <aerospike_vector_search.types.SearchResultFormat.LAZY_NEIGHBORS>` returns Neighbor objects that decode their key and fields on first access,
+            :attr:`SearchResultFormat.ARRAYS <aerospike_vector_search.types.SearchResultFormat.ARRAYS>` returns a columnar :class:`SearchResult <aerospike_vector_search.types.SearchResult>`.
+            The strings "neighbors", "lazy_neighbors" and "arrays" are also accepted. Defaults to SearchResultFormat.NEIGHBORS.
+        :type result_format: Union[types.SearchResultFormat, str]
+
+        :param vector_format: How vector fields of Neighbor results are returned. :attr:`VectorFormat.LIST <aerospike_vector_search.types.VectorFormat.LIST>` returns lists of Python floats or bools,
+            :attr:`VectorFormat.NUMPY <aerospike_vector_search.types.VectorFormat.NUMPY>` returns 1-D float32 or bool NumPy arrays decoded without a Python object per element.
+            The strings "list" and "numpy" are also accepted. Defaults to VectorFormat.LIST.
+        :type vector_format: Union[types.VectorFormat, str]
+
+        Returns:
+            Union[list[list[types.Neighbor]], list[types.SearchResult]]: The neighbors found for each query, in the same order as queries.
+
+        Raises:
+            AVSClientError: Raised if max_in_flight is less than 1, queries is not 2-dimensional, result_format is not a valid SearchResultFormat or vector_format is not a valid VectorFormat.
+            AVSServerError: Raised if an error occurs during the RPC communication with the server while attempting to vector search.
+            This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
+        """
+
+        exclusions = helpers._get_index_exclusions(
+            self._vector_field,
+            include_fields,
+            exclude_fields
+        )
+
+        return self._client.vector_search_many(
+            namespace=self._namespace,
+            index_name=self._name,
+            queries=queries,
+            limit=limit,
+            search_params=search_params,
+            include_fields=include_fields,
+            exclude_fields=exclusions,
+            timeout=timeout,
+            max_in_flight=max_in_flight,
+            result_format=result_format,
+            vector_format=vector_format,
+        )
+
+    def prepare_search(
+            self,
+            *,
+            limit: int = 10,
+            search_params: Optional[types.HnswSearchParams] = None,
+            include_fields: Optional[list[str]] = None,
+            exclude_fields: Optional[list[str]] = None,
+            result_format: Union[types.SearchResultFormat, str] = types.SearchResultFormat.NEIGHBORS,
+            vector_format: Union[types.VectorFormat, str] = types.VectorFormat.LIST,
+        ) -> SearchPlan:
+        """
+        Prepare a reusable vector search against this index in which only the query changes between calls.
+        As with :meth:`vector_search`, the results include all fields except the vector field by default.
+
+        :param limit: The maximum number of neighbors to return. K value. Defaults to 10.
+        :type limit: int
+
+        :param search_params: Parameters for the HNSW algorithm.
+            If None, the default parameters for the index are used. Defaults to None.
+        :type search_params: Optional[types_pb2.HnswSearchParams]
+
+        :param include_fields: A list of field names to retrieve from the results.
+            If a field is listed in both include_fields and exclude_fields,
+            exclude_fields takes priority, and the field is not returned.
+            If None, all fields are retrieved. Defaults to None.
+        :type include_fields: Optional[list[str]]
+
+        :param exclude_fields: A list of field names to exclude from the results.
+            If None, all fields are retrieved. Defaults to None.
+        :type exclude_fields: Optional[list[str]]
+
+        :param result_format: How the results are returned, as in :meth:`vector_search`. Defaults to SearchResultFormat.NEIGHBORS.
+        :type result_format: Union[types.SearchResultFormat, str]
+
+        :param vector_format: How vector fields of Neighbor results are returned. Defaults to VectorFormat.LIST.
+        :type vector_format: Union[types.VectorFormat, str]
+
+        Returns:
+            SearchPlan: A plan whose vector_search method runs the search for a query.
+
+        Raises:
+            AVSClientError: Raised if result_format is not a valid SearchResultFormat or vector_format is not a valid VectorFormat.
+        """
+
+        exclusions = helpers._get_index_exclusions(
+            self._vector_field,
+            include_fields,
+            exclude_fields
+        )
+
+        return self._client.prepare_search(
+            namespace=self._namespace,
+            index_name=self._name,
+            limit=limit,
+            search_params=search_params,
+            include_fields=include_fields,
+            exclude_fields=exclusions,
+            result_format=result_format,
+            vector_format=vector_format,
+        )
+
     def vector_search_by_key(
             self,
             *,
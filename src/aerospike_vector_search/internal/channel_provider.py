@@ -2,7 +2,7 @@ import re
 import time
 import logging
 import threading
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import google.protobuf.empty_pb2
 import grpc
@@ -11,13 +11,25 @@ from .. import types
 from ..shared.proto_generated import vector_db_pb2
 from ..shared.proto_generated import vector_db_pb2_grpc
 from ..shared import base_channel_provider
+from ..shared.base_channel_provider import (
+    CONNECTION_ATTEMPT_DELAY,
+    ENDPOINT_RACE_TIMEOUT,
+    TEND_MIN_INTERVAL,
+    ChannelAndEndpoints,
+)
+from ..shared.load_balancing import NodeStats, NodeStatsInterceptor
 from ..shared.token_manager import TokenManager
 
 empty = google.protobuf.empty_pb2.Empty()
 
 logger = logging.getLogger(__name__)
 
-TEND_INTERVAL: int = 1
+TEND_INTERVAL: float = 1.0
+# Fraction of TEND_INTERVAL by which each wait between tends is randomly
+# shortened or lengthened.
+TEND_JITTER: float = 0.1
+# Deadline, in seconds, for each RPC made while tending.
+TEND_CALL_TIMEOUT: float = 1.0
 
 
 class ChannelProvider(base_channel_provider.BaseChannelProvider):
@@ -35,6 +47,11 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
         private_key: Optional[str] = None,
         service_config_path: Optional[str] = None,
         ssl_target_name_override: Optional[str] = None,
+        load_balancing_policy: Union[types.LoadBalancingPolicy, str] = types.LoadBalancingPolicy.LEAST_OUTSTANDING,
+        channels_per_node: int = 1,
+        tend_interval: float = TEND_INTERVAL,
+        tend_jitter: float = TEND_JITTER,
+        channel_options: Optional[types.ChannelOptions] = None,
     ) -> None:
         super().__init__(
             seeds,
@@ -47,82 +64,263 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
             private_key,
             service_config_path,
             ssl_target_name_override,
+            load_balancing_policy,
+            channels_per_node,
+            tend_interval,
+            tend_jitter,
+            channel_options,
         )
         # When set, client has concluded cluster tending
         self._tend_ended = threading.Event()
 
+        # When set, the tend thread stops waiting and tends now, or exits if closed
+        self._tend_wakeup = threading.Event()
+
         # initializes authentication tending
         self._tend_token()
 
         # verfies server is minimally compatible with client
         self._check_server_version()
 
-        # initializes cluster tending
-        self._tend_cluster()
+        # initializes cluster tending, then keeps one thread tending until close
+        if self._tend_cluster():
+            self._tend_thread = threading.Thread(
+                target=self._tend_loop, name="avs-tend", daemon=True
+            )
+            self._tend_thread.start()
 
-    def _tend_cluster(self):
+    def _tend_loop(self):
+        last_tend = time.monotonic()
+        try:
+            while True:
+                self._wait_for_next_tend(last_tend)
+                last_tend = time.monotonic()
+                if not self._tend_cluster():
+                    return
+        finally:
+            self._tend_ended.set()
+
+    def _wait_for_next_tend(self, last_tend: float):
+        if self._tend_wakeup.wait(self._next_tend_delay()):
+            # Woken by close or by a call that failed with UNAVAILABLE.
+            # Wakeups arriving until the clear below are served by the same tend.
+            if not self._closed:
+                remaining = last_tend + TEND_MIN_INTERVAL - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+            self._tend_wakeup.clear()
+
+    def _request_tend(self):
+        self._tend_wakeup.set()
+
+    def _tend_cluster(self) -> bool:
+        # Runs one tend cycle. Returns False once tending has ended.
         try:
             (channels, end_tend_cluster) = self.init_tend_cluster()
 
             if end_tend_cluster:
                 self._tend_ended.set()
-                return
+                return False
 
-            (cluster_info_stubs, new_cluster_ids) = (
+            # The RPCs for every channel are started before any is waited on,
+            # so a slow or unreachable node costs at most TEND_CALL_TIMEOUT
+            # instead of stalling the calls queued behind it.
+            (cluster_info_stubs, futures) = (
                 self._gather_new_cluster_ids_and_cluster_info_stubs(channels)
             )
 
+            new_cluster_ids = self._wait_for_tend_calls(futures, "get cluster id")
+
             update_endpoints_stubs = self._gather_stubs_for_endpoint_updating(
                 new_cluster_ids, cluster_info_stubs
             )
 
-            cluster_endpoints_list = self._gather_temp_endpoints(
+            futures = self._gather_temp_endpoints(
                 new_cluster_ids, update_endpoints_stubs
             )
 
+            cluster_endpoints_list = [
+                response.endpoints if response else None
+                for response in self._wait_for_tend_calls(
+                    futures, "get cluster endpoints"
+                )
+            ]
+
             temp_endpoints = self._assign_temporary_endpoints(cluster_endpoints_list)
 
-            if update_endpoints_stubs:
+            if update_endpoints_stubs and temp_endpoints:
+
+                connected = self._connect_nodes(self._nodes_to_connect(temp_endpoints))
+
+                self._add_new_channels_from_temp_endpoints(temp_endpoints, connected)
 
-                self._add_new_channels_from_temp_endpoints(temp_endpoints)
+                self._retire_old_channels_from_node_channels(temp_endpoints)
 
-                self._close_old_channels_from_node_channels(temp_endpoints)
+            self._fill_channel_pools()
 
-            threading.Timer(TEND_INTERVAL, self._tend_cluster).start()
+            self._park_seed_channels()
+
+            self._close_drained_channels()
+
+            return True
 
         except Exception as e:
             logger.error("Tending failed at unindentified location: %s", e)
             raise e
 
-    def _call_get_cluster_id(self, stub):
+    def _call_get_cluster_id(self, stub) -> Optional[grpc.Future]:
         try:
-            return stub.GetClusterId(
+            return stub.GetClusterId.future(
                 empty,
                 credentials=self._token_manager.get_token_credentials(),
+                timeout=TEND_CALL_TIMEOUT,
             )
         except Exception as e:
             logger.debug(
                 "While tending, failed to get cluster id with error: " + str(e)
             )
 
-    def _call_get_cluster_endpoints(self, stub) -> vector_db_pb2.ServerEndpointList:
+    def _call_get_cluster_endpoints(self, stub) -> Optional[grpc.Future]:
         try:
-            return (
-                stub.GetClusterEndpoints(
-                    vector_db_pb2.ClusterNodeEndpointsRequest(
-                        listenerName=self.listener_name
-                    ),
-                    credentials=self._token_manager.get_token_credentials(),
-                )
-            ).endpoints
+            return stub.GetClusterEndpoints.future(
+                vector_db_pb2.ClusterNodeEndpointsRequest(
+                    listenerName=self.listener_name
+                ),
+                credentials=self._token_manager.get_token_credentials(),
+                timeout=TEND_CALL_TIMEOUT,
+            )
         except Exception as e:
             logger.debug(
                 "While tending, failed to get cluster endpoints with error: " + str(e)
             )
 
+    def _wait_for_tend_calls(self, futures: list[Optional[grpc.Future]], action: str) -> list:
+        # A failed call yields None, like a node that did not answer.
+        responses = []
+        for future in futures:
+            response = None
+            if future is not None:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    logger.debug(
+                        "While tending, failed to " + action + " with error: " + str(e)
+                    )
+            responses.append(response)
+        return responses
+
+    def _connect_nodes(
+        self, nodes: dict[int, vector_db_pb2.ServerEndpointList]
+    ) -> dict[int, Optional[ChannelAndEndpoints]]:
+        # Races the endpoints of all nodes at once. Attempt i of every node
+        # starts i * CONNECTION_ATTEMPT_DELAY after the first, and a node's
+        # first channel to become ready wins.
+        connected = {}
+        races = {}
+        for node, endpoints in nodes.items():
+            stats = NodeStats()
+            attempts = list(self._create_endpoint_channels(endpoints, stats))
+            if attempts:
+                races[node] = (endpoints, stats, attempts)
+            else:
+                connected[node] = None
+
+        if not races:
+            return connected
+
+        woken = threading.Event()
+        winners: dict[int, int] = {}
+        futures = []
+
+        def on_ready(future, node, index):
+            if not future.cancelled():
+                winners.setdefault(node, index)
+                woken.set()
+
+        started = time.monotonic()
+        deadline = started + ENDPOINT_RACE_TIMEOUT
+        most_attempts = max(len(attempts) for (_, _, attempts) in races.values())
+        index = 0
+        while len(winners) < len(races):
+            for node, (_, _, attempts) in races.items():
+                if index < len(attempts) and node not in winners:
+                    future = grpc.channel_ready_future(attempts[index][1])
+                    future.add_done_callback(
+                        lambda f, node=node, index=index: on_ready(f, node, index)
+                    )
+                    futures.append(future)
+            index += 1
+
+            next_attempt = deadline
+            if index < most_attempts:
+                next_attempt = min(started + index * CONNECTION_ATTEMPT_DELAY, deadline)
+            while len(winners) < len(races) and time.monotonic() < next_attempt:
+                woken.wait(next_attempt - time.monotonic())
+                woken.clear()
+            if time.monotonic() >= deadline:
+                break
+
+        for future in futures:
+            future.cancel()
+
+        for node, (endpoints, stats, attempts) in races.items():
+            winner = winners.get(node)
+            for i, (_, channel) in enumerate(attempts):
+                if i != winner:
+                    channel.close()
+            if winner is None:
+                logger.debug("While tending, no endpoint of node %s became ready", node)
+                connected[node] = None
+            else:
+                connected[node] = self._create_channel_and_endpoints(
+                    endpoints, stats, attempts[winner]
+                )
+
+        return connected
+
+    def _fill_channel_pools(self) -> None:
+        # Connects the channels missing from each node's pool. A channel joins
+        # the node's rotation once it is ready. One that is not ready within
+        # ENDPOINT_RACE_TIMEOUT is closed, and the next tend tries again.
+        attempts = [
+            (channel_endpoints, channel)
+            for channel_endpoints in self._node_channels.values()
+            for channel in channel_endpoints.create_pool_channels()
+        ]
+        if not attempts:
+            return
+
+        all_ready = threading.Event()
+        ready = set()
+        futures = []
+
+        def on_ready(future, index):
+            if not future.cancelled():
+                ready.add(index)
+                if len(ready) == len(attempts):
+                    all_ready.set()
+
+        for index, (_, channel) in enumerate(attempts):
+            future = grpc.channel_ready_future(channel)
+            future.add_done_callback(lambda f, index=index: on_ready(f, index))
+            futures.append(future)
+
+        all_ready.wait(ENDPOINT_RACE_TIMEOUT)
+
+        for future in futures:
+            future.cancel()
+
+        for index, (channel_endpoints, channel) in enumerate(attempts):
+            if index in ready:
+                channel_endpoints.add_channel(channel)
+            else:
+                logger.debug("While tending, a pooled channel did not become ready")
+                channel.close()
+
     def _call_close_on_channel(self, channel_endpoints):
         try:
-            channel_endpoints.channel.close()
+            for channel in channel_endpoints.channels:
+                channel.close()
         except Exception as e:
             logger.debug("While tending, failed to close GRPC channel: " + str(e))
 
@@ -131,14 +329,12 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
         if not self._token_manager.has_credentials():
             return
 
-        # Get the auth stub for token refresh
-        auth_stub = self._get_auth_stub()
-        
-        # Refresh the token initially - TokenManager will handle scheduling future refreshes
-        self._token_manager.refresh_token(auth_stub)
+        # Refresh the token initially - TokenManager will handle scheduling future refreshes.
+        # It looks up the auth stub on each refresh, since seed channels are closed once the cluster is known.
+        self._token_manager.refresh_token(self._get_auth_stub)
 
     def _check_server_version(self):
-        stub = vector_db_pb2_grpc.AboutServiceStub(self.get_channel())
+        stub = self.get_stub(vector_db_pb2_grpc.AboutServiceStub)
         about_request = vector_db_pb2.AboutRequest()
 
         try:
@@ -149,10 +345,28 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
             raise types.AVSServerError(rpc_error=e)
         self.verify_compatible_server()
 
-    def _create_channel(self, host: str, port: int) -> grpc.Channel:
+    def _create_node_channel(self, host: str, port: int, stats: NodeStats) -> grpc.Channel:
+        return grpc.intercept_channel(
+            self._create_channel(host, port, self._node_channel_options()),
+            NodeStatsInterceptor(stats, self._on_node_unavailable),
+        )
+
+    def _create_channel(
+        self,
+        host: str,
+        port: int,
+        extra_options: Optional[list[tuple[str, Any]]] = None,
+    ) -> grpc.Channel:
         host = re.sub(r"%.*", "", host)
+        if ":" in host and not host.startswith("["):
+            # IPv6 literal
+            host = f"[{host}]"
+
+        kwargs = {}
+        if self._compression:
+            kwargs["compression"] = self._compression
 
-        options = []
+        options = self._channel_args + (list(extra_options) if extra_options else [])
 
         if self.ssl_target_name_override:
             options.append(
@@ -174,22 +388,35 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
             )
 
             return grpc.secure_channel(
-                f"{host}:{port}", ssl_credentials, options=options
+                f"{host}:{port}",
+                ssl_credentials,
+                options=options,
+                **kwargs,
             )
 
         else:
-            return grpc.insecure_channel(f"{host}:{port}", options=options)
+            return grpc.insecure_channel(f"{host}:{port}", options=options, **kwargs)
 
     def close(self):
         self._closed = True
+        # wakes the tend thread so it exits without finishing its wait
+        self._tend_wakeup.set()
         self._tend_ended.wait()
 
         for channel in self._seedChannels:
             channel.close()
 
         for k, channelEndpoints in self._node_channels.items():
-            if channelEndpoints.channel:
-                channelEndpoints.channel.close()
-                
+            for channel in channelEndpoints.channels:
+                if channel:
+                    channel.close()
+
+        for channelEndpoints, _ in self._retiring_channels:
+            for channel in channelEndpoints.channels:
+                if channel:
+                    channel.close()
+
+        self._channel_stubs.clear()
+
         # Cancel token refresh
         self._token_manager.cancel_refresh()
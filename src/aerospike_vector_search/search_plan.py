@@ -0,0 +1,89 @@
+import logging
+from typing import Optional, Union
+
+import grpc
+import numpy as np
+
+from . import types
+from .shared.search_plan import BaseSearchPlan
+
+logger = logging.getLogger(__name__)
+
+
+class SearchPlan(BaseSearchPlan):
+    """
+    A reusable vector search against one index, with every option except the query fixed.
+
+    The index, limit, search parameters and projection are serialized once when the plan is created.
+    Each search only encodes the query vector, so repeated searches skip most of the request construction.
+
+    You should create a SearchPlan by calling :meth:`aerospike_vector_search.Client.prepare_search`
+    or :meth:`aerospike_vector_search.Index.prepare_search`.
+
+    .. code-block:: python
+
+        plan = client.prepare_search(
+            namespace="test",
+            index_name="test_index",
+            limit=5,
+            include_fields=["title"],
+        )
+
+        for query in queries:
+            results = plan.vector_search(query=query)
+    """
+
+    def vector_search(
+        self,
+        *,
+        query: Union[list[Union[bool, float]], np.ndarray],
+        timeout: Optional[int] = None,
+    ) -> Union[list[types.Neighbor], types.SearchResult]:
+        """
+        Perform a Hierarchical Navigable Small World (HNSW) vector search with this plan.
+
+        :param query: The query vector for the search.
+        :type query: Union[list[Union[bool, float]], np.ndarray]
+
+        :param timeout: Time in seconds this operation will wait before raising an :class:`AVSServerError <aerospike_vector_search.types.AVSServerError>`. Defaults to None.
+        :type timeout: Optional[int]
+
+        Returns:
+            Union[list[types.Neighbor], types.SearchResult]: The neighbor records found by the search, in the plan's result_format.
+
+        Raises:
+            AVSClientErrorClosed: Raised if the client has been closed.
+            AVSServerError: Raised if an error occurs during the RPC communication with the server while attempting to vector search.
+            This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
+        """
+        self._check_open()
+        client = self._client
+
+        if client._search_cache is not None:
+            (cache_key, generation, results) = self._cache_lookup(query)
+            if results is not None:
+                return results
+
+        kwargs = {}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        request = self._request(query)
+
+        try:
+            results = client._respond_neighbors(
+                self._get_stub().VectorSearch(
+                    request,
+                    credentials=client._channel_provider.get_token(),
+                    **kwargs,
+                ),
+                self._result_format,
+                self._vector_format,
+            )
+        except grpc.RpcError as e:
+            logger.error("Failed to vector search with error: %s", e)
+            raise types.AVSServerError(rpc_error=e)
+
+        if client._search_cache is not None:
+            client._search_cache.store(cache_key, generation, results)
+        return results
@@ -366,12 +366,10 @@ class BaseClient(object):
 
 
     def _get_index_stub(self) -> index_pb2_grpc.IndexServiceStub:
-        return index_pb2_grpc.IndexServiceStub(self._channel_provider.get_channel())
+        return self._channel_provider.get_stub(index_pb2_grpc.IndexServiceStub)
 
     def _get_user_admin_stub(self) -> user_admin_pb2_grpc.UserAdminServiceStub:
-        return user_admin_pb2_grpc.UserAdminServiceStub(
-            self._channel_provider.get_channel()
-        )
+        return self._channel_provider.get_stub(user_admin_pb2_grpc.UserAdminServiceStub)
 
     def _get_index_id(self, namespace, name) -> types_pb2.IndexId:
         return types_pb2.IndexId(namespace=namespace, name=name)
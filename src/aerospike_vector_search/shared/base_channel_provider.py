@@ -1,12 +1,16 @@
+import itertools
 import logging
 import random
+import threading
+import time
 from logging import Logger
-from typing import Optional, Union, Tuple
+from typing import Any, Callable, Iterator, Optional, Union, Tuple, Type, TypeVar
 
 import grpc
 import jwt
 
 from . import helpers
+from .load_balancing import NodeStats, create_balancing_policy
 from .proto_generated import auth_pb2_grpc
 from .proto_generated import vector_db_pb2, auth_pb2, types_pb2
 from .proto_generated import vector_db_pb2_grpc
@@ -15,15 +19,107 @@ from .token_manager import TokenManager
 
 logger = logging.getLogger(__name__)
 
+StubT = TypeVar("StubT")
+
+# Shortest time, in seconds, between the starts of two tends. Bounds how often
+# a burst of UNAVAILABLE calls can wake the tender early.
+TEND_MIN_INTERVAL: float = 0.1
+
+# Tending only calls this service. Its calls failing with UNAVAILABLE must not
+# wake the tender, or a node that is down would keep it tending.
+_TEND_METHOD_PREFIX = "/aerospike.vector.ClusterInfoService/"
+
+# Longest time, in seconds, a retired node channel is kept open for the calls
+# already running on it to finish.
+CHANNEL_DRAIN_TIMEOUT: float = 10.0
+
+# Tending connects a new node before get_channel can return it. The node's
+# endpoints are raced, happy eyeballs style (RFC 8305): the next endpoint is
+# tried every CONNECTION_ATTEMPT_DELAY seconds until one is ready. A node none
+# of whose endpoints is ready within ENDPOINT_RACE_TIMEOUT seconds is not
+# added, and the next tend tries it again.
+CONNECTION_ATTEMPT_DELAY: float = 0.25
+ENDPOINT_RACE_TIMEOUT: float = 2.0
+
+
+def _grpc_channel_args(options: Optional[types.ChannelOptions]) -> list[tuple[str, Any]]:
+    if options is None:
+        return []
+
+    args = []
+    if options.keepalive_time is not None:
+        args.append(("grpc.keepalive_time_ms", int(options.keepalive_time * 1000)))
+    if options.keepalive_timeout is not None:
+        args.append(("grpc.keepalive_timeout_ms", int(options.keepalive_timeout * 1000)))
+    if options.keepalive_permit_without_calls is not None:
+        args.append(
+            ("grpc.keepalive_permit_without_calls", int(options.keepalive_permit_without_calls))
+        )
+    if options.initial_window_size is not None:
+        # The initial stream flow control window
+        args.append(("grpc.http2.lookahead_bytes", options.initial_window_size))
+    if options.bdp_probe is not None:
+        args.append(("grpc.http2.bdp_probe", int(options.bdp_probe)))
+    if options.max_send_message_length is not None:
+        args.append(("grpc.max_send_message_length", options.max_send_message_length))
+    if options.max_receive_message_length is not None:
+        args.append(("grpc.max_receive_message_length", options.max_receive_message_length))
+    return args
+
 
 class ChannelAndEndpoints(object):
+    """
+    The channels open to one cluster node.
+
+    channel is used for tending. Requests are spread round robin over
+    channels, a pool of up to pool_size channels of which channel is the
+    first. Tending creates the others with create_pool_channels and adds each
+    with add_channel once it is ready, so no request waits for a connection.
+    """
+
     def __init__(
         self,
         channel: Union[grpc.Channel, grpc.aio.Channel],
         endpoints: vector_db_pb2.ServerEndpointList,
+        stats: Optional[NodeStats] = None,
+        pool_size: int = 1,
+        create_channel: Optional[Callable[[], Union[grpc.Channel, grpc.aio.Channel]]] = None,
     ) -> None:
         self.channel = channel
         self.endpoints = endpoints
+        self.stats = stats if stats is not None else NodeStats()
+        self.channels: list[Union[grpc.Channel, grpc.aio.Channel]] = [channel]
+        self._pool_size = pool_size if create_channel else 1
+        self._create_channel = create_channel
+        self._counter = itertools.count()
+
+    def next_channel(self) -> Union[grpc.Channel, grpc.aio.Channel]:
+        channels = self.channels
+        if len(channels) == 1:
+            return self.channel
+        return channels[next(self._counter) % len(channels)]
+
+    def create_pool_channels(self) -> list[Union[grpc.Channel, grpc.aio.Channel]]:
+        # Creates the channels missing from the pool. They are not used
+        # until they are passed to add_channel.
+        created = []
+        if not self.channel:
+            return created
+        for _ in range(self._pool_size - len(self.channels)):
+            try:
+                channel = self._create_channel()
+            except Exception as e:
+                logger.debug("failure creating channel: " + str(e))
+                break
+            if not channel:
+                break
+            created.append(channel)
+        return created
+
+    def add_channel(self, channel: Union[grpc.Channel, grpc.aio.Channel]) -> None:
+        # Replaces the list instead of appending to it, so next_channel
+        # never sees a pool that is being changed.
+        self.channels = self.channels + [channel]
 
 
 class BaseChannelProvider(object):
@@ -41,10 +137,26 @@ class BaseChannelProvider(object):
         private_key: Optional[str] = None,
         service_config_path: Optional[str] = None,
         ssl_target_name_override: Optional[str] = None,
+        load_balancing_policy: Union[types.LoadBalancingPolicy, str] = types.LoadBalancingPolicy.LEAST_OUTSTANDING,
+        channels_per_node: int = 1,
+        tend_interval: float = 1.0,
+        tend_jitter: float = 0.1,
+        channel_options: Optional[types.ChannelOptions] = None,
     ) -> None:
+        if channels_per_node < 1:
+            raise types.AVSClientError(message="channels_per_node must be at least 1")
+        if tend_interval <= 0:
+            raise types.AVSClientError(message="tend_interval must be greater than 0")
+        if not 0 <= tend_jitter < 1:
+            raise types.AVSClientError(message="tend_jitter must be at least 0 and less than 1")
+
         self.seeds: tuple[types.HostPort, ...] = seeds
         self.listener_name: Optional[str] = listener_name
         self._is_loadbalancer: Optional[bool] = is_loadbalancer
+        self._balancing_policy = create_balancing_policy(load_balancing_policy)
+        self._channels_per_node: int = channels_per_node
+        self._tend_interval: float = tend_interval
+        self._tend_jitter: float = tend_jitter
 
         if service_config_path:
             with open(service_config_path, "rb") as f:
@@ -54,6 +166,14 @@ class BaseChannelProvider(object):
 
         self.ssl_target_name_override = ssl_target_name_override
 
+        # Passed to every seed and node channel
+        self._channel_args: list[tuple[str, Any]] = _grpc_channel_args(channel_options)
+        self._compression: Optional[grpc.Compression] = (
+            grpc.Compression.Gzip
+            if channel_options is not None and channel_options.gzip_compression
+            else None
+        )
+
         # Initialize the token manager
         self._token_manager = TokenManager(username, password)
         
@@ -63,6 +183,14 @@ class BaseChannelProvider(object):
         self._ttl_threshold = 0.9
         # dict of Node Number and ChannelAndEndponts object
         self._node_channels: dict[int, ChannelAndEndpoints] = {}
+        # Node channels that no longer get new calls, with the time by which
+        # they are closed even if calls are still running on them
+        self._retiring_channels: list[tuple[ChannelAndEndpoints, float]] = []
+        # dict of channel and the service stubs created for it, see get_stub
+        self._channel_stubs: dict[Union[grpc.Channel, grpc.aio.Channel], dict[type, Any]] = {}
+        # Seed channels are only needed to find the cluster, see _park_seed_channels
+        self._seed_lock = threading.Lock()
+        self._seeds_idle_since: float = 0.0
         self._seedChannels: Union[list[grpc.Channel], list[grpc.Channel.aio]] = [
             self._create_channel_from_host_port(seed) for seed in self.seeds
         ]
@@ -76,7 +204,7 @@ class BaseChannelProvider(object):
         return self._token_manager.get_token_credentials()
 
     def _prepare_about(self) -> Tuple[vector_db_pb2_grpc.AboutServiceStub, vector_db_pb2.AboutRequest]:
-        stub = vector_db_pb2_grpc.AboutServiceStub(self.get_channel())
+        stub = self.get_stub(vector_db_pb2_grpc.AboutServiceStub)
         about_request = vector_db_pb2.AboutRequest()
         return (stub, about_request)
 
@@ -86,38 +214,220 @@ class BaseChannelProvider(object):
                 self._node_channels.values()
             )
             if len(discovered_channels) <= 0:
-                return self._seedChannels[0]
+                return self._seed_channels()[0]
 
-            # Return a random channel.
-            channel = random.choice(discovered_channels).channel
+            channel = self._choose_node(discovered_channels).next_channel()
             if channel:
                 return channel
 
-        return self._seedChannels[0]
+        return self._seed_channels()[0]
+
+    def _seed_channels(self) -> Union[list[grpc.Channel], list[grpc.aio.Channel]]:
+        seeds = self._seedChannels
+        if seeds:
+            return seeds
+
+        # Parked, reopen them
+        with self._seed_lock:
+            if not self._seedChannels:
+                self._seedChannels = [
+                    self._create_channel_from_host_port(seed) for seed in self.seeds
+                ]
+            return self._seedChannels
+
+    def _needs_seed_channels(self) -> bool:
+        # Seeds are only needed until a node is known, and again once no
+        # known node is reachable.
+        if self._is_loadbalancer:
+            return True
+        return not any(
+            node.channel and node.stats.available()
+            for node in self._node_channels.values()
+        )
+
+    def _park_seed_channels(self) -> None:
+        # Called after every tend. Seed channels that have not been needed
+        # for CHANNEL_DRAIN_TIMEOUT are closed, so calls made on them before
+        # the nodes were known have had time to finish.
+        if not self._seedChannels or self._needs_seed_channels():
+            self._seeds_idle_since = 0.0
+            return
+
+        now = time.monotonic()
+        if not self._seeds_idle_since:
+            self._seeds_idle_since = now
+            return
+        if now - self._seeds_idle_since < CHANNEL_DRAIN_TIMEOUT:
+            return
+
+        with self._seed_lock:
+            seeds = self._seedChannels
+            self._seedChannels = []
+        self._seeds_idle_since = 0.0
+
+        # Closed by the next _close_drained_channels
+        for channel in seeds:
+            self._retiring_channels.append((ChannelAndEndpoints(channel, None), now))
+
+    @staticmethod
+    def _available_nodes(nodes: list[ChannelAndEndpoints]) -> list[ChannelAndEndpoints]:
+        available = [node for node in nodes if node.stats.available()]
+        # Ejecting every node would leave nothing to send to, so ignore ejection then.
+        return available or nodes
+
+    def _choose_node(self, nodes: list[ChannelAndEndpoints]) -> ChannelAndEndpoints:
+        # A node on probation takes one call at a time. When another caller
+        # has already reserved that call, the node is skipped.
+        candidates = self._available_nodes(nodes)
+        while candidates:
+            node = self._balancing_policy.choose(candidates)
+            if node.stats.reserve():
+                return node
+            candidates = [c for c in candidates if c is not node]
+        return self._balancing_policy.choose(nodes)
+
+    def get_stub(self, stub_class: Type[StubT]) -> StubT:
+        """
+        Returns a stub_class service stub for the channel get_channel picks.
+
+        Stubs are created once per channel and reused until tending closes the channel.
+        """
+        return self._get_channel_stub(self.get_channel(), stub_class)
+
+    def _get_channel_stub(
+        self, channel: Union[grpc.aio.Channel, grpc.Channel], stub_class: Type[StubT]
+    ) -> StubT:
+        # Only dict reads and setdefault, so concurrent callers at worst
+        # build a stub twice and agree on the one that was stored.
+        stubs = self._channel_stubs.get(channel)
+        if stubs is None:
+            stubs = self._channel_stubs.setdefault(channel, {})
+
+        stub = stubs.get(stub_class)
+        if stub is None:
+            stub = stubs.setdefault(stub_class, stub_class(channel))
+        return stub
+
+    def _forget_channel_stubs(self, channel_endpoints: ChannelAndEndpoints) -> None:
+        for channel in channel_endpoints.channels:
+            self._channel_stubs.pop(channel, None)
+
+    def _retire_channel(self, channel_endpoints: ChannelAndEndpoints) -> None:
+        # The caller has already taken the channel out of _node_channels, so
+        # get_channel stops returning it. It is closed by _close_drained_channels.
+        self._retiring_channels.append(
+            (channel_endpoints, time.monotonic() + CHANNEL_DRAIN_TIMEOUT)
+        )
+
+    def _close_drained_channels(self):
+        responses = []
+        retiring = []
+        now = time.monotonic()
+
+        for channel_endpoints, deadline in self._retiring_channels:
+            if channel_endpoints.stats.outstanding > 0 and now < deadline:
+                retiring.append((channel_endpoints, deadline))
+                continue
+
+            self._forget_channel_stubs(channel_endpoints)
+            response = self._call_close_on_channel(channel_endpoints)
+            responses.append(response)
+
+        self._retiring_channels = retiring
+        return responses
 
     def _create_channel_from_host_port(
         self, host: types.HostPort
     ) -> Union[grpc.aio.Channel, grpc.Channel]:
         return self._create_channel(host.host, host.port)
 
-    def _create_channel_from_server_endpoint_list(
-        self, endpoints: vector_db_pb2.ServerEndpointList
-    ) -> Union[grpc.aio.Channel, grpc.Channel]:
-        # TODO: Create channel with all endpoints
-        for endpoint in endpoints.endpoints:
-            if ":" in endpoint.address:
-                # TODO: Ignoring IPv6 for now. Needs fix
-                continue
+    @staticmethod
+    def _order_endpoints(
+        endpoints: vector_db_pb2.ServerEndpointList,
+    ) -> list[vector_db_pb2.ServerEndpoint]:
+        # Alternate address families, starting with the family of the first
+        # advertised endpoint, so an unreachable family costs one attempt delay.
+        ipv6 = [e for e in endpoints.endpoints if ":" in e.address]
+        other = [e for e in endpoints.endpoints if ":" not in e.address]
+        if ipv6 and ":" in endpoints.endpoints[0].address:
+            (first, second) = (ipv6, other)
+        else:
+            (first, second) = (other, ipv6)
+
+        ordered = []
+        for pair in itertools.zip_longest(first, second):
+            ordered.extend(endpoint for endpoint in pair if endpoint is not None)
+        return ordered
+
+    def _create_endpoint_channels(
+        self, endpoints: vector_db_pb2.ServerEndpointList, stats: NodeStats
+    ) -> Iterator[tuple[vector_db_pb2.ServerEndpoint, Union[grpc.aio.Channel, grpc.Channel]]]:
+        # Lazily creates a channel for each endpoint in the order they should be tried.
+        for endpoint in self._order_endpoints(endpoints):
             try:
-                return self._create_channel(endpoint.address, endpoint.port)
+                yield (
+                    endpoint,
+                    self._create_node_channel(endpoint.address, endpoint.port, stats),
+                )
             except Exception as e:
                 logger.debug("failure creating channel: " + str(e))
 
+    def _create_channel_and_endpoints(
+        self,
+        endpoints: vector_db_pb2.ServerEndpointList,
+        stats: NodeStats,
+        attempt: Optional[tuple[vector_db_pb2.ServerEndpoint, Union[grpc.aio.Channel, grpc.Channel]]],
+    ) -> ChannelAndEndpoints:
+        if attempt is None:
+            return ChannelAndEndpoints(None, endpoints, stats)
+
+        # The rest of the pool connects to the endpoint that won the race.
+        (endpoint, channel) = attempt
+        return ChannelAndEndpoints(
+            channel,
+            endpoints,
+            stats,
+            pool_size=self._channels_per_node,
+            create_channel=lambda: self._create_node_channel(
+                endpoint.address, endpoint.port, stats
+            ),
+        )
+
+    def _create_node_channel(
+        self, host: str, port: int, stats: NodeStats
+    ) -> Union[grpc.aio.Channel, grpc.Channel]:
+        # Subclasses attach an interceptor that keeps stats up to date
+        # for the balancing policy.
+        return self._create_channel(host, port)
+
+    def _node_channel_options(self) -> Optional[list[tuple[str, Any]]]:
+        # Channels with the same target and arguments share one connection
+        # through gRPC's global subchannel pool, which would defeat the point
+        # of pooling them.
+        if self._channels_per_node > 1:
+            return [("grpc.use_local_subchannel_pool", 1)]
+        return None
+
     def add_new_channel_to_node_channels(self, node, newEndpoints):
 
-        # We have discovered a new node
-        new_channel = self._create_channel_from_server_endpoint_list(newEndpoints)
-        self._node_channels[node] = ChannelAndEndpoints(new_channel, newEndpoints)
+        # We have discovered a new node. Without a race, use its first endpoint.
+        stats = NodeStats()
+        attempt = next(self._create_endpoint_channels(newEndpoints, stats), None)
+        self._node_channels[node] = self._create_channel_and_endpoints(
+            newEndpoints, stats, attempt
+        )
+
+    def _on_node_unavailable(self, method: Union[str, bytes]) -> None:
+        # Called by a node channel's interceptor. aio channels pass the method as bytes.
+        if isinstance(method, bytes):
+            method = method.decode()
+        if not method.startswith(_TEND_METHOD_PREFIX):
+            self._request_tend()
+
+    def _next_tend_delay(self) -> float:
+        # Jitter keeps many clients started together from tending in lockstep.
+        jitter = self._tend_interval * self._tend_jitter
+        return self._tend_interval + random.uniform(-jitter, jitter)
 
     def init_tend_cluster(self) -> tuple[list[ChannelAndEndpoints], bool]:
 
@@ -126,9 +436,9 @@ class BaseChannelProvider(object):
             # Skip tend if we are behind a load-balancer
             end_tend_cluster = True
 
-        channels = self._seedChannels + [
-            x.channel for x in self._node_channels.values()
-        ]
+        channels = [x.channel for x in self._node_channels.values()]
+        if self._needs_seed_channels():
+            channels = self._seed_channels() + channels
 
         return (channels, end_tend_cluster)
 
@@ -161,7 +471,7 @@ class BaseChannelProvider(object):
         return (channel_endpoints, add_new_channel)
 
     def _get_auth_stub(self) -> auth_pb2_grpc.AuthServiceStub:
-        return auth_pb2_grpc.AuthServiceStub(self.get_channel())
+        return self.get_stub(auth_pb2_grpc.AuthServiceStub)
 
     def verify_compatible_server(self):
         def parse_version(v: str):
@@ -185,7 +495,7 @@ class BaseChannelProvider(object):
 
         for channel in channels:
 
-            stub = vector_db_pb2_grpc.ClusterInfoServiceStub(channel)
+            stub = self._get_channel_stub(channel, vector_db_pb2_grpc.ClusterInfoServiceStub)
             stubs.append(stub)
 
             response = self._call_get_cluster_id(stub)
@@ -218,12 +528,32 @@ class BaseChannelProvider(object):
         # TODO: Worry about thread safety
         temp_endpoints: dict[int, vector_db_pb2.ServerEndpointList] = {}
         for endpoints in cluster_endpoints_list:
+            if endpoints is None:
+                # The call failed or timed out
+                continue
             temp_endpoints = self.update_temp_endpoints(endpoints, temp_endpoints)
+
+        if cluster_endpoints_list and not temp_endpoints:
+            # No node told us the new topology. Forget the cluster id so the
+            # next tend asks again rather than dropping every node.
+            self._cluster_id = 0
         return temp_endpoints
 
-    def _add_new_channels_from_temp_endpoints(self, temp_endpoints):
-        responses = []
+    def _nodes_to_connect(self, temp_endpoints) -> dict[int, vector_db_pb2.ServerEndpointList]:
+        # Nodes that are new or whose endpoints changed
+        return {
+            node: newEndpoints
+            for node, newEndpoints in temp_endpoints.items()
+            if self.check_for_new_endpoints(node, newEndpoints)[1]
+        }
 
+    def _add_new_channels_from_temp_endpoints(
+        self,
+        temp_endpoints,
+        connected: Optional[dict[int, Optional[ChannelAndEndpoints]]] = None,
+    ):
+        # connected holds the result of racing the endpoints of _nodes_to_connect,
+        # None for a node where no endpoint became ready.
         for node, newEndpoints in temp_endpoints.items():
 
             # Compare node channel result
@@ -232,23 +562,22 @@ class BaseChannelProvider(object):
             )
 
             if add_new_channel:
-                if channel_endpoints:
-                    response = self._call_close_on_channel(channel_endpoints)
-                    responses.append(response)
-
-                self.add_new_channel_to_node_channels(node, newEndpoints)
-
-        return responses
+                if connected is None:
+                    self.add_new_channel_to_node_channels(node, newEndpoints)
+                elif connected.get(node) is not None:
+                    self._node_channels[node] = connected[node]
+                else:
+                    # Forget the cluster id so the next tend fetches the
+                    # endpoints again and retries this node.
+                    self._cluster_id = 0
+                    continue
 
-    def _close_old_channels_from_node_channels(self, temp_endpoints):
-        responses = []
+                if channel_endpoints:
+                    self._retire_channel(channel_endpoints)
 
+    def _retire_old_channels_from_node_channels(self, temp_endpoints):
         for node, channel_endpoints in list(self._node_channels.items()):
             if not temp_endpoints.get(node):
-                # TODO: Wait for all calls to drain
-                response = self._call_close_on_channel(channel_endpoints)
-                responses.append(response)
-
                 del self._node_channels[node]
 
-        return responses
+                self._retire_channel(channel_endpoints)
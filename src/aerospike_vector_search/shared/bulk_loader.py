@@ -0,0 +1,234 @@
+import heapq
+import itertools
+import time
+from logging import Logger
+from typing import Any, Iterator, Optional, Tuple
+
+import grpc
+
+from .. import types
+from .proto_generated import transact_pb2
+
+
+# gRPC status codes the server uses to signal that it cannot keep up with writes,
+# for example when the in-memory index queue is full.
+BACKPRESSURE_STATUS_CODES = (grpc.StatusCode.RESOURCE_EXHAUSTED,)
+
+
+def _is_backpressure(rpc_error: grpc.RpcError) -> bool:
+    try:
+        if rpc_error.code() in BACKPRESSURE_STATUS_CODES:
+            return True
+        details = rpc_error.details() or ""
+    except Exception:
+        return False
+
+    return "queue full" in details.lower()
+
+
+class AimdController(object):
+    """
+    Additive-increase/multiplicative-decrease controller for the number of
+    write requests a bulk loader keeps in flight.
+
+    Each successful write grows the window by additive_increase / window, so the
+    window grows by roughly additive_increase per round trip. Backpressure shrinks
+    the window by decrease_factor, at most once per round trip: writes that were
+    already in flight when the window shrank do not shrink it again.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        additive_increase: float,
+        decrease_factor: float,
+    ) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self._window: float = float(min(max(initial, minimum), maximum))
+        self._sequence = itertools.count()
+        self._last_decrease: int = -1
+
+    @property
+    def limit(self) -> int:
+        return int(self._window)
+
+    def next_sequence(self) -> int:
+        return next(self._sequence)
+
+    def on_success(self) -> None:
+        self._window = min(
+            self.maximum, self._window + self.additive_increase / self._window
+        )
+
+    def on_backpressure(self, sequence: int) -> bool:
+        # Only the first backpressure signal from a given window decreases it.
+        if sequence <= self._last_decrease:
+            return False
+
+        self._last_decrease = self.next_sequence()
+        self._window = max(self.minimum, self._window * self.decrease_factor)
+        return True
+
+
+class _PendingRecord(object):
+    __slots__ = ("key", "record_data", "attempts")
+
+    def __init__(self, key: Any, record_data: dict[str, Any]) -> None:
+        self.key = key
+        self.record_data = record_data
+        self.attempts = 0
+
+
+class BaseBulkLoader(object):
+
+    def __init__(
+        self,
+        *,
+        namespace: str,
+        set_name: Optional[str],
+        initial_in_flight: int,
+        min_in_flight: int,
+        max_in_flight: int,
+        additive_increase: float,
+        decrease_factor: float,
+        max_retries: int,
+        retry_backoff: float,
+        max_retry_backoff: float,
+        timeout: Optional[int],
+    ) -> None:
+        if min_in_flight < 1 or max_in_flight < min_in_flight:
+            raise types.AVSClientError(
+                message="in-flight limits must satisfy 1 <= min_in_flight <= max_in_flight"
+            )
+        if not 0 < decrease_factor < 1:
+            raise types.AVSClientError(message="decrease_factor must be between 0 and 1")
+
+        self._namespace = namespace
+        self._set_name = set_name
+        self._initial_in_flight = initial_in_flight
+        self._min_in_flight = min_in_flight
+        self._max_in_flight = max_in_flight
+        self._additive_increase = additive_increase
+        self._decrease_factor = decrease_factor
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._max_retry_backoff = max_retry_backoff
+        self._timeout = timeout
+
+        self.stats = types.BulkLoadStats()
+
+    def _start(self) -> AimdController:
+        self.stats = types.BulkLoadStats()
+        self._start_time = time.monotonic()
+        self._retry_queue: list[Tuple[float, int, _PendingRecord]] = []
+        self._retry_counter = itertools.count()
+
+        controller = AimdController(
+            initial=self._initial_in_flight,
+            minimum=self._min_in_flight,
+            maximum=self._max_in_flight,
+            additive_increase=self._additive_increase,
+            decrease_factor=self._decrease_factor,
+        )
+        self.stats.in_flight_limit = controller.limit
+        return controller
+
+    def _next_record(self, source: Iterator, now: float) -> Optional[_PendingRecord]:
+        # Records waiting for a retry take priority once their backoff has passed.
+        if self._retry_queue and self._retry_queue[0][0] <= now:
+            return heapq.heappop(self._retry_queue)[2]
+
+        for key, record_data in source:
+            return _PendingRecord(key, record_data)
+
+        return None
+
+    def _next_retry_delay(self, now: float) -> Optional[float]:
+        if not self._retry_queue:
+            return None
+        return max(0.0, self._retry_queue[0][0] - now)
+
+    def _prepare_record(self, client, pending: _PendingRecord, logger: Logger):
+        try:
+            return client._prepare_put(
+                self._namespace,
+                pending.key,
+                pending.record_data,
+                self._set_name,
+                transact_pb2.WriteType.UPSERT,
+                False,
+                self._timeout,
+                logger,
+            )
+        except Exception as e:
+            logger.debug("Failed to prepare record with key %s: %s", pending.key, e)
+            self._record_failure(pending, types.AVSClientError(message=str(e)))
+            return None
+
+    def _invalidate(self, pending: _PendingRecord) -> None:
+        # Drop the record from the client's record cache once a write to it has finished.
+        self._client._invalidate_record(self._namespace, self._set_name, pending.key)
+
+    def _record_success(self, controller: AimdController) -> None:
+        controller.on_success()
+        self.stats.records_written += 1
+        self.stats.in_flight_limit = controller.limit
+
+    def _record_rpc_error(
+        self,
+        controller: AimdController,
+        pending: _PendingRecord,
+        sequence: int,
+        rpc_error: grpc.RpcError,
+        logger: Logger,
+    ) -> None:
+        try:
+            code_name = rpc_error.code().name
+        except Exception:
+            code_name = "UNKNOWN"
+        self.stats.errors[code_name] = self.stats.errors.get(code_name, 0) + 1
+
+        if not _is_backpressure(rpc_error):
+            self._record_failure(pending, types.AVSServerError(rpc_error=rpc_error))
+            return
+
+        if controller.on_backpressure(sequence):
+            self.stats.backpressure_events += 1
+            self.stats.in_flight_limit = controller.limit
+            logger.debug(
+                "Server signalled backpressure, reducing in-flight limit to %s",
+                controller.limit,
+            )
+
+        if pending.attempts >= self._max_retries:
+            self._record_failure(pending, types.AVSServerError(rpc_error=rpc_error))
+            return
+
+        backoff = min(
+            self._max_retry_backoff, self._retry_backoff * (2 ** pending.attempts)
+        )
+        pending.attempts += 1
+        self.stats.retries += 1
+        heapq.heappush(
+            self._retry_queue,
+            (time.monotonic() + backoff, next(self._retry_counter), pending),
+        )
+
+    def _record_failure(self, pending: _PendingRecord, error: types.AVSError) -> None:
+        self.stats.records_failed += 1
+        self.stats.failures.append(
+            types.BatchRecordResult(key=pending.key, error=error)
+        )
+
+    def _finish(self) -> types.BulkLoadStats:
+        self.stats.elapsed = time.monotonic() - self._start_time
+        return self.stats
+
+    def _update_elapsed(self) -> None:
+        self.stats.elapsed = time.monotonic() - self._start_time
@@ -0,0 +1,314 @@
+import collections
+import hashlib
+import threading
+import time
+from typing import Any, Hashable, Optional, Tuple, Union
+
+import numpy as np
+
+from .. import types
+
+
+class LruTtlCache(object):
+    """
+    A size-bounded LRU cache whose entries expire after a TTL.
+
+    Every entry belongs to a group, for example all the projections cached
+    for one record, so that a write can drop everything derived from the
+    data it changed. The cache is guarded by a lock and never blocks while
+    holding it, so it is safe to share between threads and asyncio tasks.
+    """
+
+    def __init__(self, config: types.CacheConfig) -> None:
+        if config.max_entries < 1:
+            raise types.AVSClientError(message="cache max_entries must be at least 1")
+        if config.ttl is not None and config.ttl <= 0:
+            raise types.AVSClientError(message="cache ttl must be greater than 0")
+
+        self._max_entries = config.max_entries
+        self._ttl = config.ttl
+        self._lock = threading.Lock()
+        # key -> (value, expires_at, group), least recently used first
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._groups: dict[Hashable, set] = {}
+        self._generation = 0
+        self._stats = types.CacheStats()
+
+    def generation(self) -> int:
+        """
+        Returns a token to pass to :meth:`put` for a value fetched after this call.
+        """
+        return self._generation
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return (False, None)
+
+            (value, expires_at, group) = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key, group)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return (False, None)
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return (True, value)
+
+    def put(self, key: Hashable, value: Any, group: Hashable, generation: int) -> None:
+        with self._lock:
+            # Something was invalidated while the value was being fetched, so it
+            # may predate a write this client made. Don't cache it.
+            if generation != self._generation:
+                return
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._groups[previous[2]].discard(key)
+
+            expires_at = None
+            if self._ttl is not None:
+                expires_at = time.monotonic() + self._ttl
+
+            self._entries[key] = (value, expires_at, group)
+            self._groups.setdefault(group, set()).add(key)
+
+            while len(self._entries) > self._max_entries:
+                (evicted_key, (_, _, evicted_group)) = next(iter(self._entries.items()))
+                self._remove(evicted_key, evicted_group)
+                self._stats.evictions += 1
+
+    def invalidate(self, group: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            keys = self._groups.pop(group, None)
+            if not keys:
+                return
+
+            for key in keys:
+                del self._entries[key]
+            self._stats.invalidations += len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._groups.clear()
+
+    def stats(self) -> types.CacheStats:
+        with self._lock:
+            return types.CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                invalidations=self._stats.invalidations,
+                size=len(self._entries),
+            )
+
+    def _remove(self, key: Hashable, group: Hashable) -> None:
+        del self._entries[key]
+        keys = self._groups.get(group)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._groups[group]
+
+
+def _normalize_key(key: Union[int, str, bytes, bytearray, np.generic, np.ndarray]) -> Hashable:
+    # Mirrors BaseClient._get_key so that keys which address the same record
+    # share a cache entry.
+    if isinstance(key, np.ndarray):
+        return key.tobytes()
+    if isinstance(key, np.generic):
+        key = key.item()
+    if isinstance(key, bytearray):
+        return bytes(key)
+    return key
+
+
+def _copy_value(value: Any) -> Any:
+    # Copies the containers and arrays a decoded field value can hold.
+    # Strings, numbers and bytes are immutable and are shared.
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "O":
+            column = np.empty(value.shape, dtype=object)
+            for index, item in np.ndenumerate(value):
+                column[index] = _copy_value(item)
+            return column
+        return value.copy()
+    return value
+
+
+def _copy_record(record: types.RecordWithKey) -> types.RecordWithKey:
+    return types.RecordWithKey(key=record.key, fields=_copy_value(record.fields))
+
+
+def _copy_neighbor(
+    neighbor: Union[types.Neighbor, types.LazyNeighbor]
+) -> Union[types.Neighbor, types.LazyNeighbor]:
+    if isinstance(neighbor, types.LazyNeighbor):
+        # A new wrapper decodes its own fields from the response, so nothing is shared.
+        return types.LazyNeighbor(
+            neighbor=neighbor._neighbor, vector_format=neighbor._vector_format
+        )
+    return types.Neighbor(
+        key=neighbor.key,
+        fields=_copy_value(neighbor.fields),
+        distance=neighbor.distance,
+    )
+
+
+def _copy_results(results: Any) -> Any:
+    if isinstance(results, list):
+        return [
+            _copy_neighbor(neighbor)
+            if isinstance(neighbor, (types.Neighbor, types.LazyNeighbor))
+            else neighbor
+            for neighbor in results
+        ]
+    if isinstance(results, types.SearchResult):
+        return types.SearchResult(
+            keys=_copy_value(results.keys),
+            distances=results.distances.copy(),
+            fields=_copy_value(results.fields),
+        )
+    return results
+
+
+class RecordCache(object):
+    """
+    Caches the records returned by get, keyed on the record and the requested projection.
+
+    Records are copied when they are stored and again when they are looked up,
+    so callers may modify the fields, vectors and arrays they get back.
+    """
+
+    def __init__(self, config: types.CacheConfig) -> None:
+        self._cache = LruTtlCache(config)
+
+    def lookup(
+        self,
+        namespace: str,
+        set_name: Optional[str],
+        key: Any,
+        include_fields: Optional[list[str]],
+        exclude_fields: Optional[list[str]],
+        vector_format: types.VectorFormat = types.VectorFormat.LIST,
+    ) -> Tuple[Hashable, int, Optional[types.RecordWithKey]]:
+        """
+        Returns the cache key, a generation token for :meth:`store` and the cached record, if any.
+        """
+        cache_key = (
+            self._group(namespace, set_name, key),
+            None if include_fields is None else tuple(include_fields),
+            None if exclude_fields is None else tuple(exclude_fields),
+            vector_format,
+        )
+        generation = self._cache.generation()
+        (found, record) = self._cache.get(cache_key)
+        if not found:
+            return (cache_key, generation, None)
+
+        # Hand out a copy so callers can't modify the cached record.
+        return (cache_key, generation, _copy_record(record))
+
+    def store(self, cache_key: Hashable, generation: int, record: types.RecordWithKey) -> None:
+        self._cache.put(cache_key, _copy_record(record), cache_key[0], generation)
+
+    def invalidate(self, namespace: str, set_name: Optional[str], key: Any) -> None:
+        self._cache.invalidate(self._group(namespace, set_name, key))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> types.CacheStats:
+        return self._cache.stats()
+
+    def _group(self, namespace: str, set_name: Optional[str], key: Any) -> Hashable:
+        return (namespace, set_name or "", _normalize_key(key))
+
+
+class SearchCache(object):
+    """
+    Caches vector search results, keyed on the index, a digest of the query vector and the search options.
+
+    Writes are not tied to a specific index on the client, so a write to a
+    namespace drops every cached search for that namespace.
+
+    Results are copied when they are stored and again when they are looked up,
+    down to each neighbor's fields and each SearchResult array.
+    """
+
+    def __init__(self, config: types.SearchCacheConfig) -> None:
+        if config.quantization is not None and config.quantization <= 0:
+            raise types.AVSClientError(message="search cache quantization must be greater than 0")
+
+        self._cache = LruTtlCache(config)
+        self._quantization = config.quantization
+
+    def lookup(
+        self,
+        namespace: str,
+        index_name: str,
+        query: Union[list[Union[bool, float]], np.ndarray],
+        limit: int,
+        search_params: Optional[types.HnswSearchParams],
+        include_fields: Optional[list[str]],
+        exclude_fields: Optional[list[str]],
+        result_format: types.SearchResultFormat,
+        vector_format: types.VectorFormat = types.VectorFormat.LIST,
+    ) -> Tuple[Hashable, int, Any]:
+        """
+        Returns the cache key, a generation token for :meth:`store` and the cached results, if any.
+        """
+        cache_key = (
+            namespace,
+            index_name,
+            self._digest(query),
+            limit,
+            None if search_params is None else search_params.ef,
+            None if include_fields is None else tuple(include_fields),
+            None if exclude_fields is None else tuple(exclude_fields),
+            result_format,
+            vector_format,
+        )
+        generation = self._cache.generation()
+        (found, results) = self._cache.get(cache_key)
+        if not found:
+            return (cache_key, generation, None)
+
+        # Hand out a copy so callers can't modify the cached results.
+        return (cache_key, generation, _copy_results(results))
+
+    def store(self, cache_key: Hashable, generation: int, results: Any) -> None:
+        self._cache.put(cache_key, _copy_results(results), cache_key[0], generation)
+
+    def invalidate(self, namespace: str) -> None:
+        self._cache.invalidate(namespace)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> types.CacheStats:
+        return self._cache.stats()
+
+    def _digest(self, query: Union[list[Union[bool, float]], np.ndarray]) -> bytes:
+        vector = np.asarray(query)
+        if vector.dtype.kind == "f":
+            # Queries are sent as float32, so hash what the server would see.
+            vector = vector.astype(np.float32)
+            if self._quantization is not None:
+                vector = np.rint(vector / self._quantization).astype(np.int64)
+
+        digest = hashlib.blake2b(vector.dtype.str.encode(), digest_size=16)
+        digest.update(np.ascontiguousarray(vector).tobytes())
+        return digest.digest()
@@ -1,7 +1,8 @@
 from logging import Logger
-from typing import Any, Optional, Union, Tuple, List
+from typing import Any, Hashable, Iterable, Iterator, Optional, Union, Tuple, List
 import time
 import numpy as np
+from . import codec
 from . import conversions
 
 from .proto_generated import transact_pb2, index_pb2, index_pb2_grpc
@@ -9,14 +10,40 @@ from .proto_generated import transact_pb2_grpc
 from .. import types
 from .proto_generated import types_pb2
 from . import helpers
+from .cache import RecordCache, SearchCache
 from ..types import AVSClientError, AVSClientErrorClosed
 
+# Default number of RPCs a batch call keeps in flight at once.
+DEFAULT_MAX_IN_FLIGHT: int = 64
+
 
 class BaseClient(object):
 
+    # When set, Put, Get and VectorSearch requests are encoded and their
+    # responses decoded by the codec module instead of protobuf messages.
+    _raw_codec: bool = False
+
     def _prepare_seeds(self, seeds) ->  Tuple[types.HostPort, ...]:
         return helpers._prepare_seeds(seeds)
 
+    def _prepare_record_cache(self, config: Optional[types.CacheConfig]) -> Optional[RecordCache]:
+        if config is None:
+            return None
+        return RecordCache(config)
+
+    def _prepare_search_cache(self, config: Optional[types.SearchCacheConfig]) -> Optional[SearchCache]:
+        if config is None:
+            return None
+        return SearchCache(config)
+
+    def _invalidate_record(
+        self, namespace: str, set_name: Optional[str], key: Union[int, str, bytes, bytearray, np.generic, np.ndarray]
+    ) -> None:
+        if self._record_cache is not None:
+            self._record_cache.invalidate(namespace, set_name, key)
+        if self._search_cache is not None:
+            self._search_cache.invalidate(namespace)
+
     def _prepare_put(
         self,
         namespace: str,
@@ -43,29 +70,30 @@ class BaseClient(object):
         if timeout is not None:
             kwargs["timeout"] = timeout
 
-        key = self._get_key(namespace, set_name, key)
-        field_list = []
-
-        for k, v in record_data.items():
-            if isinstance(v, np.ndarray):
-                field_list.append(
-                    types_pb2.Field(
-                        name=k, value=conversions.toVectorDbValue(v.tolist())
-                    )
-                )
+        if self._raw_codec:
+            put_request = codec.encode_put_request(
+                codec.encode_key(namespace, set_name, key),
+                record_data,
+                write_type,
+                ignore_mem_queue_full,
+            )
+            return (self._get_raw_transact_stub(), put_request, kwargs)
 
-            else:
-                field_list.append(
-                    types_pb2.Field(name=k, value=conversions.toVectorDbValue(v))
-                )
+        key = self._get_key(namespace, set_name, key)
 
-        transact_stub = self._get_transact_stub()
         put_request = transact_pb2.PutRequest(
             key=key,
             writeType=write_type,
-            fields=field_list,
             ignoreMemQueueFull=ignore_mem_queue_full,
         )
+        # Convert each field value inside the request instead of copying it in.
+        add_field = put_request.fields.add
+        for k, v in record_data.items():
+            conversions.fillVectorDbValue(add_field(name=k).value, v)
+
+        # The stub is fetched last, since picking a node may reserve its
+        # probe call, which a request that fails to build would never send.
+        transact_stub = self._get_transact_stub()
 
         return (transact_stub, put_request, kwargs)
 
@@ -133,6 +161,108 @@ class BaseClient(object):
             logger,
         )
 
+    def _prepare_put_many(
+        self,
+        namespace: str,
+        records: Iterable[Tuple[Any, dict[str, Any]]],
+        set_name: Optional[str],
+        write_type: transact_pb2.WriteType,
+        ignore_mem_queue_full: Optional[bool],
+        timeout: Optional[int],
+        logger: Logger,
+    ) -> Iterator[Tuple[Any, Optional[tuple[transact_pb2_grpc.TransactServiceStub, transact_pb2.PutRequest, dict[str, Any]]], Optional[types.AVSError]]]:
+        # Records are prepared lazily so that arbitrarily large iterables
+        # can be streamed without being materialized.
+        for key, record_data in records:
+            try:
+                prepared = self._prepare_put(
+                    namespace,
+                    key,
+                    record_data,
+                    set_name,
+                    write_type,
+                    ignore_mem_queue_full,
+                    timeout,
+                    logger,
+                )
+            except Exception as e:
+                logger.debug("Failed to prepare record with key %s: %s", key, e)
+                yield (key, None, AVSClientError(message=str(e)))
+                continue
+
+            yield (key, prepared, None)
+
+    def _prepare_get_many(
+        self,
+        namespace: str,
+        keys: Iterable[Any],
+        include_fields: Optional[list[str]],
+        exclude_fields: Optional[list[str]],
+        set_name: Optional[str],
+        timeout: Optional[int],
+        logger: Logger,
+    ) -> Iterator[Tuple[Any, Optional[tuple[transact_pb2_grpc.TransactServiceStub, transact_pb2.GetRequest, dict[str, Any]]], Optional[types.AVSError]]]:
+        def prepare(key):
+            (transact_stub, _, get_request, kwargs) = self._prepare_get(
+                namespace, key, include_fields, exclude_fields, set_name, timeout, logger
+            )
+            return (transact_stub, get_request, kwargs)
+
+        return self._prepare_key_many(keys, prepare, logger)
+
+    def _prepare_exists_many(
+        self,
+        namespace: str,
+        keys: Iterable[Any],
+        set_name: Optional[str],
+        timeout: Optional[int],
+        logger: Logger,
+    ) -> Iterator[Tuple[Any, Optional[tuple[transact_pb2_grpc.TransactServiceStub, transact_pb2.ExistsRequest, dict[str, Any]]], Optional[types.AVSError]]]:
+        return self._prepare_key_many(
+            keys,
+            lambda key: self._prepare_exists(namespace, key, set_name, timeout, logger),
+            logger,
+        )
+
+    def _prepare_delete_many(
+        self,
+        namespace: str,
+        keys: Iterable[Any],
+        set_name: Optional[str],
+        timeout: Optional[int],
+        logger: Logger,
+    ) -> Iterator[Tuple[Any, Optional[tuple[transact_pb2_grpc.TransactServiceStub, transact_pb2.DeleteRequest, dict[str, Any]]], Optional[types.AVSError]]]:
+        return self._prepare_key_many(
+            keys,
+            lambda key: self._prepare_delete(namespace, key, set_name, timeout, logger),
+            logger,
+        )
+
+    def _prepare_key_many(
+        self, keys: Iterable[Any], prepare, logger: Logger
+    ) -> Iterator[Tuple[Any, Optional[tuple], Optional[types.AVSError]]]:
+        # Like _prepare_put_many, keys are prepared lazily and a key that
+        # cannot be prepared is reported instead of failing the batch.
+        for key in keys:
+            try:
+                prepared = prepare(key)
+            except Exception as e:
+                logger.debug("Failed to prepare request for key %s: %s", key, e)
+                yield (key, None, AVSClientError(message=str(e)))
+                continue
+
+            yield (key, prepared, None)
+
+    def _check_max_in_flight(self, max_in_flight: int) -> None:
+        if max_in_flight < 1:
+            raise AVSClientError(message="max_in_flight must be at least 1")
+
+    def _check_queries(
+        self, queries: Union[Iterable[Union[List[Union[bool, float]], np.ndarray]], np.ndarray]
+    ) -> None:
+        if isinstance(queries, np.ndarray) and queries.ndim != 2:
+            raise AVSClientError(message="queries must be a 2-dimensional array of shape (n, dimensions)")
+
     def _prepare_get(
         self, namespace, key, include_fields, exclude_fields, set_name, timeout, logger
     ) -> tuple[transact_pb2_grpc.TransactServiceStub, types_pb2.Key, transact_pb2.GetRequest, dict[str, Any]]:
@@ -151,11 +281,18 @@ class BaseClient(object):
         if timeout is not None:
             kwargs["timeout"] = timeout
 
+        if self._raw_codec:
+            key = codec.encode_key(namespace, set_name, key)
+            get_request = codec.encode_get_request(
+                key, codec.encode_projection(include_fields, exclude_fields)
+            )
+            return (self._get_raw_transact_stub(), key, get_request, kwargs)
+
         key = self._get_key(namespace, set_name, key)
         projection_spec = self._get_projection_spec(include_fields=include_fields, exclude_fields=exclude_fields)
 
-        transact_stub = self._get_transact_stub()
         get_request = transact_pb2.GetRequest(key=key, projection=projection_spec)
+        transact_stub = self._get_transact_stub()
 
         return (transact_stub, key, get_request, kwargs)
 
@@ -176,8 +313,8 @@ class BaseClient(object):
 
         key = self._get_key(namespace, set_name, key)
 
-        transact_stub = self._get_transact_stub()
         exists_request = transact_pb2.ExistsRequest(key=key)
+        transact_stub = self._get_transact_stub()
 
         return (transact_stub, exists_request, kwargs)
 
@@ -198,8 +335,8 @@ class BaseClient(object):
 
         key = self._get_key(namespace, set_name, key)
 
-        transact_stub = self._get_transact_stub()
         delete_request = transact_pb2.DeleteRequest(key=key)
+        transact_stub = self._get_transact_stub()
 
         return (transact_stub, delete_request, kwargs)
 
@@ -226,8 +363,8 @@ class BaseClient(object):
         index_id = types_pb2.IndexId(namespace=index_namespace, name=index_name)
         key = self._get_key(namespace, set_name, key)
 
-        transact_stub = self._get_transact_stub()
         is_indexed_request = transact_pb2.IsIndexedRequest(key=key, indexId=index_id)
+        transact_stub = self._get_transact_stub()
 
         return (transact_stub, is_indexed_request, kwargs)
 
@@ -260,6 +397,17 @@ class BaseClient(object):
             timeout,
         )
 
+        if self._raw_codec:
+            (head, tail) = codec.vector_search_request_parts(
+                namespace,
+                index_name,
+                limit,
+                search_params,
+                codec.encode_projection(include_fields, exclude_fields),
+            )
+            vector_search_request = codec.encode_vector_search_request(head, query, tail)
+            return (self._get_raw_transact_stub(), vector_search_request, kwargs)
+
         if search_params != None:
             search_params = search_params._to_pb2()
 
@@ -267,12 +415,7 @@ class BaseClient(object):
 
         index = types_pb2.IndexId(namespace=namespace, name=index_name)
 
-        if isinstance(query, np.ndarray):
-            query_vector = conversions.toVectorDbValue(query.tolist()).vectorValue
-        else:
-            query_vector = conversions.toVectorDbValue(query).vectorValue
-
-        transact_stub = self._get_transact_stub()
+        query_vector = conversions.toVectorDbValue(query).vectorValue
 
         vector_search_request = transact_pb2.VectorSearchRequest(
             index=index,
@@ -282,17 +425,142 @@ class BaseClient(object):
             projection=projection_spec,
         )
 
+        transact_stub = self._get_transact_stub()
+
         return (transact_stub, vector_search_request, kwargs)
 
-    def _get_transact_stub(self) -> transact_pb2_grpc.TransactServiceStub:
-        return transact_pb2_grpc.TransactServiceStub(
-            self._channel_provider.get_channel()
+    def _prepare_vector_search_many(
+        self,
+        namespace: str,
+        index_name: str,
+        queries: Union[Iterable[Union[List[Union[bool, float]], np.ndarray]], np.ndarray],
+        limit: int,
+        search_params: Optional[types.HnswSearchParams],
+        include_fields: Optional[List[str]],
+        exclude_fields: Optional[List[str]],
+        timeout: Optional[int],
+        logger: Logger,
+    ) -> Iterator[tuple[transact_pb2_grpc.TransactServiceStub, transact_pb2.VectorSearchRequest, dict[str, Any]]]:
+
+        kwargs = {}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        logger.debug(
+            "Performing batch vector search: namespace=%s, index_name=%s, limit=%s, search_params=%s, include_fields=%s, exclude_fields=%s, timeout:%s",
+            namespace,
+            index_name,
+            limit,
+            search_params,
+            include_fields,
+            exclude_fields,
+            timeout,
         )
 
-    def _respond_get(self, response, key) -> types.RecordWithKey:
+        if self._raw_codec:
+            (head, tail) = codec.vector_search_request_parts(
+                namespace,
+                index_name,
+                limit,
+                search_params,
+                codec.encode_projection(include_fields, exclude_fields),
+            )
+            for query in queries:
+                vector_search_request = codec.encode_vector_search_request(head, query, tail)
+                yield (self._get_raw_transact_stub(), vector_search_request, kwargs)
+            return
+
+        if search_params != None:
+            search_params = search_params._to_pb2()
+
+        # Everything except the query vector is shared by all the requests.
+        projection_spec = self._get_projection_spec(include_fields=include_fields, exclude_fields=exclude_fields)
+        index = types_pb2.IndexId(namespace=namespace, name=index_name)
+
+        for query in queries:
+            query_vector = conversions.toVectorDbValue(query).vectorValue
+
+            vector_search_request = transact_pb2.VectorSearchRequest(
+                index=index,
+                queryVector=query_vector,
+                limit=limit,
+                hnswSearchParams=search_params,
+                projection=projection_spec,
+            )
+
+            yield (self._get_transact_stub(), vector_search_request, kwargs)
+
+    def _uncached_queries(
+        self,
+        queries: Union[Iterable[Union[List[Union[bool, float]], np.ndarray]], np.ndarray],
+        results: list,
+        misses: list,
+        namespace: str,
+        index_name: str,
+        limit: int,
+        search_params: Optional[types.HnswSearchParams],
+        include_fields: Optional[List[str]],
+        exclude_fields: Optional[List[str]],
+        result_format: types.SearchResultFormat,
+        vector_format: types.VectorFormat,
+    ) -> Iterator[Union[List[Union[bool, float]], np.ndarray]]:
+        # Appends a result slot per query, filled from the search cache when possible,
+        # and yields the queries that must be sent. Before yielding a query, it appends
+        # (result index, cache key, generation) for it to misses.
+        for query in queries:
+            index = len(results)
+            results.append(None)
+            if self._search_cache is None:
+                misses.append((index, None, 0))
+                yield query
+                continue
+
+            (cache_key, generation, cached) = self._search_cache.lookup(
+                namespace,
+                index_name,
+                query,
+                limit,
+                search_params,
+                include_fields,
+                exclude_fields,
+                result_format,
+                vector_format,
+            )
+            if cached is not None:
+                results[index] = cached
+                continue
+            misses.append((index, cache_key, generation))
+            yield query
+
+    def _store_search(self, cache_key: Optional[Hashable], generation: int, results: Any) -> None:
+        if cache_key is not None:
+            self._search_cache.store(cache_key, generation, results)
+
+    def _get_transact_stub(self) -> transact_pb2_grpc.TransactServiceStub:
+        return self._channel_provider.get_stub(transact_pb2_grpc.TransactServiceStub)
+
+    def _get_raw_transact_stub(self) -> codec.RawTransactStub:
+        return self._channel_provider.get_stub(codec.RawTransactStub)
+
+    def _request_key(self, request) -> Union[types_pb2.Key, bytes]:
+        if isinstance(request, bytes):
+            return codec.request_key(request)
+        return request.key
+
+    def _respond_get(
+        self,
+        response,
+        key,
+        vector_format: types.VectorFormat = types.VectorFormat.LIST,
+    ) -> types.RecordWithKey:
+        if isinstance(response, bytes):
+            return types.RecordWithKey(
+                key=codec.decode_key(key),
+                fields=codec.decode_record(response, vector_format),
+            )
         return types.RecordWithKey(
             key=conversions.fromVectorDbKey(key),
-            fields=conversions.fromVectorDbRecord(response),
+            fields=conversions.fromVectorDbRecord(response, vector_format),
         )
 
     def _respond_exists(self, response) -> bool:
@@ -301,8 +569,60 @@ class BaseClient(object):
     def _respond_is_indexed(self, response) -> bool:
         return response.value
 
-    def _respond_neighbor(self, response) -> types.Neighbor:
-        return conversions.fromVectorDbNeighbor(response)
+    def _respond_neighbor(
+        self,
+        response,
+        vector_format: types.VectorFormat = types.VectorFormat.LIST,
+    ) -> types.Neighbor:
+        return conversions.fromVectorDbNeighbor(response, vector_format)
+
+    def _respond_neighbors(
+        self,
+        responses,
+        result_format: types.SearchResultFormat,
+        vector_format: types.VectorFormat = types.VectorFormat.LIST,
+    ) -> Union[list[types.Neighbor], types.SearchResult]:
+        if self._raw_codec:
+            # The responses are serialized Neighbor messages.
+            if result_format == types.SearchResultFormat.NEIGHBORS:
+                return [
+                    codec.decode_neighbor(response, vector_format)
+                    for response in responses
+                ]
+            responses = [types_pb2.Neighbor.FromString(response) for response in responses]
+
+        if result_format == types.SearchResultFormat.ARRAYS:
+            return conversions.fromVectorDbNeighbors(responses)
+        if result_format == types.SearchResultFormat.LAZY_NEIGHBORS:
+            return [
+                types.LazyNeighbor(neighbor=response, vector_format=vector_format)
+                for response in responses
+            ]
+        return [
+            self._respond_neighbor(response, vector_format) for response in responses
+        ]
+
+    def _get_search_result_format(
+        self, result_format: Union[types.SearchResultFormat, str]
+    ) -> types.SearchResultFormat:
+        try:
+            return types.SearchResultFormat(result_format)
+        except ValueError:
+            raise types.AVSClientError(
+                message=f"invalid result_format {result_format!r}, expected one of "
+                + ", ".join(repr(f.value) for f in types.SearchResultFormat)
+            )
+
+    def _get_vector_format(
+        self, vector_format: Union[types.VectorFormat, str]
+    ) -> types.VectorFormat:
+        try:
+            return types.VectorFormat(vector_format)
+        except ValueError:
+            raise types.AVSClientError(
+                message=f"invalid vector_format {vector_format!r}, expected one of "
+                + ", ".join(repr(f.value) for f in types.VectorFormat)
+            )
 
     def _get_projection_spec(
         self,
@@ -348,7 +668,7 @@ class BaseClient(object):
         elif isinstance(key, int):
             key = types_pb2.Key(namespace=namespace, set=set, longValue=key)
         elif isinstance(key, (bytes, bytearray)):
-            key = types_pb2.Key(namespace=namespace, set=set, bytesValue=key)
+            key = types_pb2.Key(namespace=namespace, set=set, bytesValue=bytes(key))
         else:
             raise Exception("Invalid key type" + str(type(key)))
         return key
@@ -0,0 +1,555 @@
+"""
+Protobuf wire codec for the TransactService Put, Get and VectorSearch calls.
+
+Requests are encoded straight from the caller's Python and NumPy values, and
+responses are decoded straight into the client's result types, without
+building protobuf message objects. The encoders produce the same bytes as
+serializing the equivalent messages built by client_helpers, and the
+decoders return the same values as the conversions module.
+"""
+
+import struct
+import sys
+from typing import Any, Iterator, Optional, Tuple, Union
+
+import grpc
+import numpy as np
+
+from .. import types
+from . import conversions
+from .conversions import lengthDelimitedField
+from .proto_generated import transact_pb2
+
+
+_PUT_METHOD = "/aerospike.vector.TransactService/Put"
+_GET_METHOD = "/aerospike.vector.TransactService/Get"
+_VECTOR_SEARCH_METHOD = "/aerospike.vector.TransactService/VectorSearch"
+
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH_DELIMITED = 2
+_FIXED32 = 5
+
+
+def _tag(number: int, wire_type: int) -> bytes:
+    return bytes(((number << 3) | wire_type,))
+
+
+# Key
+_KEY_NAMESPACE = _tag(1, _LENGTH_DELIMITED)
+_KEY_SET = _tag(2, _LENGTH_DELIMITED)
+_KEY_STRING = _tag(3, _LENGTH_DELIMITED)
+_KEY_BYTES = _tag(4, _LENGTH_DELIMITED)
+_KEY_LONG = _tag(6, _VARINT)
+
+# Value and MapKey, which share field numbers 1 to 6
+_VALUE_STRING = _tag(1, _LENGTH_DELIMITED)
+_VALUE_BYTES = _tag(2, _LENGTH_DELIMITED)
+_VALUE_LONG = _tag(4, _VARINT)
+_VALUE_DOUBLE = _tag(6, _FIXED64)
+_VALUE_MAP = _tag(7, _LENGTH_DELIMITED)
+_VALUE_LIST = _tag(8, _LENGTH_DELIMITED)
+_VALUE_VECTOR = _tag(9, _LENGTH_DELIMITED)
+_VALUE_BOOLEAN = _tag(10, _VARINT)
+
+# Map, MapEntry, List and Field
+_ENTRIES = _tag(1, _LENGTH_DELIMITED)
+_ENTRY_KEY = _tag(1, _LENGTH_DELIMITED)
+_ENTRY_VALUE = _tag(2, _LENGTH_DELIMITED)
+_FIELD_NAME = _tag(1, _LENGTH_DELIMITED)
+_FIELD_VALUE = _tag(2, _LENGTH_DELIMITED)
+
+# PutRequest and GetRequest
+_REQUEST_KEY = _tag(1, _LENGTH_DELIMITED)
+_PUT_WRITE_TYPE = _tag(2, _VARINT)
+_PUT_FIELD = _tag(3, _LENGTH_DELIMITED)
+_PUT_IGNORE_MEM_QUEUE_FULL = _tag(4, _VARINT)
+_GET_PROJECTION = _tag(2, _LENGTH_DELIMITED)
+
+# ProjectionSpec and ProjectionFilter
+_PROJECTION_INCLUDE = _tag(1, _LENGTH_DELIMITED)
+_PROJECTION_EXCLUDE = _tag(2, _LENGTH_DELIMITED)
+_FILTER_TYPE = _tag(1, _VARINT)
+_FILTER_FIELD = _tag(2, _LENGTH_DELIMITED)
+
+# IndexId and VectorSearchRequest
+_INDEX_NAMESPACE = _tag(1, _LENGTH_DELIMITED)
+_INDEX_NAME = _tag(2, _LENGTH_DELIMITED)
+_SEARCH_INDEX = _tag(1, _LENGTH_DELIMITED)
+_SEARCH_QUERY = _tag(2, _LENGTH_DELIMITED)
+_SEARCH_LIMIT = _tag(3, _VARINT)
+_SEARCH_PROJECTION = _tag(4, _LENGTH_DELIMITED)
+_SEARCH_PARAMS = _tag(5, _LENGTH_DELIMITED)
+
+_FLOAT = struct.Struct("<f")
+_DOUBLE = struct.Struct("<d")
+
+
+class RawTransactStub(object):
+    """
+    TransactService stub whose Put, Get and VectorSearch calls send and receive serialized messages.
+
+    Without serializers, gRPC passes the request bytes through as they are and
+    returns the response bytes. Responses are decoded by the client, which
+    knows the vector format each call asked for.
+    """
+
+    def __init__(self, channel: Union[grpc.Channel, grpc.aio.Channel]) -> None:
+        self.Put = channel.unary_unary(
+            _PUT_METHOD, request_serializer=None, response_deserializer=None
+        )
+        self.Get = channel.unary_unary(
+            _GET_METHOD, request_serializer=None, response_deserializer=None
+        )
+        self.VectorSearch = channel.unary_stream(
+            _VECTOR_SEARCH_METHOD, request_serializer=None, response_deserializer=None
+        )
+
+
+def _varint(value: int) -> bytes:
+    if 0 <= value < 0x80:
+        return bytes((value,))
+    if value < 0:
+        # Negative integers are sent as their 64-bit two's complement.
+        value += 1 << 64
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _int64(value: int) -> bytes:
+    if not -(1 << 63) <= value < (1 << 63):
+        raise ValueError("Value out of range: %d" % value)
+    return _varint(value)
+
+
+def _uint32(value: int) -> bytes:
+    if not 0 <= value < (1 << 32):
+        raise ValueError("Value out of range: %d" % value)
+    return _varint(value)
+
+
+def _string_field(tag: bytes, value: str) -> bytes:
+    # proto3 leaves out strings without field presence when they are empty.
+    if not value:
+        return b""
+    return lengthDelimitedField(tag, value.encode("utf-8"))
+
+
+def _is_vector(value: Any) -> bool:
+    # Mirrors when toVectorDbValue produces a vectorValue.
+    if isinstance(value, np.ndarray):
+        return value.ndim == 1 and value.size > 0 and value.dtype.kind in "fb"
+    return (
+        isinstance(value, list) and len(value) > 0 and isinstance(value[0], (float, bool))
+    )
+
+
+def encode_key(
+    namespace: str,
+    set_name: Optional[str],
+    key: Union[int, str, bytes, bytearray, np.generic, np.ndarray],
+) -> bytes:
+    """
+    Encodes a Key message, like BaseClient._get_key.
+    """
+    if isinstance(key, np.ndarray):
+        key = key.tobytes()
+
+    if isinstance(key, np.generic):
+        key = key.item()
+
+    out = _string_field(_KEY_NAMESPACE, namespace)
+    if set_name is not None:
+        out += lengthDelimitedField(_KEY_SET, set_name.encode("utf-8"))
+
+    if isinstance(key, str):
+        return out + lengthDelimitedField(_KEY_STRING, key.encode("utf-8"))
+    elif isinstance(key, int):
+        return out + _KEY_LONG + _int64(key)
+    elif isinstance(key, (bytes, bytearray)):
+        return out + lengthDelimitedField(_KEY_BYTES, bytes(key))
+    else:
+        raise Exception("Invalid key type" + str(type(key)))
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Encodes a Value message, like conversions.toVectorDbValue.
+    """
+    if _is_vector(value):
+        return lengthDelimitedField(
+            _VALUE_VECTOR, conversions.toVectorDbVectorBytes(value)
+        )
+    elif isinstance(value, np.ndarray):
+        return encode_value(value.tolist())
+    elif isinstance(value, str):
+        return lengthDelimitedField(_VALUE_STRING, value.encode("utf-8"))
+    elif isinstance(value, bool):
+        return _VALUE_BOOLEAN + (b"\x01" if value else b"\x00")
+    elif isinstance(value, int):
+        return _VALUE_LONG + _int64(value)
+    elif isinstance(value, float):
+        return _VALUE_DOUBLE + _DOUBLE.pack(value)
+    elif isinstance(value, (bytes, bytearray)):
+        return lengthDelimitedField(_VALUE_BYTES, bytes(value))
+    elif isinstance(value, list) and value:
+        return lengthDelimitedField(
+            _VALUE_LIST,
+            b"".join(lengthDelimitedField(_ENTRIES, encode_value(x)) for x in value),
+        )
+    elif isinstance(value, dict):
+        return lengthDelimitedField(
+            _VALUE_MAP,
+            b"".join(
+                lengthDelimitedField(
+                    _ENTRIES,
+                    lengthDelimitedField(_ENTRY_KEY, encode_map_key(k))
+                    + lengthDelimitedField(_ENTRY_VALUE, encode_value(v)),
+                )
+                for k, v in value.items()
+            ),
+        )
+    else:
+        raise Exception("Invalid type " + str(type(value)))
+
+
+def encode_map_key(value: Any) -> bytes:
+    """
+    Encodes a MapKey message, like conversions.toMapKey.
+    """
+    if isinstance(value, str):
+        return lengthDelimitedField(_VALUE_STRING, value.encode("utf-8"))
+    elif isinstance(value, int):
+        return _VALUE_LONG + _int64(value)
+    elif isinstance(value, bytes):
+        # Unlike values, keys cannot be bytearrays, which are unhashable.
+        return lengthDelimitedField(_VALUE_BYTES, value)
+    elif isinstance(value, float):
+        return _VALUE_DOUBLE + _DOUBLE.pack(value)
+    else:
+        raise Exception("Invalid map key type " + str(type(value)))
+
+
+def encode_put_request(
+    key: bytes,
+    record_data: dict[str, Any],
+    write_type: int,
+    ignore_mem_queue_full: Optional[bool],
+) -> bytes:
+    """
+    Encodes a PutRequest message for an encoded key.
+    """
+    parts = [lengthDelimitedField(_REQUEST_KEY, key), _PUT_WRITE_TYPE + _varint(write_type)]
+    for name, value in record_data.items():
+        parts.append(
+            lengthDelimitedField(
+                _PUT_FIELD,
+                _string_field(_FIELD_NAME, name)
+                + lengthDelimitedField(_FIELD_VALUE, encode_value(value)),
+            )
+        )
+    if ignore_mem_queue_full:
+        parts.append(_PUT_IGNORE_MEM_QUEUE_FULL + b"\x01")
+    return b"".join(parts)
+
+
+def _encode_projection_filter(fields: Optional[list[str]], default_type: int) -> bytes:
+    if fields is None:
+        return _FILTER_TYPE + _varint(default_type)
+    return (
+        _FILTER_TYPE
+        + _varint(transact_pb2.ProjectionType.SPECIFIED)
+        + b"".join(
+            lengthDelimitedField(_FILTER_FIELD, field.encode("utf-8")) for field in fields
+        )
+    )
+
+
+def encode_projection(
+    include_fields: Optional[list[str]], exclude_fields: Optional[list[str]]
+) -> bytes:
+    """
+    Encodes a ProjectionSpec message, like BaseClient._get_projection_spec.
+    """
+    return lengthDelimitedField(
+        _PROJECTION_INCLUDE,
+        _encode_projection_filter(include_fields, transact_pb2.ProjectionType.ALL),
+    ) + lengthDelimitedField(
+        _PROJECTION_EXCLUDE,
+        _encode_projection_filter(exclude_fields, transact_pb2.ProjectionType.NONE),
+    )
+
+
+def encode_get_request(key: bytes, projection: bytes) -> bytes:
+    """
+    Encodes a GetRequest message for an encoded key and projection.
+    """
+    return lengthDelimitedField(_REQUEST_KEY, key) + lengthDelimitedField(
+        _GET_PROJECTION, projection
+    )
+
+
+def vector_search_request_parts(
+    namespace: str,
+    index_name: str,
+    limit: int,
+    search_params: Optional[types.HnswSearchParams],
+    projection: bytes,
+) -> Tuple[bytes, bytes]:
+    """
+    Encodes the fields of a VectorSearchRequest that come before and after the query vector.
+    """
+    head = lengthDelimitedField(
+        _SEARCH_INDEX,
+        _string_field(_INDEX_NAMESPACE, namespace) + _string_field(_INDEX_NAME, index_name),
+    )
+
+    tail = b""
+    if limit:
+        tail += _SEARCH_LIMIT + _uint32(limit)
+    tail += lengthDelimitedField(_SEARCH_PROJECTION, projection)
+    if search_params is not None:
+        tail += lengthDelimitedField(
+            _SEARCH_PARAMS, search_params._to_pb2().SerializeToString()
+        )
+    return (head, tail)
+
+
+def encode_vector_search_request(
+    head: bytes, query: Union[list[Union[bool, float]], np.ndarray], tail: bytes
+) -> bytes:
+    """
+    Encodes a VectorSearchRequest message from the parts returned by vector_search_request_parts.
+    """
+    return (
+        head
+        + lengthDelimitedField(_SEARCH_QUERY, conversions.toVectorDbVectorBytes(query))
+        + tail
+    )
+
+
+def request_key(request: bytes) -> bytes:
+    """
+    Returns the encoded Key of an encoded PutRequest or GetRequest.
+    """
+    for number, _, field in _fields(request):
+        if number == 1:
+            return field
+    return b""
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    try:
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return (result, pos)
+            shift += 7
+    except IndexError:
+        raise ValueError("truncated message")
+
+
+def _fields(data: bytes) -> Iterator[Tuple[int, int, Any]]:
+    # Yields the field number, wire type and value of each field of a
+    # serialized message. Varints are ints, every other value is bytes.
+    pos = 0
+    end = len(data)
+    while pos < end:
+        (tag, pos) = _read_varint(data, pos)
+        wire_type = tag & 7
+        if wire_type == _VARINT:
+            (value, pos) = _read_varint(data, pos)
+        elif wire_type == _LENGTH_DELIMITED:
+            (length, pos) = _read_varint(data, pos)
+            value = data[pos:pos + length]
+            pos += length
+        elif wire_type == _FIXED32:
+            value = data[pos:pos + 4]
+            pos += 4
+        elif wire_type == _FIXED64:
+            value = data[pos:pos + 8]
+            pos += 8
+        else:
+            raise ValueError("unsupported wire type %d" % wire_type)
+        if pos > end:
+            raise ValueError("truncated message")
+        yield (tag >> 3, wire_type, value)
+
+
+def _signed64(value: int) -> int:
+    value &= (1 << 64) - 1
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _signed32(value: int) -> int:
+    value &= (1 << 32) - 1
+    return value - (1 << 32) if value >= (1 << 31) else value
+
+
+def _bool_bytes(data: bytes) -> bytes:
+    # Packed bools are varints, one byte each unless an encoder padded them.
+    if not data or max(data) < 0x80:
+        return data
+    out = bytearray()
+    pos = 0
+    while pos < len(data):
+        (value, pos) = _read_varint(data, pos)
+        out.append(1 if value else 0)
+    return bytes(out)
+
+
+def _decode_vector(data: bytes, vector_format: types.VectorFormat) -> Any:
+    kind = None
+    chunks = []
+    for number, _, field in _fields(data):
+        if number not in (1, 2):
+            continue
+        if number != kind:
+            # A later member of the data oneof replaces an earlier one.
+            kind = number
+            chunks = []
+        for _, wire_type, value in _fields(field):
+            if wire_type == _LENGTH_DELIMITED:
+                chunks.append(value if kind == 2 else _bool_bytes(value))
+            elif wire_type == _VARINT:
+                chunks.append(b"\x01" if value else b"\x00")
+            else:
+                chunks.append(value)
+
+    if kind is None:
+        return None
+
+    if kind == 2:
+        array = np.frombuffer(b"".join(chunks), dtype="<f4")
+        if vector_format == types.VectorFormat.NUMPY:
+            return array.astype(np.float32)
+    else:
+        array = np.frombuffer(b"".join(chunks), dtype=np.uint8).astype(bool)
+        if vector_format == types.VectorFormat.NUMPY:
+            return array
+    return array.tolist()
+
+
+def _decode_map(data: bytes, vector_format: types.VectorFormat) -> dict:
+    result = {}
+    for number, _, entry in _fields(data):
+        if number != 1:
+            continue
+        key = None
+        value = None
+        for entry_number, _, field in _fields(entry):
+            # MapKey uses the field numbers of the matching Value members.
+            if entry_number == 1:
+                key = decode_value(field)
+            elif entry_number == 2:
+                value = decode_value(field, vector_format)
+        result[key] = value
+    return result
+
+
+def decode_value(
+    data: bytes, vector_format: types.VectorFormat = types.VectorFormat.LIST
+) -> Any:
+    """
+    Decodes a Value message, like conversions.fromVectorDbValue.
+    """
+    result = None
+    for number, _, field in _fields(data):
+        if number == 1:
+            result = field.decode("utf-8")
+        elif number == 2:
+            result = bytes(field)
+        elif number == 3:
+            result = _signed32(field)
+        elif number == 4:
+            result = _signed64(field)
+        elif number == 5:
+            result = _FLOAT.unpack(field)[0]
+        elif number == 6:
+            result = _DOUBLE.unpack(field)[0]
+        elif number == 7:
+            result = _decode_map(field, vector_format)
+        elif number == 8:
+            result = [
+                decode_value(entry, vector_format)
+                for entry_number, _, entry in _fields(field)
+                if entry_number == 1
+            ]
+        elif number == 9:
+            result = _decode_vector(field, vector_format)
+        elif number == 10:
+            result = field != 0
+    return result
+
+
+def decode_record(
+    data: bytes, vector_format: types.VectorFormat = types.VectorFormat.LIST
+) -> dict[str, Any]:
+    """
+    Decodes the fields of a Record message, like conversions.fromVectorDbRecord.
+    """
+    fields = {}
+    for number, _, field in _fields(data):
+        if number != 1:
+            continue
+        name = ""
+        value = None
+        for field_number, _, item in _fields(field):
+            if field_number == 1:
+                name = item.decode("utf-8")
+            elif field_number == 2:
+                value = decode_value(item, vector_format)
+        fields[name] = value
+    return fields
+
+
+def decode_key(data: bytes) -> types.Key:
+    """
+    Decodes a Key message, like conversions.fromVectorDbKey.
+    """
+    namespace = ""
+    set_name = ""
+    key = None
+    for number, _, field in _fields(data):
+        if number == 1:
+            namespace = field.decode("utf-8")
+        elif number == 2:
+            set_name = field.decode("utf-8")
+        elif number == 3:
+            key = field.decode("utf-8")
+        elif number == 4:
+            key = bytes(field)
+        elif number == 5:
+            key = _signed32(field)
+        elif number == 6:
+            key = _signed64(field)
+    return types.Key(namespace=sys.intern(namespace), set=sys.intern(set_name), key=key)
+
+
+def decode_neighbor(
+    data: bytes, vector_format: types.VectorFormat = types.VectorFormat.LIST
+) -> types.Neighbor:
+    """
+    Decodes a Neighbor message, like conversions.fromVectorDbNeighbor.
+    """
+    key = None
+    fields: dict[str, Any] = {}
+    distance = 0.0
+    for number, _, field in _fields(data):
+        if number == 1:
+            key = decode_key(field)
+        elif number == 2:
+            fields = decode_record(field, vector_format)
+        elif number == 3:
+            distance = _FLOAT.unpack(field)[0]
+    if key is None:
+        key = types.Key(namespace="", set="", key=None)
+    return types.Neighbor(key=key, fields=fields, distance=distance)
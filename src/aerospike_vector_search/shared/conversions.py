@@ -1,64 +1,203 @@
-from typing import Any
+import sys
+from typing import Any, Iterable
+
+import numpy as np
 
 from .. import types
 from .proto_generated import types_pb2, index_pb2
 from ..types import IndexStatusResponse
 
 
-def toVectorDbValue(value: Any) -> types_pb2.Value:
-    if isinstance(value, str):
-        return types_pb2.Value(stringValue=value)
-    elif isinstance(value, int):
-        return types_pb2.Value(longValue=value)
-    elif isinstance(value, float):
-        return types_pb2.Value(doubleValue=value)
-    elif isinstance(value, (bytes, bytearray)):
-        return types_pb2.Value(bytesValue=value)
-    elif isinstance(value, bool):
-        return types_pb2.Value(booleanValue=value)
+# Tag of field 1 (the "value" field of FloatData and BoolData) with the
+# length-delimited wire type used by packed repeated fields.
+_PACKED_VALUE_TAG = b"\x0a"
+
+# Tags of the boolData (field 1) and floatData (field 2) fields of Vector.
+_BOOL_DATA_TAG = b"\x0a"
+_FLOAT_DATA_TAG = b"\x12"
+
+
+def lengthDelimitedField(tag: bytes, payload: bytes) -> bytes:
+    """
+    Encodes payload as a length-delimited protobuf field: tag, varint length, payload.
+    """
+    header = bytearray(tag)
+    length = len(payload)
+    while length > 0x7F:
+        header.append((length & 0x7F) | 0x80)
+        length >>= 7
+    header.append(length)
+    return bytes(header) + payload
+
+
+def _packed_value_field(payload: bytes) -> bytes:
+    # Encode payload as the packed "value" field of FloatData or BoolData.
+    return lengthDelimitedField(_PACKED_VALUE_TAG, payload)
+
+
+def toVectorDbVectorBytes(value: Any) -> bytes:
+    """
+    Returns the serialized Vector message for a vector.
+
+    1-D float and bool numpy arrays, and lists that toVectorDbValue turns into
+    vectors, are encoded without building a protobuf message.
+    """
+    if isinstance(value, np.ndarray) and value.ndim == 1 and value.size:
+        if value.dtype.kind == "f":
+            # Like the protobuf float field, values too large for float32 become inf.
+            with np.errstate(over="ignore"):
+                data = np.ascontiguousarray(value, dtype="<f4").tobytes()
+            return lengthDelimitedField(_FLOAT_DATA_TAG, _packed_value_field(data))
+        elif value.dtype.kind == "b":
+            data = np.ascontiguousarray(value, dtype=np.uint8).tobytes()
+            return lengthDelimitedField(_BOOL_DATA_TAG, _packed_value_field(data))
     elif isinstance(value, list) and value:
-        # TODO: Convert every element correctly to destination type.
         if isinstance(value[0], float):
-            return types_pb2.Value(
-                vectorValue=types_pb2.Vector(
-                    floatData={"value": [float(x) for x in value]}
-                )
-            )
+            # Like the protobuf float field, values too large for float32 become inf.
+            with np.errstate(over="ignore"):
+                data = np.array([float(x) for x in value], dtype="<f4").tobytes()
+            return lengthDelimitedField(_FLOAT_DATA_TAG, _packed_value_field(data))
         elif isinstance(value[0], bool):
-            return types_pb2.Value(
-                vectorValue=types_pb2.Vector(
-                    boolData={"value": [True if x else False for x in value]}
-                )
-            )
-        else:
-            return types_pb2.Value(
-                listValue=types_pb2.List(entries=[toVectorDbValue(x) for x in value])
-            )
-    elif isinstance(value, dict):
-        d = types_pb2.Value(
-            mapValue=types_pb2.Map(
-                entries=[
-                    types_pb2.MapEntry(key=toMapKey(k), value=toVectorDbValue(v))
-                    for k, v in value.items()
-                ]
-            )
-        )
-        return d
+            data = bytes(1 if x else 0 for x in value)
+            return lengthDelimitedField(_BOOL_DATA_TAG, _packed_value_field(data))
+
+    return toVectorDbValue(value).vectorValue.SerializeToString()
+
+
+# Value members that hold a Python scalar of exactly this type.
+# Lists and map entries set these in place instead of going through the stack.
+_SCALAR_VALUE_FIELDS = {
+    str: "stringValue",
+    bool: "booleanValue",
+    int: "longValue",
+    float: "doubleValue",
+    bytes: "bytesValue",
+}
+
+# MapKey has no boolean member, so bool keys stay longValue.
+_MAP_KEY_FIELDS = {
+    str: "stringValue",
+    bool: "longValue",
+    int: "longValue",
+    float: "doubleValue",
+    bytes: "bytesValue",
+}
+
+
+def _subclassEntry(table: dict, cls: type, error: str) -> Any:
+    # Resolve a subclass (e.g. np.float64 or an IntEnum) through its bases
+    # and remember the result, so each type is only looked up once.
+    for base in cls.__mro__[1:]:
+        entry = table.get(base)
+        if entry is not None:
+            table[cls] = entry
+            return entry
+    raise Exception(error + str(cls))
+
+
+def _setMapKey(target: types_pb2.MapKey, value: Any) -> None:
+    field = _MAP_KEY_FIELDS.get(type(value))
+    if field is None:
+        field = _subclassEntry(_MAP_KEY_FIELDS, type(value), "Invalid map key type ")
+    setattr(target, field, value)
+
+
+def _scalarEncoder(field: str):
+    def encode(value: Any, target: types_pb2.Value, stack: list) -> None:
+        setattr(target, field, value)
+
+    return encode
+
+
+def _encodeBytearray(value: bytearray, target: types_pb2.Value, stack: list) -> None:
+    # Protobuf only accepts bytes.
+    target.bytesValue = bytes(value)
+
+
+def _encodeNdarray(value: np.ndarray, target: types_pb2.Value, stack: list) -> None:
+    if value.ndim == 1 and value.size and value.dtype.kind in "fb":
+        target.vectorValue.MergeFromString(toVectorDbVectorBytes(value))
     else:
+        stack.append((value.tolist(), target))
+
+
+def _encodeList(value: list, target: types_pb2.Value, stack: list) -> None:
+    if not value:
         raise Exception("Invalid type " + str(type(value)))
 
+    first = value[0]
+    if isinstance(first, (float, bool)):
+        # Float and bool lists are vectors, packed in one step.
+        target.vectorValue.MergeFromString(toVectorDbVectorBytes(value))
+        return
+
+    add = target.listValue.entries.add
+    cls = type(first)
+    field = _SCALAR_VALUE_FIELDS.get(cls)
+    if field is not None and all(type(x) is cls for x in value):
+        # Lists of one scalar type, like tags or ids, need no per element dispatch.
+        for x in value:
+            setattr(add(), field, x)
+        return
+
+    for x in value:
+        field = _SCALAR_VALUE_FIELDS.get(type(x))
+        if field is None:
+            stack.append((x, add()))
+        else:
+            setattr(add(), field, x)
+
+
+def _encodeMap(value: dict, target: types_pb2.Value, stack: list) -> None:
+    if not value:
+        target.mapValue.SetInParent()
+        return
+
+    add = target.mapValue.entries.add
+    for k, v in value.items():
+        entry = add()
+        _setMapKey(entry.key, k)
+        field = _SCALAR_VALUE_FIELDS.get(type(v))
+        if field is None:
+            stack.append((v, entry.value))
+        else:
+            setattr(entry.value, field, v)
+
+
+_VALUE_ENCODERS = {cls: _scalarEncoder(field) for cls, field in _SCALAR_VALUE_FIELDS.items()}
+_VALUE_ENCODERS[bytearray] = _encodeBytearray
+_VALUE_ENCODERS[np.ndarray] = _encodeNdarray
+_VALUE_ENCODERS[list] = _encodeList
+_VALUE_ENCODERS[dict] = _encodeMap
+
+
+def fillVectorDbValue(target: types_pb2.Value, value: Any) -> None:
+    """
+    Converts value into target, an empty Value that is usually part of a larger message.
+
+    Nested lists and maps are converted with an explicit stack rather than recursion,
+    and each nested Value is filled where it lives in its parent instead of being built
+    separately and copied in.
+    """
+    stack = [(value, target)]
+    while stack:
+        (value, target) = stack.pop()
+        encoder = _VALUE_ENCODERS.get(type(value))
+        if encoder is None:
+            encoder = _subclassEntry(_VALUE_ENCODERS, type(value), "Invalid type ")
+        encoder(value, target, stack)
+
+
+def toVectorDbValue(value: Any) -> types_pb2.Value:
+    result = types_pb2.Value()
+    fillVectorDbValue(result, value)
+    return result
+
 
 def toMapKey(value) -> types_pb2.MapKey:
-    if isinstance(value, str):
-        return types_pb2.MapKey(stringValue=value)
-    elif isinstance(value, int):
-        return types_pb2.MapKey(longValue=value)
-    elif isinstance(value, (bytes, bytearray)):
-        return types_pb2.MapKey(bytesValue=value)
-    elif isinstance(value, float):
-        return types_pb2.MapKey(doubleValue=value)
-    else:
-        raise Exception("Invalid map key type " + str(type(value)))
+    result = types_pb2.MapKey()
+    _setMapKey(result, value)
+    return result
 
 
 def fromVectorDbKey(key: types_pb2.Key) -> types.Key:
@@ -72,25 +211,143 @@ def fromVectorDbKey(key: types_pb2.Key) -> types.Key:
     elif key.HasField("bytesValue"):
         keyValue = key.bytesValue
 
-    return types.Key(namespace=key.namespace, set=key.set, key=keyValue)
+    # Interned, so the many keys decoded from one namespace and set share their names.
+    return types.Key(
+        namespace=sys.intern(key.namespace), set=sys.intern(key.set), key=keyValue
+    )
 
 
-def fromVectorDbRecord(record: types_pb2.Record) -> dict[str, Any]:
+def fromVectorDbRecord(
+    record: types_pb2.Record,
+    vector_format: types.VectorFormat = types.VectorFormat.LIST,
+) -> dict[str, Any]:
     fields = {}
     for field in record.fields:
-        fields[field.name] = fromVectorDbValue(field.value)
+        fields[field.name] = fromVectorDbValue(field.value, vector_format)
 
     return fields
 
 
-def fromVectorDbNeighbor(input_vectordb_neighbor: types_pb2.Neighbor) -> types.Neighbor:
+def fromVectorDbNeighbor(
+    input_vectordb_neighbor: types_pb2.Neighbor,
+    vector_format: types.VectorFormat = types.VectorFormat.LIST,
+) -> types.Neighbor:
     return types.Neighbor(
         key=fromVectorDbKey(input_vectordb_neighbor.key),
-        fields=fromVectorDbRecord(input_vectordb_neighbor.record),
+        fields=fromVectorDbRecord(input_vectordb_neighbor.record, vector_format),
         distance=input_vectordb_neighbor.distance,
     )
 
 
+def _packedValues(message, dtype: Any, item_size: int) -> np.ndarray:
+    # FloatData and BoolData serialize to a single packed "value" field:
+    # tag, varint length, then item_size bytes per element. Returns a
+    # read-only view of the elements in the serialized bytes.
+    data = message.SerializeToString()
+    count = len(message.value)
+    return np.frombuffer(
+        data, dtype=dtype, count=count, offset=len(data) - count * item_size
+    )
+
+
+def _vectorArray(vector: types_pb2.Vector) -> np.ndarray:
+    # Serializing copies the packed field out of the message, and the elements
+    # are then copied once into the returned array, with no Python object per element.
+    if vector.HasField("floatData"):
+        return _packedValues(vector.floatData, "<f4", 4).astype(np.float32)
+    return _packedValues(vector.boolData, np.uint8, 1).astype(bool)
+
+
+def _vectorColumn(values: list[types_pb2.Value]):
+    # Returns a 2-D array if every value is a vector of the same kind and length.
+    kind = values[0].vectorValue.WhichOneof("data")
+    if kind is None:
+        return None
+
+    dimensions = len(getattr(values[0].vectorValue, kind).value)
+    for value in values:
+        vector = value.vectorValue
+        if (
+            vector.WhichOneof("data") != kind
+            or len(getattr(vector, kind).value) != dimensions
+        ):
+            return None
+
+    if kind == "floatData":
+        (dtype, item_size, column_dtype) = ("<f4", 4, np.float32)
+    else:
+        (dtype, item_size, column_dtype) = (np.uint8, 1, bool)
+
+    # Each row is copied straight from its serialized field into the column.
+    column = np.empty((len(values), dimensions), dtype=column_dtype)
+    for (row, value) in enumerate(values):
+        column[row] = _packedValues(getattr(value.vectorValue, kind), dtype, item_size)
+    return column
+
+
+def _objectColumn(values: list) -> np.ndarray:
+    # Fill element by element so list values are not turned into extra dimensions.
+    column = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        column[i] = value
+    return column
+
+
+def _fieldColumn(values: list) -> np.ndarray:
+    if values and all(
+        value is not None and value.HasField("vectorValue") for value in values
+    ):
+        column = _vectorColumn(values)
+        if column is not None:
+            return column
+
+    python_values = [
+        None if value is None else fromVectorDbValue(value) for value in values
+    ]
+    if python_values and all(type(value) is int for value in python_values):
+        return np.array(python_values, dtype=np.int64)
+    if python_values and all(type(value) is float for value in python_values):
+        return np.array(python_values, dtype=np.float64)
+    return _objectColumn(python_values)
+
+
+def fromVectorDbNeighbors(
+    input_vectordb_neighbors: Iterable[types_pb2.Neighbor],
+) -> types.SearchResult:
+    """
+    Converts protobuf neighbors into a columnar SearchResult.
+
+    No Neighbor, Key or fields dict is created per hit.
+    Vector fields are decoded straight from their packed wire bytes.
+    """
+    key_values = []
+    distances = []
+    columns: dict[str, list] = {}
+
+    for row, neighbor in enumerate(input_vectordb_neighbors):
+        key_values.append(fromVectorDbKey(neighbor.key).key)
+        distances.append(neighbor.distance)
+        for field in neighbor.record.fields:
+            column = columns.get(field.name)
+            if column is None:
+                column = columns[field.name] = [None] * row
+            column.append(field.value)
+        for column in columns.values():
+            if len(column) <= row:
+                column.append(None)
+
+    if key_values and all(type(key) is int for key in key_values):
+        keys = np.array(key_values, dtype=np.int64)
+    else:
+        keys = _objectColumn(key_values)
+
+    return types.SearchResult(
+        keys=keys,
+        distances=np.array(distances, dtype=np.float32),
+        fields={name: _fieldColumn(values) for name, values in columns.items()},
+    )
+
+
 def fromIndexDefintion(input_data: types_pb2.IndexDefinition) -> types.IndexDefinition:
     return types.IndexDefinition(
         id=types.IndexId(
@@ -137,33 +394,86 @@ def fromIndexDefintion(input_data: types_pb2.IndexDefinition) -> types.IndexDefi
     )
 
 
-def fromVectorDbValue(input_vector: types_pb2.Value) -> Any:
-    if input_vector.HasField("stringValue"):
-        return input_vector.stringValue
-    elif input_vector.HasField("intValue"):
-        return input_vector.intValue
-    elif input_vector.HasField("longValue"):
-        return input_vector.longValue
-    elif input_vector.HasField("bytesValue"):
-        return input_vector.bytesValue
-    elif input_vector.HasField("mapValue"):
-        data = {}
-        for entry in input_vector.mapValue.entries:
-            k = fromVectorDbValue(entry.key)
-            v = fromVectorDbValue(entry.value)
-            data[k] = v
-        return data
-    elif input_vector.HasField("listValue"):
-        return [fromVectorDbValue(v) for v in input_vector.listValue.entries]
-    elif input_vector.HasField("vectorValue"):
-        vector = input_vector.vectorValue
-        if vector.HasField("floatData"):
-            return [v for v in vector.floatData.value]
-        if vector.HasField("boolData"):
-            return [v for v in vector.boolData.value]
+# Value and MapKey members that decode to their Python value as is.
+_SCALAR_VALUE_KINDS = frozenset(
+    (
+        "stringValue",
+        "intValue",
+        "longValue",
+        "bytesValue",
+        "floatValue",
+        "doubleValue",
+        "booleanValue",
+    )
+)
+
+
+def _fromVectorDbVector(
+    vector: types_pb2.Vector, vector_format: types.VectorFormat
+) -> Any:
+    kind = vector.WhichOneof("data")
+    if kind is None:
+        return None
+    if vector_format == types.VectorFormat.NUMPY:
+        return _vectorArray(vector)
+    return list(getattr(vector, kind).value)
 
+
+def _fromContainerValue(
+    value: types_pb2.Value, kind: str, vector_format: types.VectorFormat, stack: list
+) -> Any:
+    # Vectors are decoded right away. Lists and maps are returned empty and
+    # pushed onto the stack, so their entries are filled in by fromVectorDbValue.
+    if kind == "vectorValue":
+        return _fromVectorDbVector(value.vectorValue, vector_format)
+    elif kind == "listValue":
+        result = []
+        stack.append((value.listValue, result))
+        return result
+    elif kind == "mapValue":
+        result = {}
+        stack.append((value.mapValue, result))
+        return result
     return None
 
+
+def fromVectorDbValue(
+    input_vector: types_pb2.Value,
+    vector_format: types.VectorFormat = types.VectorFormat.LIST,
+) -> Any:
+    kind = input_vector.WhichOneof("value")
+    if kind in _SCALAR_VALUE_KINDS:
+        return getattr(input_vector, kind)
+
+    stack = []
+    result = _fromContainerValue(input_vector, kind, vector_format, stack)
+    while stack:
+        (message, container) = stack.pop()
+        if type(container) is list:
+            append = container.append
+            for entry in message.entries:
+                kind = entry.WhichOneof("value")
+                if kind in _SCALAR_VALUE_KINDS:
+                    append(getattr(entry, kind))
+                else:
+                    append(_fromContainerValue(entry, kind, vector_format, stack))
+        else:
+            for entry in message.entries:
+                key = entry.key
+                key_kind = key.WhichOneof("value")
+                key = None if key_kind is None else getattr(key, key_kind)
+                value = entry.value
+                kind = value.WhichOneof("value")
+                if kind in _SCALAR_VALUE_KINDS:
+                    container[key] = getattr(value, kind)
+                else:
+                    container[key] = _fromContainerValue(
+                        value, kind, vector_format, stack
+                    )
+
+    return result
+
+
 def fromStandAloneIndexMetricsResponse(response: index_pb2.StandaloneIndexMetrics) -> types.StandaloneIndexMetrics:
     """
     Converts a protobuf StandaloneIndexMetrics into a StandaloneIndexMetrics object.
@@ -25,11 +25,8 @@ def _create_index_status_request(namespace: str, name: str) -> index_pb2.IndexSt
     index_id = types_pb2.IndexId(namespace=namespace, name=name)
     return index_pb2.IndexStatusRequest(indexId=index_id)
 
-# TODO: In the future we should reuse service stubs
-# perhaps we can wrap the client's channel provider in a service stub provider
-# that caches the stubs
 def _create_index_service_stub(client) -> index_pb2_grpc.IndexServiceStub:
-    return index_pb2_grpc.IndexServiceStub(client._channel_provider.get_channel())
+    return client._channel_provider.get_stub(index_pb2_grpc.IndexServiceStub)
 
 def _prepare_wait_for_index_waiting(client, namespace: str, name: str, wait_interval: int) -> (
         Tuple)[index_pb2_grpc.IndexServiceStub, int, float, bool, int, index_pb2.IndexGetRequest]:
@@ -38,7 +35,7 @@ def _prepare_wait_for_index_waiting(client, namespace: str, name: str, wait_inte
     start_time = time.monotonic()
     consecutive_index_validations = 0
 
-    index_stub = index_pb2_grpc.IndexServiceStub(client._channel_provider.get_channel())
+    index_stub = client._channel_provider.get_stub(index_pb2_grpc.IndexServiceStub)
     index_id = types_pb2.IndexId(namespace=namespace, name=name)
     index_wait_request = index_pb2.IndexGetRequest(indexId=index_id)
     return (
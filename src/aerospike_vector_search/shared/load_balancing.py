@@ -0,0 +1,326 @@
+import itertools
+import random
+import threading
+import time
+from typing import Callable, Optional, Sequence, Union
+
+import grpc
+
+from .. import types
+
+# Weight of the newest sample in a node's latency moving average.
+LATENCY_EWMA_ALPHA: float = 0.3
+
+# Status codes that count against a node's health. Other errors come from the
+# request rather than the node.
+FAILURE_STATUS_CODES = frozenset(
+    (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED)
+)
+# Consecutive failed calls after which a node is ejected.
+EJECTION_CONSECUTIVE_FAILURES: int = 5
+# Seconds a node stays ejected. Doubles each time the node is ejected again
+# without recovering in between, up to EJECTION_MAX_TIME.
+EJECTION_BASE_TIME: float = 1.0
+EJECTION_MAX_TIME: float = 30.0
+# Successful probe calls after which an ejected node is fully back in.
+PROBE_SUCCESSES: int = 3
+# Seconds after which a probe that never completed is given up on, so a node
+# picked for a call that was never sent is probed again.
+PROBE_TIMEOUT: float = 30.0
+
+
+class NodeStats(object):
+    """
+    Load and health statistics for one node, updated by the node channel's interceptor.
+
+    After EJECTION_CONSECUTIVE_FAILURES failed calls in a row the node is
+    ejected: :meth:`available` is False until its ejection time has passed.
+    The node is then on probation and takes one call at a time, reserved with
+    :meth:`reserve` when the node is picked. The next call to start on the
+    node is the probe, and only its :meth:`record` ends the reservation. The
+    node is fully back in after PROBE_SUCCESSES successful probes, and
+    ejected again for twice as long if one fails.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.outstanding: int = 0
+        # Seconds. 0 until the first call completes, so new nodes get tried.
+        self.latency_ewma: float = 0.0
+        self.consecutive_failures: int = 0
+        # time.monotonic() value the ejection ends at, or 0 if not ejected
+        self.ejected_until: float = 0.0
+        self._ejections: int = 0
+        self._probe_successes: int = 0
+        # time.monotonic() value the probe in flight was reserved at, or 0 if none
+        self._probe_reserved_at: float = 0.0
+        # Identifies the current reservation, so a probe that outlived its
+        # reservation cannot end the next one.
+        self._probe_token: int = 0
+        self._probe_started: bool = False
+
+    def available(self) -> bool:
+        if not self.ejected_until:
+            return True
+        now = time.monotonic()
+        return (
+            now >= self.ejected_until
+            and self.outstanding == 0
+            and (
+                not self._probe_reserved_at
+                or now - self._probe_reserved_at >= PROBE_TIMEOUT
+            )
+        )
+
+    def reserve(self) -> bool:
+        # Called when the node is picked. Under probation, claims the single
+        # probe call, so concurrent pickers cannot all send to the node.
+        with self._lock:
+            if not self.ejected_until:
+                return True
+            if not self.available():
+                return False
+            self._probe_reserved_at = time.monotonic()
+            self._probe_token += 1
+            self._probe_started = False
+            return True
+
+    def record(self, failed: bool, probe: int = 0) -> None:
+        # probe is the value start() returned for the call.
+        with self._lock:
+            if probe and probe == self._probe_token:
+                self._probe_reserved_at = 0.0
+            if not failed:
+                self.consecutive_failures = 0
+                if self.ejected_until:
+                    self._probe_successes += 1
+                    if self._probe_successes >= PROBE_SUCCESSES:
+                        self.ejected_until = 0.0
+                        self._ejections = 0
+                return
+
+            self.consecutive_failures += 1
+            if self.ejected_until:
+                # Calls sent before the ejection may still be failing
+                if time.monotonic() >= self.ejected_until:
+                    self._eject()
+            elif self.consecutive_failures >= EJECTION_CONSECUTIVE_FAILURES:
+                self._eject()
+
+    def _eject(self) -> None:
+        self._ejections += 1
+        self.ejected_until = time.monotonic() + min(
+            EJECTION_BASE_TIME * 2 ** (self._ejections - 1), EJECTION_MAX_TIME
+        )
+        self._probe_successes = 0
+        self.consecutive_failures = 0
+
+    def start(self) -> tuple[float, int]:
+        # Returns the start time and, for the probe of a reservation, the
+        # reservation's token, or 0 for any other call.
+        with self._lock:
+            self.outstanding += 1
+            probe = 0
+            if self._probe_reserved_at and not self._probe_started:
+                self._probe_started = True
+                probe = self._probe_token
+        return (time.monotonic(), probe)
+
+    def release(self, probe: int) -> None:
+        # Ends the reservation of a probe that could not be sent.
+        with self._lock:
+            if probe and probe == self._probe_token:
+                self._probe_reserved_at = 0.0
+
+    def finish(self, started: float) -> None:
+        latency = time.monotonic() - started
+        with self._lock:
+            self.outstanding -= 1
+            if self.latency_ewma == 0.0:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma += LATENCY_EWMA_ALPHA * (latency - self.latency_ewma)
+
+
+class NodeStatsInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
+    """
+    Counts the calls outstanding on a node channel, measures their latency
+    and records whether they failed.
+
+    on_unavailable, if given, is called with the method of every call that
+    ends with UNAVAILABLE.
+    """
+
+    def __init__(
+        self,
+        stats: NodeStats,
+        on_unavailable: Optional[Callable[[Union[str, bytes]], None]] = None,
+    ) -> None:
+        self._stats = stats
+        self._on_unavailable = on_unavailable
+
+    def _track(self, continuation, client_call_details, request):
+        (started, probe) = self._stats.start()
+        try:
+            call = continuation(client_call_details, request)
+        except BaseException:
+            self._stats.finish(started)
+            self._stats.release(probe)
+            raise
+        call.add_done_callback(
+            lambda done: self._done(done, client_call_details, started, probe)
+        )
+        return call
+
+    def _done(self, call, client_call_details, started: float, probe: int) -> None:
+        self._stats.finish(started)
+        code = call.code()
+        self._stats.record(code in FAILURE_STATUS_CODES, probe)
+        if self._on_unavailable is not None and code == grpc.StatusCode.UNAVAILABLE:
+            self._on_unavailable(client_call_details.method)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return self._track(continuation, client_call_details, request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return self._track(continuation, client_call_details, request)
+
+
+class AsyncNodeStatsInterceptor(
+    grpc.aio.UnaryUnaryClientInterceptor, grpc.aio.UnaryStreamClientInterceptor
+):
+    """
+    Asyncio version of :class:`NodeStatsInterceptor`.
+    """
+
+    def __init__(
+        self,
+        stats: NodeStats,
+        on_unavailable: Optional[Callable[[Union[str, bytes]], None]] = None,
+    ) -> None:
+        self._stats = stats
+        self._on_unavailable = on_unavailable
+
+    async def _track(self, continuation, client_call_details, request):
+        (started, probe) = self._stats.start()
+        try:
+            call = await continuation(client_call_details, request)
+        except BaseException:
+            self._stats.finish(started)
+            self._stats.release(probe)
+            raise
+        call.add_done_callback(
+            lambda done: self._done(done, client_call_details, started, probe)
+        )
+        return call
+
+    def _done(self, call, client_call_details, started: float, probe: int) -> None:
+        self._stats.finish(started)
+        code = self._done_call_code(call)
+        if code is None:
+            self._stats.release(probe)
+            return
+        self._stats.record(code in FAILURE_STATUS_CODES, probe)
+        if self._on_unavailable is not None and code == grpc.StatusCode.UNAVAILABLE:
+            self._on_unavailable(client_call_details.method)
+
+    @staticmethod
+    def _done_call_code(call) -> Optional[grpc.StatusCode]:
+        # An aio call only exposes its status through a coroutine, but once
+        # the call is done that coroutine returns without suspending, so it
+        # is run in place instead of in a task per call.
+        coroutine = call.code()
+        try:
+            coroutine.send(None)
+        except StopIteration as stop:
+            return stop.value
+        coroutine.close()
+        return None
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        return await self._track(continuation, client_call_details, request)
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        return await self._track(continuation, client_call_details, request)
+
+
+class BalancingPolicy(object):
+    """
+    Chooses the node to send a request to. nodes is never empty and every
+    node has a ``stats`` attribute holding its :class:`NodeStats`.
+    """
+
+    def choose(self, nodes: Sequence):
+        raise NotImplementedError
+
+
+class RandomPolicy(BalancingPolicy):
+
+    def choose(self, nodes: Sequence):
+        return random.choice(nodes)
+
+
+class RoundRobinPolicy(BalancingPolicy):
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def choose(self, nodes: Sequence):
+        return nodes[next(self._counter) % len(nodes)]
+
+
+class LeastOutstandingPolicy(BalancingPolicy):
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def choose(self, nodes: Sequence):
+        # Start the scan at a rotating offset so ties are spread across nodes.
+        count = len(nodes)
+        offset = next(self._counter) % count
+        best = nodes[offset]
+        for i in range(1, count):
+            node = nodes[(offset + i) % count]
+            if node.stats.outstanding < best.stats.outstanding:
+                best = node
+        return best
+
+
+class LatencyEwmaPolicy(BalancingPolicy):
+
+    def choose(self, nodes: Sequence):
+        # Power of two choices: compare two random nodes instead of scanning
+        # all of them, which keeps a briefly fast node from drawing every request.
+        if len(nodes) == 1:
+            return nodes[0]
+
+        (first, second) = random.sample(nodes, 2)
+        if self._cost(second) < self._cost(first):
+            return second
+        return first
+
+    @staticmethod
+    def _cost(node) -> float:
+        return node.stats.latency_ewma * (node.stats.outstanding + 1)
+
+
+def create_balancing_policy(
+    policy: Union[types.LoadBalancingPolicy, str]
+) -> BalancingPolicy:
+    try:
+        policy = types.LoadBalancingPolicy(policy)
+    except ValueError:
+        raise types.AVSClientError(
+            message=f"invalid load_balancing_policy {policy!r}, expected one of "
+            + ", ".join(repr(p.value) for p in types.LoadBalancingPolicy)
+        )
+
+    if policy == types.LoadBalancingPolicy.RANDOM:
+        return RandomPolicy()
+    if policy == types.LoadBalancingPolicy.ROUND_ROBIN:
+        return RoundRobinPolicy()
+    if policy == types.LoadBalancingPolicy.LATENCY_EWMA:
+        return LatencyEwmaPolicy()
+    return LeastOutstandingPolicy()
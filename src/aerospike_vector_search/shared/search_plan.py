@@ -0,0 +1,102 @@
+from logging import Logger
+from typing import Any, Optional, Union
+
+import grpc
+import numpy as np
+
+from .. import types
+from . import codec
+from .client_helpers import _raise_closed
+from .proto_generated import types_pb2
+
+
+class VectorSearchBytesStub(object):
+    """
+    TransactService stub whose VectorSearch call sends an already serialized VectorSearchRequest.
+    """
+
+    def __init__(self, channel: Union[grpc.Channel, grpc.aio.Channel]) -> None:
+        # Without a request serializer, gRPC sends the request bytes as they are.
+        self.VectorSearch = channel.unary_stream(
+            "/aerospike.vector.TransactService/VectorSearch",
+            request_serializer=None,
+            response_deserializer=types_pb2.Neighbor.FromString,
+        )
+
+
+class BaseSearchPlan(object):
+    """
+    Everything a vector search sends, except the query vector, serialized once.
+
+    Each search places the encoded query vector between the fields serialized
+    before and after it, instead of building and serializing a new request message.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Any,
+        namespace: str,
+        index_name: str,
+        limit: int,
+        search_params: Optional[types.HnswSearchParams],
+        include_fields: Optional[list[str]],
+        exclude_fields: Optional[list[str]],
+        result_format: Union[types.SearchResultFormat, str],
+        vector_format: Union[types.VectorFormat, str],
+        logger: Logger,
+    ) -> None:
+        self._client = client
+        self._namespace = namespace
+        self._index_name = index_name
+        self._limit = limit
+        self._search_params = search_params
+        self._include_fields = include_fields
+        self._exclude_fields = exclude_fields
+        self._result_format = client._get_search_result_format(result_format)
+        self._vector_format = client._get_vector_format(vector_format)
+
+        logger.debug(
+            "Preparing vector search: namespace=%s, index_name=%s, limit=%s, search_params=%s, include_fields=%s, exclude_fields=%s",
+            namespace,
+            index_name,
+            limit,
+            search_params,
+            include_fields,
+            exclude_fields,
+        )
+
+        (self._head, self._tail) = codec.vector_search_request_parts(
+            namespace,
+            index_name,
+            limit,
+            search_params,
+            codec.encode_projection(include_fields, exclude_fields),
+        )
+
+    def _check_open(self) -> None:
+        # Closing the client only replaces its public methods, so a plan
+        # made before then checks for itself.
+        if self._client.closed:
+            _raise_closed()
+
+    def _request(self, query: Union[list[Union[bool, float]], np.ndarray]) -> bytes:
+        return codec.encode_vector_search_request(self._head, query, self._tail)
+
+    def _cache_lookup(self, query: Union[list[Union[bool, float]], np.ndarray]):
+        return self._client._search_cache.lookup(
+            self._namespace,
+            self._index_name,
+            query,
+            self._limit,
+            self._search_params,
+            self._include_fields,
+            self._exclude_fields,
+            self._result_format,
+            self._vector_format,
+        )
+
+    def _get_stub(self) -> Union[VectorSearchBytesStub, codec.RawTransactStub]:
+        if self._client._raw_codec:
+            return self._client._get_raw_transact_stub()
+        return self._client._channel_provider.get_stub(VectorSearchBytesStub)
@@ -2,7 +2,7 @@ import time
 import logging
 import threading
 import asyncio
-from typing import Optional, Union, Any, Dict
+from typing import Callable, Optional, Union, Any, Dict
 
 import jwt
 import grpc
@@ -136,8 +136,12 @@ class TokenManager:
         return auth_pb2.AuthRequest(credentials=self._credentials)
 
     # Synchronous methods
-    def refresh_token(self, auth_stub: auth_pb2_grpc.AuthServiceStub) -> None:
-        """Refresh the authentication token synchronously"""
+    def refresh_token(self, get_auth_stub: Callable[[], auth_pb2_grpc.AuthServiceStub]) -> None:
+        """
+        Refresh the authentication token synchronously.
+
+        get_auth_stub is called on every refresh, so each one uses a channel that is still open.
+        """
         if not self._credentials:
             logger.debug("Skipping token refresh - no credentials available")
             return
@@ -147,15 +151,15 @@ class TokenManager:
 
         try:
             logger.debug("Sending authentication request to server")
-            response = auth_stub.Authenticate(auth_request)
+            response = get_auth_stub().Authenticate(auth_request)
             logger.debug("Received authentication response from server")
             self._update_token(response.token)
-            self._schedule_token_refresh(auth_stub)
+            self._schedule_token_refresh(get_auth_stub)
         except grpc.RpcError as e:
             logger.error("Failed to refresh authentication token with error: %s", e)
             raise types.AVSServerError(rpc_error=e)
 
-    def _schedule_token_refresh(self, auth_stub: auth_pb2_grpc.AuthServiceStub) -> None:
+    def _schedule_token_refresh(self, get_auth_stub: Callable[[], auth_pb2_grpc.AuthServiceStub]) -> None:
         """Schedule the next token refresh"""
         if not self._is_async:
             logger.debug("Scheduling next synchronous token refresh")
@@ -168,15 +172,19 @@ class TokenManager:
                 self._auth_timer = threading.Timer(
                     refresh_time, 
                     self.refresh_token,
-                    args=[auth_stub]
+                    args=[get_auth_stub]
                 )
                 self._auth_timer.daemon = True
                 self._auth_timer.start()
                 logger.debug("Token refresh timer started")
 
     # Asynchronous methods
-    async def refresh_token_async(self, auth_stub: auth_pb2_grpc.AuthServiceStub) -> None:
-        """Refresh the authentication token asynchronously"""
+    async def refresh_token_async(self, get_auth_stub: Callable[[], auth_pb2_grpc.AuthServiceStub]) -> None:
+        """
+        Refresh the authentication token asynchronously.
+
+        get_auth_stub is called on every refresh, so each one uses a channel that is still open.
+        """
         if not self._credentials:
             logger.debug("Skipping async token refresh - no credentials available")
             return
@@ -186,15 +194,15 @@ class TokenManager:
 
         try:
             logger.debug("Sending async authentication request to server")
-            response = await auth_stub.Authenticate(auth_request)
+            response = await get_auth_stub().Authenticate(auth_request)
             logger.debug("Received async authentication response from server")
             self._update_token(response.token)
-            await self._schedule_token_refresh_async(auth_stub)
+            await self._schedule_token_refresh_async(get_auth_stub)
         except grpc.RpcError as e:
             logger.error("Failed to refresh authentication token asynchronously with error: %s", e)
             raise types.AVSServerError(rpc_error=e)
 
-    async def _schedule_token_refresh_async(self, auth_stub: auth_pb2_grpc.AuthServiceStub) -> None:
+    async def _schedule_token_refresh_async(self, get_auth_stub: Callable[[], auth_pb2_grpc.AuthServiceStub]) -> None:
         """Schedule the next token refresh asynchronously"""
         if self._is_async and self._async_auth_lock is not None:
             logger.debug("Scheduling next asynchronous token refresh")
@@ -205,20 +213,20 @@ class TokenManager:
                 refresh_time = self._get_next_refresh_time()
                 logger.debug("Creating new async refresh task for %.2f seconds", refresh_time)
                 self._auth_timer = asyncio.create_task(
-                    self._wait_and_refresh(refresh_time, auth_stub)
+                    self._wait_and_refresh(refresh_time, get_auth_stub)
                 )
                 logger.debug("Async token refresh task created")
         else:
             logger.error("Cannot schedule async refresh: not in async mode or async lock not configured")
             raise types.AVSClientError(message=f"Async lock not configured: is_async={self._is_async}, async_lock={self._async_auth_lock}")
 
-    async def _wait_and_refresh(self, wait_time: float, auth_stub: auth_pb2_grpc.AuthServiceStub) -> None:
+    async def _wait_and_refresh(self, wait_time: float, get_auth_stub: Callable[[], auth_pb2_grpc.AuthServiceStub]) -> None:
         """Wait for the specified time and then refresh the token"""
         try:
             logger.debug("Waiting %.2f seconds before refreshing token", wait_time)
             await asyncio.sleep(wait_time)
             logger.debug("Wait complete, starting token refresh")
-            await self.refresh_token_async(auth_stub)
+            await self.refresh_token_async(get_auth_stub)
         except asyncio.CancelledError:
             logger.debug("Token wait and refresh task cancelled")
 
@@ -1,6 +1,8 @@
 import enum
 from typing import Any, Optional
 
+import numpy as np
+
 from .shared.proto_generated import types_pb2
 
 ###########################
@@ -106,6 +108,63 @@ class IndexMode(_ProtoEnum):
     STANDALONE = types_pb2.IndexMode.STANDALONE
 
 
+class SearchResultFormat(enum.Enum):
+    """
+    Search result format.
+
+    This enumeration defines how vector search results are returned:
+
+    - **NEIGHBORS**: A list of :class:`Neighbor` objects, one per hit.
+    - **LAZY_NEIGHBORS**: A list of :class:`LazyNeighbor` objects, which decode their key and fields on first access.
+    - **ARRAYS**: A single :class:`SearchResult` holding one NumPy array per column.
+
+    The string values, for example ``"arrays"``, are accepted wherever a SearchResultFormat is expected.
+    """
+
+    NEIGHBORS = "neighbors"
+    LAZY_NEIGHBORS = "lazy_neighbors"
+    ARRAYS = "arrays"
+
+
+class VectorFormat(enum.Enum):
+    """
+    Vector field format.
+
+    This enumeration defines how vector fields of returned records are represented:
+
+    - **LIST**: A list of Python floats or bools.
+    - **NUMPY**: A 1-D NumPy array, float32 for float vectors and bool for bool vectors.
+      The array is decoded from the packed wire bytes in one copy, without a Python object per element.
+
+    The string values, for example ``"numpy"``, are accepted wherever a VectorFormat is expected.
+    """
+
+    LIST = "list"
+    NUMPY = "numpy"
+
+
+class LoadBalancingPolicy(enum.Enum):
+    """
+    Load balancing policy.
+
+    This enumeration defines how the client spreads requests across the discovered cluster nodes:
+
+    - **RANDOM**: Each request goes to a node chosen at random.
+    - **ROUND_ROBIN**: Requests go to the nodes in turn.
+    - **LEAST_OUTSTANDING**: Each request goes to the node with the fewest requests in flight from this client.
+    - **LATENCY_EWMA**: Two nodes are picked at random and the request goes to the one whose recent latency,
+      weighted by its requests in flight, is lower.
+
+    The string values, for example ``"round_robin"``, are accepted wherever a LoadBalancingPolicy is expected.
+    Load balancing does not apply when the client is created with is_loadbalancer=True.
+    """
+
+    RANDOM = "random"
+    ROUND_ROBIN = "round_robin"
+    LEAST_OUTSTANDING = "least_outstanding"
+    LATENCY_EWMA = "latency_ewma"
+
+
 ###########################
 #### DATA CLASSES #########
 ###########################
@@ -134,6 +193,9 @@ class Key(object):
     Represents a record key.
     Used in RecordWithKey.
 
+    Keys are immutable and hashable, so they can be used as dict keys and in sets.
+    Hashing a key raises TypeError if its key value is unhashable, such as a bytearray or np.ndarray.
+
     :param namespace (str): The namespace for the key.
     :type namespace: str
 
@@ -145,10 +207,22 @@ class Key(object):
 
     """
 
+    __slots__ = ("namespace", "set", "key")
+
     def __init__(self, *, namespace: str, set: str, key: Any) -> None:
-        self.namespace = namespace
-        self.set = set
-        self.key = key
+        _set_key_namespace(self, namespace)
+        _set_key_set(self, set)
+        _set_key_key(self, key)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Key is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Key is immutable")
+
+    def __reduce__(self):
+        # The default pickle state would be restored through __setattr__.
+        return (_new_key, (self.namespace, self.set, self.key))
 
     def __repr__(self) -> str:
         return (
@@ -173,6 +247,19 @@ class Key(object):
             and self.key == other.key
         )
 
+    def __hash__(self) -> int:
+        return hash((self.namespace, self.set, self.key))
+
+
+# Key blocks attribute assignment, so its slots are written through their descriptors.
+_set_key_namespace = Key.namespace.__set__
+_set_key_set = Key.set.__set__
+_set_key_key = Key.key.__set__
+
+
+def _new_key(namespace: str, set: str, key: Any) -> Key:
+    return Key(namespace=namespace, set=set, key=key)
+
 
 
 class RecordWithKey(object):
@@ -187,6 +274,8 @@ class RecordWithKey(object):
     :type fields: dict[str, Any]
     """
 
+    __slots__ = ("key", "fields")
+
     def __init__(self, *, key: Key, fields: dict[str, Any]) -> None:
         self.key = key
         self.fields = fields
@@ -212,7 +301,52 @@ class RecordWithKey(object):
         return "{{\n\t{},\n\tfields: {{\n{}\n\t}}\n}}".format(self.key, fields_info)
 
 
-class Neighbor(object):
+class _NeighborBase(object):
+    # What Neighbor and LazyNeighbor share. Each subclass declares the slots
+    # its key and fields live in.
+
+    __slots__ = ("distance",)
+
+    def __repr__(self) -> str:
+        return (
+            f"Neighbor(key={self.key}, "
+            f"fields={self.fields}, "
+            f"distance={self.distance})"
+        )
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the neighboring record.
+        """
+        fields_info = ""
+        for key, value in self.fields.items():
+            if isinstance(value, list):
+                if len(value) > 4:
+                    value_str = (
+                        "[\n"
+                        + ",\n".join("\t\t\t{}".format(val) for val in value[:3])
+                        + ",\n\t\t\t...\n\t\t]"
+                    )
+                else:
+                    value_str = str(value)
+            else:
+                value_str = str(value)
+            fields_info += "\n\t\t{}: {}".format(key, value_str)
+        return "{{\n\t{},\n\tdistance: {},\n\tfields: {{\n{}\n\t}}\n}}".format(
+            self.key, self.distance, fields_info
+        )
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, _NeighborBase):
+            return NotImplemented
+        return (
+            self.distance == other.distance
+            and self.key == other.key
+            and self.fields == other.fields
+        )
+
+
+class Neighbor(_NeighborBase):
     """
     Represents a neighboring record in the context of approximate nearest neighbor search.
 
@@ -237,47 +371,169 @@ class Neighbor(object):
 
     """
 
+    __slots__ = ("key", "fields")
+
     def __init__(self, *, key: Key, fields: dict[str, Any], distance: float) -> None:
         self.key = key
         self.fields = fields
         self.distance = distance
 
+
+class LazyNeighbor(_NeighborBase):
+    """
+    Behaves like a :class:`Neighbor`, but decodes its key and fields from the search response on first access.
+
+    Returned by vector search calls when result_format is :attr:`SearchResultFormat.LAZY_NEIGHBORS`.
+    The distance is read when the neighbor is created. Callers that filter or truncate results
+    by distance never pay for decoding the fields of the neighbors they drop.
+
+    :param neighbor: The neighbor message received from the server.
+    :type neighbor: types_pb2.Neighbor
+
+    :param vector_format: How vector fields are decoded. Defaults to VectorFormat.LIST.
+    :type vector_format: VectorFormat
+    """
+
+    __slots__ = ("_neighbor", "_vector_format", "_key", "_fields")
+
+    def __init__(
+        self,
+        *,
+        neighbor: types_pb2.Neighbor,
+        vector_format: VectorFormat = VectorFormat.LIST,
+    ) -> None:
+        self._neighbor = neighbor
+        self._vector_format = vector_format
+        self._key: Optional[Key] = None
+        self._fields: Optional[dict[str, Any]] = None
+        self.distance = neighbor.distance
+
+    @property
+    def key(self) -> Key:
+        if self._key is None:
+            from .shared.conversions import fromVectorDbKey
+
+            self._key = fromVectorDbKey(self._neighbor.key)
+        return self._key
+
+    @key.setter
+    def key(self, value: Key) -> None:
+        self._key = value
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        if self._fields is None:
+            from .shared.conversions import fromVectorDbRecord
+
+            self._fields = fromVectorDbRecord(
+                self._neighbor.record, self._vector_format
+            )
+        return self._fields
+
+    @fields.setter
+    def fields(self, value: dict[str, Any]) -> None:
+        self._fields = value
+
+
+class SearchResult(object):
+    """
+    Represents the results of a vector search in columnar form.
+
+    Returned by vector search calls when result_format is :attr:`SearchResultFormat.ARRAYS`.
+    Row i of every column describes the i-th closest neighbor.
+
+    :param keys: The user keys of the neighbors. The dtype is int64 when every key is an integer, otherwise object.
+    :type keys: np.ndarray
+
+    :param distances: The distance from the query to each neighbor.
+    :type distances: np.ndarray
+
+    :param fields: One array per returned field. Vector fields are 2-dimensional arrays of shape
+        (neighbors, dimensions), float32 for float vectors and bool for bool vectors.
+        Scalar fields are int64, float64 or object arrays. Rows for neighbors that do not have a field hold None.
+    :type fields: dict[str, np.ndarray]
+    """
+
+    def __init__(
+        self,
+        *,
+        keys: np.ndarray,
+        distances: np.ndarray,
+        fields: Optional[dict[str, np.ndarray]] = None,
+    ) -> None:
+        self.keys = keys
+        self.distances = distances
+        self.fields = fields if fields is not None else {}
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
     def __repr__(self) -> str:
         return (
-            f"Neighbor(key={self.key}, "
-            f"fields={self.fields}, "
-            f"distance={self.distance})"
+            f"SearchResult(keys={self.keys!r}, "
+            f"distances={self.distances!r}, "
+            f"fields={self.fields!r})"
         )
 
-    def __str__(self) -> str:
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SearchResult):
+            return NotImplemented
+        return (
+            np.array_equal(self.keys, other.keys)
+            and np.array_equal(self.distances, other.distances)
+            and self.fields.keys() == other.fields.keys()
+            and all(
+                np.array_equal(column, other.fields[name])
+                for name, column in self.fields.items()
+            )
+        )
+
+
+class BatchRecordResult(object):
+    """
+    Represents the outcome of a single record operation within a batch call,
+    such as :meth:`Client.upsert_many <aerospike_vector_search.Client.upsert_many>`.
+
+    Batch calls do not stop at the first failed record. Instead, each record gets
+    a BatchRecordResult, in the same order as the input, that holds either the
+    operation's result or the error it raised.
+
+    :param key: The key of the record the operation was performed on.
+    :type key: Union[int, str, bytes, bytearray, np.generic, np.ndarray]
+
+    :param result: The value returned by the operation, if any. Defaults to None.
+    :type result: Any
+
+    :param error: The error raised by the operation, or None if the operation succeeded. Defaults to None.
+    :type error: Optional[AVSError]
+    """
+
+    def __init__(self, *, key: Any, result: Any = None, error: Optional["AVSError"] = None) -> None:
+        self.key = key
+        self.result = result
+        self.error = error
+
+    @property
+    def success(self) -> bool:
         """
-        Returns a string representation of the neighboring record.
+        True if the operation on this record succeeded, False otherwise.
         """
-        fields_info = ""
-        for key, value in self.fields.items():
-            if isinstance(value, list):
-                if len(value) > 4:
-                    value_str = (
-                        "[\n"
-                        + ",\n".join("\t\t\t{}".format(val) for val in value[:3])
-                        + ",\n\t\t\t...\n\t\t]"
-                    )
-                else:
-                    value_str = str(value)
-            else:
-                value_str = str(value)
-            fields_info += "\n\t\t{}: {}".format(key, value_str)
-        return "{{\n\t{},\n\tdistance: {},\n\tfields: {{\n{}\n\t}}\n}}".format(
-            self.key, self.distance, fields_info
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchRecordResult(key={self.key}, "
+            f"result={self.result}, "
+            f"error={self.error})"
         )
-    
+
     def __eq__(self, other) -> bool:
-        if not isinstance(other, Neighbor):
+        if not isinstance(other, BatchRecordResult):
             return NotImplemented
         return (
-            self.distance == other.distance
-            and self.key == other.key
-            and self.fields == other.fields
+            self.key == other.key
+            and self.result == other.result
+            and self.error == other.error
         )
 
 
@@ -1219,3 +1475,283 @@ class IndexStatusResponse:
                 f"index_healer_vertices_valid={self.index_healer_vertices_valid}, "
                 f"standalone_metrics={self.standalone_metrics!r}, " 
                 f"readiness={self.readiness!r})")
+
+
+class BulkLoadStats:
+    """
+    Throughput and error statistics for a :class:`BulkLoader <aerospike_vector_search.BulkLoader>` run.
+
+    Attributes:
+    -----------
+    records_written : int
+        The number of records written successfully.
+
+    records_failed : int
+        The number of records that could not be written, including records that exhausted their retries.
+
+    retries : int
+        The number of write attempts that were retried after the server signalled backpressure.
+
+    backpressure_events : int
+        The number of times the loader reduced its concurrency in response to backpressure.
+
+    in_flight_limit : int
+        The concurrency limit the loader had settled on when these statistics were taken.
+
+    elapsed : float
+        Wall clock time in seconds spent loading.
+
+    errors : dict[str, int]
+        The number of failed write attempts, keyed by gRPC status code name.
+
+    failures : list[BatchRecordResult]
+        The result of every record that could not be written.
+    """
+
+    def __init__(
+            self,
+            *,
+            records_written: int = 0,
+            records_failed: int = 0,
+            retries: int = 0,
+            backpressure_events: int = 0,
+            in_flight_limit: int = 0,
+            elapsed: float = 0.0,
+            errors: Optional[dict[str, int]] = None,
+            failures: Optional[list[BatchRecordResult]] = None,
+        ) -> None:
+        self.records_written = records_written
+        self.records_failed = records_failed
+        self.retries = retries
+        self.backpressure_events = backpressure_events
+        self.in_flight_limit = in_flight_limit
+        self.elapsed = elapsed
+        self.errors = errors if errors is not None else {}
+        self.failures = failures if failures is not None else []
+
+    @property
+    def throughput(self) -> float:
+        """
+        Records written per second.
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return self.records_written / self.elapsed
+
+    def __str__(self) -> str:
+        return (f"BulkLoadStats("
+                f"records_written={self.records_written}, "
+                f"records_failed={self.records_failed}, "
+                f"retries={self.retries}, "
+                f"backpressure_events={self.backpressure_events}, "
+                f"in_flight_limit={self.in_flight_limit}, "
+                f"elapsed={self.elapsed:.3f}, "
+                f"throughput={self.throughput:.1f}, "
+                f"errors={self.errors})")
+
+    def __repr__(self) -> str:
+        return (f"BulkLoadStats(records_written={self.records_written!r}, "
+                f"records_failed={self.records_failed!r}, "
+                f"retries={self.retries!r}, "
+                f"backpressure_events={self.backpressure_events!r}, "
+                f"in_flight_limit={self.in_flight_limit!r}, "
+                f"elapsed={self.elapsed!r}, "
+                f"errors={self.errors!r}, "
+                f"failures={self.failures!r})")
+
+
+class CacheConfig(object):
+    """
+    Configures a client-side cache.
+
+    Caches are opt-in. Entries are evicted least recently used first once max_entries is reached,
+    and expire ttl seconds after they were stored.
+
+    :param max_entries: The maximum number of entries held by the cache. Defaults to 10000.
+    :type max_entries: int
+
+    :param ttl: Time in seconds an entry stays valid after it is stored. If None, entries only leave the cache
+        when they are evicted or invalidated. Defaults to 60.
+    :type ttl: Optional[float]
+    """
+
+    def __init__(self, *, max_entries: int = 10_000, ttl: Optional[float] = 60.0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+    def __repr__(self) -> str:
+        return f"CacheConfig(max_entries={self.max_entries!r}, ttl={self.ttl!r})"
+
+
+class SearchCacheConfig(CacheConfig):
+    """
+    Configures the client-side vector search result cache.
+
+    Results are cached per index, query vector, limit, search parameters, projection and result format.
+    Every write this client makes to a namespace drops the cached searches for that namespace.
+
+    :param max_entries: The maximum number of search results held by the cache. Defaults to 10000.
+    :type max_entries: int
+
+    :param ttl: Time in seconds a search result stays valid after it is stored. If None, entries only leave the cache
+        when they are evicted or invalidated. Defaults to 60.
+    :type ttl: Optional[float]
+
+    :param quantization: If set, each query vector component is rounded to the nearest multiple of quantization
+        before it is hashed, so queries that differ only by small float jitter share a cache entry.
+        If None, only identical query vectors share an entry. Defaults to None.
+    :type quantization: Optional[float]
+    """
+
+    def __init__(
+            self,
+            *,
+            max_entries: int = 10_000,
+            ttl: Optional[float] = 60.0,
+            quantization: Optional[float] = None,
+        ) -> None:
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self.quantization = quantization
+
+    def __repr__(self) -> str:
+        return (f"SearchCacheConfig(max_entries={self.max_entries!r}, "
+                f"ttl={self.ttl!r}, "
+                f"quantization={self.quantization!r})")
+
+
+class CacheStats(object):
+    """
+    Statistics for a client-side cache.
+
+    Attributes
+    ----------
+    hits : int
+        The number of lookups answered from the cache.
+
+    misses : int
+        The number of lookups that had to go to the server.
+
+    evictions : int
+        The number of entries dropped to stay within max_entries.
+
+    expirations : int
+        The number of entries dropped because their ttl passed.
+
+    invalidations : int
+        The number of entries dropped because the client wrote to the data they were derived from.
+
+    size : int
+        The number of entries in the cache when these statistics were taken.
+    """
+
+    def __init__(
+            self,
+            *,
+            hits: int = 0,
+            misses: int = 0,
+            evictions: int = 0,
+            expirations: int = 0,
+            invalidations: int = 0,
+            size: int = 0,
+        ) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.expirations = expirations
+        self.invalidations = invalidations
+        self.size = size
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        The fraction of lookups answered from the cache.
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def __repr__(self) -> str:
+        return (f"CacheStats(hits={self.hits!r}, "
+                f"misses={self.misses!r}, "
+                f"evictions={self.evictions!r}, "
+                f"expirations={self.expirations!r}, "
+                f"invalidations={self.invalidations!r}, "
+                f"size={self.size!r})")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CacheStats):
+            return NotImplemented
+        return (
+            self.hits == other.hits
+            and self.misses == other.misses
+            and self.evictions == other.evictions
+            and self.expirations == other.expirations
+            and self.invalidations == other.invalidations
+            and self.size == other.size
+        )
+
+
+class ChannelOptions(object):
+    """
+    Configures the gRPC channels the client opens to seed and cluster nodes.
+
+    Options left as None keep the gRPC default.
+
+    :param keepalive_time: Seconds between keepalive pings on a connection. Set this below the idle
+        timeout of any load balancer or proxy between the client and AVS so idle connections are not dropped.
+    :type keepalive_time: Optional[float]
+
+    :param keepalive_timeout: Seconds to wait for a keepalive ping to be acknowledged before the connection is closed.
+    :type keepalive_timeout: Optional[float]
+
+    :param keepalive_permit_without_calls: If True, keepalive pings are also sent while no call is in flight.
+    :type keepalive_permit_without_calls: Optional[bool]
+
+    :param initial_window_size: The HTTP/2 flow control window, in bytes, each call starts with.
+    :type initial_window_size: Optional[int]
+
+    :param bdp_probe: If True, gRPC grows the flow control window to match the measured bandwidth-delay product.
+    :type bdp_probe: Optional[bool]
+
+    :param max_send_message_length: The largest request, in bytes, the client sends. -1 means no limit.
+    :type max_send_message_length: Optional[int]
+
+    :param max_receive_message_length: The largest response, in bytes, the client accepts. -1 means no limit.
+        Raise this for searches with a large limit that return vectors, which can exceed the 4 MB default.
+    :type max_receive_message_length: Optional[int]
+
+    :param gzip_compression: If True, every call's request is compressed with gzip. Defaults to False.
+    :type gzip_compression: bool
+    """
+
+    def __init__(
+            self,
+            *,
+            keepalive_time: Optional[float] = None,
+            keepalive_timeout: Optional[float] = None,
+            keepalive_permit_without_calls: Optional[bool] = None,
+            initial_window_size: Optional[int] = None,
+            bdp_probe: Optional[bool] = None,
+            max_send_message_length: Optional[int] = None,
+            max_receive_message_length: Optional[int] = None,
+            gzip_compression: bool = False,
+        ) -> None:
+        self.keepalive_time = keepalive_time
+        self.keepalive_timeout = keepalive_timeout
+        self.keepalive_permit_without_calls = keepalive_permit_without_calls
+        self.initial_window_size = initial_window_size
+        self.bdp_probe = bdp_probe
+        self.max_send_message_length = max_send_message_length
+        self.max_receive_message_length = max_receive_message_length
+        self.gzip_compression = gzip_compression
+
+    def __repr__(self) -> str:
+        return (f"ChannelOptions(keepalive_time={self.keepalive_time!r}, "
+                f"keepalive_timeout={self.keepalive_timeout!r}, "
+                f"keepalive_permit_without_calls={self.keepalive_permit_without_calls!r}, "
+                f"initial_window_size={self.initial_window_size!r}, "
+                f"bdp_probe={self.bdp_probe!r}, "
+                f"max_send_message_length={self.max_send_message_length!r}, "
+                f"max_receive_message_length={self.max_receive_message_length!r}, "
+                f"gzip_compression={self.gzip_compression!r})")
@@ -0,0 +1,69 @@
+"""
+Microbenchmarks for the record value conversions.
+
+Times toVectorDbValue and fromVectorDbValue on metadata records shaped like
+typical payloads, with 20 to 200 fields of strings, numbers, flags, tag lists
+and small nested maps next to one embedding.
+
+Run from the repository root:
+
+    PYTHONPATH=src python tests/benchmarks/bench_conversions.py
+"""
+
+import random
+import timeit
+
+import numpy as np
+
+from aerospike_vector_search.shared import conversions
+
+
+FIELD_COUNTS = (20, 50, 100, 200)
+REPEAT = 5
+
+
+def metadata_record(field_count: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    record = {"embedding": np.random.default_rng(seed).random(768, dtype=np.float32)}
+    for i in range(field_count):
+        kind = i % 6
+        if kind == 0:
+            value = "value-%d" % rng.randrange(10**6)
+        elif kind == 1:
+            value = rng.randrange(-(2**40), 2**40)
+        elif kind == 2:
+            value = rng.random() * 1000
+        elif kind == 3:
+            value = rng.random() < 0.5
+        elif kind == 4:
+            value = ["tag-%d" % rng.randrange(100) for _ in range(rng.randrange(1, 12))]
+        else:
+            value = {
+                "source": "crawler-%d" % rng.randrange(8),
+                "score": rng.random(),
+                "ids": [rng.randrange(10**9) for _ in range(4)],
+            }
+        record["field_%d" % i] = value
+    return record
+
+
+def best_time(function, number: int) -> float:
+    # Best of REPEAT runs, in microseconds per call.
+    return min(timeit.repeat(function, number=number, repeat=REPEAT)) / number * 1e6
+
+
+def main() -> None:
+    print("%8s %14s %14s" % ("fields", "encode (us)", "decode (us)"))
+    for field_count in FIELD_COUNTS:
+        record = metadata_record(field_count)
+        value = conversions.toVectorDbValue(record)
+        number = max(20, 20000 // field_count)
+
+        encode = best_time(lambda: conversions.toVectorDbValue(record), number)
+        decode = best_time(lambda: conversions.fromVectorDbValue(value), number)
+
+        print("%8d %14.1f %14.1f" % (field_count, encode, decode))
+
+
+if __name__ == "__main__":
+    main()
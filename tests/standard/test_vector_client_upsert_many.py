@@ -0,0 +1,50 @@
+import pytest
+
+import numpy as np
+
+from utils import DEFAULT_NAMESPACE
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 16])
+def test_vector_upsert_many(session_vector_client, max_in_flight):
+    records = [
+        (f"upsert_many_{i}", {"vector": np.array([float(i)] * 16, dtype=np.float32), "num": i})
+        for i in range(50)
+    ]
+
+    results = session_vector_client.upsert_many(
+        namespace=DEFAULT_NAMESPACE,
+        records=records,
+        max_in_flight=max_in_flight,
+    )
+
+    assert len(results) == len(records)
+    for result, (key, _) in zip(results, records):
+        assert result.key == key
+        assert result.success
+
+    for key, record_data in records:
+        rec = session_vector_client.get(namespace=DEFAULT_NAMESPACE, key=key)
+        assert rec.fields["num"] == record_data["num"]
+        session_vector_client.delete(namespace=DEFAULT_NAMESPACE, key=key)
+
+
+def test_vector_insert_many_existing_record(session_vector_client, record):
+    results = session_vector_client.insert_many(
+        namespace=DEFAULT_NAMESPACE,
+        records=[(record, {"num": 1})],
+    )
+
+    assert len(results) == 1
+    assert not results[0].success
+    assert results[0].error is not None
+
+
+def test_vector_update_many_missing_record(session_vector_client):
+    results = session_vector_client.update_many(
+        namespace=DEFAULT_NAMESPACE,
+        records=[("update_many_missing_key", {"num": 1})],
+    )
+
+    assert len(results) == 1
+    assert not results[0].success
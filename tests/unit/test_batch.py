@@ -0,0 +1,562 @@
+import pytest
+from unittest.mock import MagicMock
+
+import grpc
+import numpy as np
+
+from aerospike_vector_search import Client, types
+from aerospike_vector_search.shared.proto_generated import transact_pb2, types_pb2
+
+
+class FakeRpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+class FakeFuture:
+    def __init__(self, stub, error=None):
+        self._stub = stub
+        self._error = error
+
+    def result(self):
+        self._stub.outstanding -= 1
+        if self._error:
+            raise self._error
+
+    def cancel(self):
+        pass
+
+
+class FakeTransactStub:
+    def __init__(self, fail_keys=()):
+        self.fail_keys = fail_keys
+        self.outstanding = 0
+        self.max_outstanding = 0
+        self.Put = MagicMock()
+        self.Put.future.side_effect = self._put_future
+
+    def _put_future(self, request, **kwargs):
+        self.outstanding += 1
+        self.max_outstanding = max(self.max_outstanding, self.outstanding)
+        error = None
+        if request.key.stringValue in self.fail_keys:
+            error = FakeRpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        return FakeFuture(self, error=error)
+
+
+def new_client(stub, record_cache=None, search_cache=None):
+    client = Client.__new__(Client)
+    client._channel_provider = MagicMock()
+    client._channel_provider.get_token.return_value = None
+    client._get_transact_stub = lambda: stub
+    client._record_cache = client._prepare_record_cache(record_cache)
+    client._search_cache = client._prepare_search_cache(search_cache)
+    client.closed = False
+    return client
+
+
+def test_upsert_many_reports_per_record_results_in_order():
+    stub = FakeTransactStub(fail_keys=("k2",))
+    client = new_client(stub)
+
+    records = [(f"k{i}", {"vector": [float(i)] * 4}) for i in range(6)]
+    results = client.upsert_many(namespace="test", records=iter(records), max_in_flight=2)
+
+    assert [r.key for r in results] == [key for key, _ in records]
+    assert [r.success for r in results] == [True, True, False, True, True, True]
+    assert isinstance(results[2].error, types.AVSServerError)
+    assert results[2].error.rpc_error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    assert stub.max_outstanding == 2
+    assert stub.Put.future.call_count == 6
+
+
+def test_upsert_many_reports_invalid_records_without_sending():
+    stub = FakeTransactStub()
+    client = new_client(stub)
+
+    records = [("k0", {"vector": [1.0]}), ("k1", {"bad": object()}), ("k2", {"vector": [2.0]})]
+    results = client.upsert_many(namespace="test", records=records)
+
+    assert [r.success for r in results] == [True, False, True]
+    assert isinstance(results[1].error, types.AVSClientError)
+    assert stub.Put.future.call_count == 2
+
+
+def test_insert_many_uses_insert_only_write_type():
+    stub = FakeTransactStub()
+    client = new_client(stub)
+
+    client.insert_many(namespace="test", records=[("k0", {"a": 1})])
+
+    request = stub.Put.future.call_args[0][0]
+    assert request.writeType == 2  # INSERT_ONLY
+
+
+def test_upsert_many_invalid_max_in_flight():
+    client = new_client(FakeTransactStub())
+
+    with pytest.raises(types.AVSClientError):
+        client.upsert_many(namespace="test", records=[], max_in_flight=0)
+
+
+def test_vector_search_arrays_result_format():
+    stub = MagicMock()
+    stub.VectorSearch.return_value = iter(
+        [
+            types_pb2.Neighbor(
+                key=types_pb2.Key(namespace="test", longValue=i),
+                distance=float(i),
+            )
+            for i in range(3)
+        ]
+    )
+    client = new_client(stub)
+
+    result = client.vector_search(
+        namespace="test", index_name="index", query=[0.0, 1.0], result_format="arrays"
+    )
+
+    assert isinstance(result, types.SearchResult)
+    assert result.keys.tolist() == [0, 1, 2]
+    assert result.distances.tolist() == [0.0, 1.0, 2.0]
+
+
+def test_vector_search_invalid_result_format():
+    client = new_client(MagicMock())
+
+    with pytest.raises(types.AVSClientError):
+        client.vector_search(
+            namespace="test", index_name="index", query=[0.0], result_format="rows"
+        )
+
+
+def test_vector_search_lazy_neighbors_result_format():
+    stub = MagicMock()
+    stub.VectorSearch.return_value = iter(
+        [
+            types_pb2.Neighbor(
+                key=types_pb2.Key(namespace="test", set="s", stringValue="k"),
+                distance=0.5,
+                record=types_pb2.Record(
+                    fields=[
+                        types_pb2.Field(
+                            name="vector",
+                            value=types_pb2.Value(
+                                vectorValue=types_pb2.Vector(
+                                    floatData={"value": [1.0, 2.0]}
+                                )
+                            ),
+                        )
+                    ]
+                ),
+            )
+        ]
+    )
+    client = new_client(stub)
+
+    results = client.vector_search(
+        namespace="test",
+        index_name="index",
+        query=[0.0, 1.0],
+        result_format=types.SearchResultFormat.LAZY_NEIGHBORS,
+    )
+
+    assert len(results) == 1
+    neighbor = results[0]
+    assert isinstance(neighbor, types.LazyNeighbor)
+    assert neighbor.distance == 0.5
+    assert neighbor._fields is None
+    assert neighbor == types.Neighbor(
+        key=types.Key(namespace="test", set="s", key="k"),
+        fields={"vector": [1.0, 2.0]},
+        distance=0.5,
+    )
+    assert neighbor.fields is neighbor.fields
+
+
+def test_vector_search_numpy_vector_format():
+    stub = MagicMock()
+    stub.VectorSearch.side_effect = lambda request, **kwargs: iter(
+        [
+            types_pb2.Neighbor(
+                key=types_pb2.Key(namespace="test", longValue=1),
+                record=types_pb2.Record(
+                    fields=[
+                        types_pb2.Field(
+                            name="vector",
+                            value=types_pb2.Value(
+                                vectorValue=types_pb2.Vector(
+                                    floatData={"value": [1.0, 2.0]}
+                                )
+                            ),
+                        )
+                    ]
+                ),
+            )
+        ]
+    )
+    client = new_client(stub)
+
+    for result_format in (
+        types.SearchResultFormat.NEIGHBORS,
+        types.SearchResultFormat.LAZY_NEIGHBORS,
+    ):
+        results = client.vector_search(
+            namespace="test",
+            index_name="index",
+            query=[0.0, 1.0],
+            result_format=result_format,
+            vector_format="numpy",
+        )
+
+        vector = results[0].fields["vector"]
+        assert isinstance(vector, np.ndarray)
+        assert vector.tolist() == [1.0, 2.0]
+
+
+def test_prepare_search_sends_same_request_as_vector_search():
+    stub = MagicMock()
+    stub.VectorSearch.side_effect = lambda request, **kwargs: iter(
+        [types_pb2.Neighbor(key=types_pb2.Key(namespace="test", longValue=1))]
+    )
+    client = new_client(stub)
+    client._channel_provider.get_stub.return_value = stub
+    options = dict(
+        namespace="test",
+        index_name="index",
+        limit=3,
+        search_params=types.HnswSearchParams(ef=20),
+        include_fields=["a"],
+        exclude_fields=["vector"],
+    )
+
+    plan = client.prepare_search(**options)
+    for query in ([0.5, 1.5], np.array([0.5, 1.5], dtype=np.float32)):
+        results = plan.vector_search(query=query, timeout=2)
+        client.vector_search(query=query, timeout=2, **options)
+
+        (plan_call, search_call) = stub.VectorSearch.call_args_list[-2:]
+        assert isinstance(plan_call.args[0], bytes)
+        assert (
+            transact_pb2.VectorSearchRequest.FromString(plan_call.args[0])
+            == search_call.args[0]
+        )
+        assert plan_call.kwargs == search_call.kwargs
+        assert results[0].key.key == 1
+
+
+def test_prepared_search_raises_once_client_is_closed():
+    stub = MagicMock()
+    client = new_client(stub)
+    client._channel_provider.get_stub.return_value = stub
+    plan = client.prepare_search(namespace="test", index_name="index")
+
+    client.close()
+
+    with pytest.raises(types.AVSClientErrorClosed):
+        plan.vector_search(query=[0.5, 1.5])
+    stub.VectorSearch.assert_not_called()
+
+
+def test_stub_is_not_fetched_for_requests_that_fail_to_build():
+    # Fetching a stub picks a node and may reserve its probe call.
+    client = new_client(FakeTransactStub())
+    client._get_transact_stub = MagicMock()
+    plan = client.prepare_search(namespace="test", index_name="index")
+
+    with pytest.raises(Exception):
+        client.upsert(namespace="test", key="k", record_data={"bad": object()})
+    with pytest.raises(Exception):
+        plan.vector_search(query=[object()])
+
+    client._get_transact_stub.assert_not_called()
+    client._channel_provider.get_stub.assert_not_called()
+
+
+def test_prepare_search_invalid_format():
+    client = new_client(MagicMock())
+
+    with pytest.raises(types.AVSClientError):
+        client.prepare_search(namespace="test", index_name="index", result_format="rows")
+
+
+class FakeResponseFuture(FakeFuture):
+    def __init__(self, stub, response, error=None):
+        super().__init__(stub, error=error)
+        self._response = response
+
+    def result(self):
+        super().result()
+        return self._response
+
+
+class FakeReadStub:
+    def __init__(self, missing_keys=(), fail_keys=()):
+        self.missing_keys = missing_keys
+        self.fail_keys = fail_keys
+        self.outstanding = 0
+        self.Get = MagicMock()
+        self.Get.future.side_effect = lambda request, **kwargs: self._future(
+            request,
+            types_pb2.Record(
+                fields=[
+                    types_pb2.Field(
+                        name="value",
+                        value=types_pb2.Value(stringValue=request.key.stringValue),
+                    )
+                ]
+            ),
+        )
+        self.Exists = MagicMock()
+        self.Exists.future.side_effect = lambda request, **kwargs: self._future(
+            request,
+            types_pb2.Boolean(value=request.key.stringValue not in self.missing_keys),
+        )
+        self.Delete = MagicMock()
+        self.Delete.future.side_effect = lambda request, **kwargs: self._future(
+            request, None
+        )
+
+    def _future(self, request, response):
+        self.outstanding += 1
+        error = None
+        if request.key.stringValue in self.fail_keys:
+            error = FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+        return FakeResponseFuture(self, response, error=error)
+
+
+def test_get_many_returns_records_in_order():
+    stub = FakeReadStub(fail_keys=("k1",))
+    client = new_client(stub)
+
+    results = client.get_many(namespace="test", keys=iter(["k0", "k1", "k2"]), max_in_flight=2)
+
+    assert [r.key for r in results] == ["k0", "k1", "k2"]
+    assert [r.success for r in results] == [True, False, True]
+    assert results[0].result.key.key == "k0"
+    assert results[2].result.fields == {"value": "k2"}
+    assert results[1].error.rpc_error.code() == grpc.StatusCode.UNAVAILABLE
+    assert stub.Get.future.call_count == 3
+
+
+def test_get_many_reports_response_errors_per_record():
+    stub = FakeReadStub()
+    get_future = stub.Get.future.side_effect
+    # A response that cannot be converted, in place of k1's record.
+    stub.Get.future.side_effect = lambda request, **kwargs: (
+        stub._future(request, object())
+        if request.key.stringValue == "k1"
+        else get_future(request, **kwargs)
+    )
+    client = new_client(stub)
+
+    results = client.get_many(namespace="test", keys=["k0", "k1", "k2"])
+
+    assert [r.success for r in results] == [True, False, True]
+    assert isinstance(results[1].error, types.AVSClientError)
+    assert results[2].result.fields == {"value": "k2"}
+
+
+def test_get_and_get_many_numpy_vector_format():
+    stub = FakeReadStub()
+    stub.Get.side_effect = lambda request, **kwargs: types_pb2.Record(
+        fields=[
+            types_pb2.Field(
+                name="vector",
+                value=types_pb2.Value(
+                    vectorValue=types_pb2.Vector(floatData={"value": [1.0, 2.0]})
+                ),
+            )
+        ]
+    )
+    stub.Get.future.side_effect = lambda request, **kwargs: stub._future(
+        request, stub.Get.side_effect(request)
+    )
+    client = new_client(stub, record_cache=types.CacheConfig(max_entries=8))
+
+    as_list = client.get(namespace="test", key="k")
+    as_array = client.get(namespace="test", key="k", vector_format="numpy")
+    results = client.get_many(
+        namespace="test", keys=["k"], vector_format=types.VectorFormat.NUMPY
+    )
+
+    assert as_list.fields == {"vector": [1.0, 2.0]}
+    assert as_array.fields["vector"].dtype == np.float32
+    assert as_array.fields["vector"].tolist() == [1.0, 2.0]
+    assert results[0].result.fields["vector"].dtype == np.float32
+    assert stub.Get.call_count == 2
+
+
+def test_invalid_vector_format():
+    client = new_client(FakeReadStub())
+
+    with pytest.raises(types.AVSClientError):
+        client.get(namespace="test", key="k", vector_format="tuple")
+    with pytest.raises(types.AVSClientError):
+        client.vector_search(
+            namespace="test", index_name="index", query=[0.0], vector_format="tuple"
+        )
+
+
+def test_exists_many_and_delete_many():
+    stub = FakeReadStub(missing_keys=("k1",))
+    client = new_client(stub)
+
+    exists = client.exists_many(namespace="test", keys=["k0", "k1"])
+    deleted = client.delete_many(namespace="test", keys=["k0", "k1"])
+
+    assert [r.result for r in exists] == [True, False]
+    assert [r.success for r in deleted] == [True, True]
+    assert stub.Delete.future.call_count == 2
+
+
+def test_get_many_reports_invalid_keys_without_sending():
+    stub = FakeReadStub()
+    client = new_client(stub)
+
+    results = client.get_many(namespace="test", keys=["k0", object()])
+
+    assert [r.success for r in results] == [True, False]
+    assert isinstance(results[1].error, types.AVSClientError)
+    assert stub.Get.future.call_count == 1
+
+
+def test_get_uses_record_cache_until_written():
+    stub = FakeReadStub()
+    stub.Get.side_effect = lambda request, **kwargs: types_pb2.Record(
+        fields=[
+            types_pb2.Field(
+                name="calls", value=types_pb2.Value(longValue=stub.Get.call_count)
+            )
+        ]
+    )
+    stub.Put = MagicMock()
+    client = new_client(stub, record_cache=types.CacheConfig(max_entries=8))
+
+    first = client.get(namespace="test", key="k")
+    second = client.get(namespace="test", key="k")
+    assert first.fields == second.fields == {"calls": 1}
+    assert stub.Get.call_count == 1
+
+    client.upsert(namespace="test", key="k", record_data={"a": 1})
+    assert client.get(namespace="test", key="k").fields == {"calls": 2}
+
+    client.delete_many(namespace="test", keys=["k"])
+    assert client.get(namespace="test", key="k").fields == {"calls": 3}
+
+    stats = client.record_cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 3
+    assert stats.invalidations == 2
+
+
+def test_record_cache_disabled_by_default():
+    client = new_client(FakeReadStub())
+
+    assert client.record_cache_stats() is None
+
+
+def test_vector_search_uses_search_cache_until_namespace_written():
+    stub = FakeReadStub()
+    stub.VectorSearch = MagicMock(
+        side_effect=lambda request, **kwargs: iter(
+            [types_pb2.Neighbor(key=types_pb2.Key(namespace="test", longValue=1))]
+        )
+    )
+    stub.Put = MagicMock()
+    client = new_client(stub, search_cache=types.SearchCacheConfig(quantization=0.001))
+
+    first = client.vector_search(namespace="test", index_name="index", query=[0.5, 1.0])
+    second = client.vector_search(namespace="test", index_name="index", query=[0.5, 1.0001])
+    assert first == second
+    assert stub.VectorSearch.call_count == 1
+
+    client.upsert(namespace="other", key="k", record_data={"a": 1})
+    client.vector_search(namespace="test", index_name="index", query=[0.5, 1.0])
+    assert stub.VectorSearch.call_count == 1
+
+    client.upsert(namespace="test", key="k", record_data={"a": 1})
+    client.vector_search(namespace="test", index_name="index", query=[0.5, 1.0])
+    assert stub.VectorSearch.call_count == 2
+
+    assert client.search_cache_stats().hits == 2
+
+
+def search_stub():
+    # Each search returns one neighbor whose key and vector echo the query's first element.
+    stub = FakeReadStub()
+    stub.VectorSearch = MagicMock(
+        side_effect=lambda request, **kwargs: iter(
+            [
+                types_pb2.Neighbor(
+                    key=types_pb2.Key(
+                        namespace="test", longValue=int(request.queryVector.floatData.value[0])
+                    ),
+                    record=types_pb2.Record(
+                        fields=[
+                            types_pb2.Field(
+                                name="vector",
+                                value=types_pb2.Value(vectorValue=request.queryVector),
+                            )
+                        ]
+                    ),
+                )
+            ]
+        )
+    )
+    return stub
+
+
+def test_vector_search_many_vector_format():
+    client = new_client(search_stub())
+
+    results = client.vector_search_many(
+        namespace="test",
+        index_name="index",
+        queries=[[1.0, 2.0], [3.0, 4.0]],
+        vector_format="numpy",
+    )
+
+    assert [neighbors[0].key.key for neighbors in results] == [1, 3]
+    assert results[1][0].fields["vector"].dtype == np.float32
+    assert results[1][0].fields["vector"].tolist() == [3.0, 4.0]
+
+
+@pytest.mark.parametrize("search_cache", [None, types.SearchCacheConfig()])
+def test_vector_search_many_rejects_non_2d_arrays(search_cache):
+    stub = search_stub()
+    client = new_client(stub, search_cache=search_cache)
+
+    with pytest.raises(types.AVSClientError):
+        client.vector_search_many(
+            namespace="test", index_name="index", queries=np.zeros(4, dtype=np.float32)
+        )
+    stub.VectorSearch.assert_not_called()
+
+
+def test_vector_search_many_uses_search_cache():
+    stub = search_stub()
+    client = new_client(stub, search_cache=types.SearchCacheConfig())
+
+    single = client.vector_search(namespace="test", index_name="index", query=[2.0, 0.0])
+    results = client.vector_search_many(
+        namespace="test",
+        index_name="index",
+        queries=np.array([[1.0, 0.0], [2.0, 0.0], [3.0, 0.0]]),
+        max_in_flight=1,
+    )
+
+    assert results[1] == single
+    assert [neighbors[0].key.key for neighbors in results] == [1, 2, 3]
+    assert stub.VectorSearch.call_count == 3
+
+    again = client.vector_search_many(
+        namespace="test", index_name="index", queries=[[3.0, 0.0], [1.0, 0.0]]
+    )
+
+    assert again == [results[2], results[0]]
+    assert stub.VectorSearch.call_count == 3
+    assert client.search_cache_stats().hits == 3
@@ -0,0 +1,241 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import grpc
+import numpy as np
+
+from aerospike_vector_search import types
+from aerospike_vector_search.aio import Client
+from aerospike_vector_search.shared.proto_generated import types_pb2
+
+
+@pytest.fixture
+def aiolib():
+    # the batch helpers are built on asyncio tasks
+    return "asyncio"
+
+
+class FakeRpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+class FakeTransactStub:
+    def __init__(self, fail_keys=()):
+        self.fail_keys = fail_keys
+        self.outstanding = 0
+        self.max_outstanding = 0
+        self.calls = 0
+
+    async def Put(self, request, **kwargs):
+        self.calls += 1
+        self.outstanding += 1
+        self.max_outstanding = max(self.max_outstanding, self.outstanding)
+        try:
+            await asyncio.sleep(0)
+            if request.key.stringValue in self.fail_keys:
+                raise FakeRpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        finally:
+            self.outstanding -= 1
+
+
+def new_client(stub, record_cache=None, search_cache=None):
+    client = Client.__new__(Client)
+
+    async def is_ready():
+        pass
+
+    client._channel_provider = MagicMock()
+    client._channel_provider._is_ready = is_ready
+    client._channel_provider.get_token.return_value = None
+    client._get_transact_stub = lambda: stub
+    client._record_cache = client._prepare_record_cache(record_cache)
+    client._search_cache = client._prepare_search_cache(search_cache)
+    client.closed = False
+    return client
+
+
+async def test_upsert_many_reports_per_record_results_in_order():
+    stub = FakeTransactStub(fail_keys=("k2",))
+    client = new_client(stub)
+
+    records = [(f"k{i}", {"vector": [float(i)] * 4}) for i in range(6)]
+    results = await client.upsert_many(namespace="test", records=iter(records), max_in_flight=2)
+
+    assert [r.key for r in results] == [key for key, _ in records]
+    assert [r.success for r in results] == [True, True, False, True, True, True]
+    assert isinstance(results[2].error, types.AVSServerError)
+    assert stub.max_outstanding <= 2
+    assert stub.calls == 6
+
+
+async def test_upsert_many_reports_invalid_records_without_sending():
+    stub = FakeTransactStub()
+    client = new_client(stub)
+
+    records = [("k0", {"vector": [1.0]}), ("k1", {"bad": object()}), ("k2", {"vector": [2.0]})]
+    results = await client.upsert_many(namespace="test", records=records)
+
+    assert [r.success for r in results] == [True, False, True]
+    assert isinstance(results[1].error, types.AVSClientError)
+    assert stub.calls == 2
+
+
+class FakeReadStub:
+    def __init__(self, missing_keys=(), fail_keys=()):
+        self.missing_keys = missing_keys
+        self.fail_keys = fail_keys
+        self.deleted = []
+
+    async def _call(self, request):
+        await asyncio.sleep(0)
+        if request.key.stringValue in self.fail_keys:
+            raise FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+
+    async def Get(self, request, **kwargs):
+        await self._call(request)
+        return types_pb2.Record(
+            fields=[
+                types_pb2.Field(
+                    name="value", value=types_pb2.Value(stringValue=request.key.stringValue)
+                )
+            ]
+        )
+
+    async def Exists(self, request, **kwargs):
+        await self._call(request)
+        return types_pb2.Boolean(value=request.key.stringValue not in self.missing_keys)
+
+    async def Delete(self, request, **kwargs):
+        await self._call(request)
+        self.deleted.append(request.key.stringValue)
+
+
+async def test_get_many_returns_records_in_order():
+    client = new_client(FakeReadStub(fail_keys=("k1",)))
+
+    results = await client.get_many(namespace="test", keys=["k0", "k1", "k2"], max_in_flight=2)
+
+    assert [r.key for r in results] == ["k0", "k1", "k2"]
+    assert [r.success for r in results] == [True, False, True]
+    assert results[0].result.key.key == "k0"
+    assert results[2].result.fields == {"value": "k2"}
+    assert results[1].error.rpc_error.code() == grpc.StatusCode.UNAVAILABLE
+
+
+async def test_exists_many_and_delete_many():
+    stub = FakeReadStub(missing_keys=("k1",))
+    client = new_client(stub)
+
+    exists = await client.exists_many(namespace="test", keys=["k0", "k1"])
+    deleted = await client.delete_many(namespace="test", keys=["k0", "k1"])
+
+    assert [r.result for r in exists] == [True, False]
+    assert [r.success for r in deleted] == [True, True]
+    assert sorted(stub.deleted) == ["k0", "k1"]
+
+
+async def test_get_uses_record_cache_until_written():
+    stub = FakeReadStub()
+    gets = []
+
+    async def get(request, **kwargs):
+        gets.append(request)
+        return types_pb2.Record(
+            fields=[types_pb2.Field(name="calls", value=types_pb2.Value(longValue=len(gets)))]
+        )
+
+    stub.Get = get
+    client = new_client(stub, record_cache=types.CacheConfig(max_entries=8))
+
+    assert (await client.get(namespace="test", key="k")).fields == {"calls": 1}
+    assert (await client.get(namespace="test", key="k")).fields == {"calls": 1}
+
+    await client.delete(namespace="test", key="k")
+    assert (await client.get(namespace="test", key="k")).fields == {"calls": 2}
+
+    stats = client.record_cache_stats()
+    assert (stats.hits, stats.misses, stats.invalidations) == (1, 2, 1)
+
+
+class FakeSearchStub:
+    # Each search returns one neighbor whose key and vector echo the query's first element.
+    def __init__(self):
+        self.calls = 0
+
+    async def _neighbors(self, request):
+        await asyncio.sleep(0)
+        yield types_pb2.Neighbor(
+            key=types_pb2.Key(
+                namespace="test", longValue=int(request.queryVector.floatData.value[0])
+            ),
+            record=types_pb2.Record(
+                fields=[
+                    types_pb2.Field(
+                        name="vector", value=types_pb2.Value(vectorValue=request.queryVector)
+                    )
+                ]
+            ),
+        )
+
+    def VectorSearch(self, request, **kwargs):
+        self.calls += 1
+        return self._neighbors(request)
+
+
+async def test_vector_search_many_rejects_non_2d_arrays():
+    stub = FakeSearchStub()
+    client = new_client(stub, search_cache=types.SearchCacheConfig())
+
+    with pytest.raises(types.AVSClientError):
+        await client.vector_search_many(
+            namespace="test", index_name="index", queries=np.zeros(4, dtype=np.float32)
+        )
+    assert stub.calls == 0
+
+
+async def test_vector_search_many_vector_format_and_search_cache():
+    stub = FakeSearchStub()
+    client = new_client(stub, search_cache=types.SearchCacheConfig())
+
+    single = await client.vector_search(namespace="test", index_name="index", query=[2.0, 0.0])
+    results = await client.vector_search_many(
+        namespace="test",
+        index_name="index",
+        queries=[[1.0, 0.0], [2.0, 0.0], [3.0, 0.0]],
+        max_in_flight=1,
+    )
+
+    assert results[1] == single
+    assert [neighbors[0].key.key for neighbors in results] == [1, 2, 3]
+    assert stub.calls == 3
+
+    again = await client.vector_search_many(
+        namespace="test", index_name="index", queries=[[3.0, 0.0], [1.0, 0.0]]
+    )
+    assert again == [results[2], results[0]]
+    assert stub.calls == 3
+
+    arrays = await client.vector_search_many(
+        namespace="test", index_name="index", queries=[[1.0, 0.0]], vector_format="numpy"
+    )
+    assert arrays[0][0].fields["vector"].dtype == np.float32
+    assert stub.calls == 4
+
+
+async def test_prepared_search_raises_once_client_is_closed():
+    stub = MagicMock()
+    client = new_client(stub)
+    client._channel_provider.get_stub.return_value = stub
+    client._channel_provider.close = AsyncMock()
+    plan = client.prepare_search(namespace="test", index_name="index")
+
+    await client.close()
+
+    with pytest.raises(types.AVSClientErrorClosed):
+        await plan.vector_search(query=[0.5, 1.5])
+    stub.VectorSearch.assert_not_called()
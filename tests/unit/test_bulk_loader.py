@@ -0,0 +1,147 @@
+import pytest
+from unittest.mock import MagicMock
+
+import grpc
+
+from aerospike_vector_search import BulkLoader, Client, types
+from aerospike_vector_search.shared.bulk_loader import AimdController
+
+
+class FakeRpcError(grpc.RpcError):
+    def __init__(self, code, details=""):
+        self._code = code
+        self._details = details
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+
+class FakeFuture:
+    def __init__(self, stub, error=None):
+        self._stub = stub
+        self._error = error
+
+    def result(self):
+        self._stub.outstanding -= 1
+        if self._error:
+            raise self._error
+
+    def cancel(self):
+        pass
+
+
+class FakeTransactStub:
+    """
+    Rejects writes with RESOURCE_EXHAUSTED whenever more than capacity
+    writes are outstanding, like a server with a full in-memory queue.
+    """
+
+    def __init__(self, capacity, fail_keys=()):
+        self.capacity = capacity
+        self.fail_keys = fail_keys
+        self.outstanding = 0
+        self.max_outstanding = 0
+        self.written = set()
+        self.Put = MagicMock()
+        self.Put.future.side_effect = self._put_future
+
+    def _put_future(self, request, **kwargs):
+        self.outstanding += 1
+        self.max_outstanding = max(self.max_outstanding, self.outstanding)
+        key = request.key.longValue
+        if key in self.fail_keys:
+            return FakeFuture(self, FakeRpcError(grpc.StatusCode.INVALID_ARGUMENT))
+        if self.outstanding > self.capacity:
+            return FakeFuture(self, FakeRpcError(grpc.StatusCode.RESOURCE_EXHAUSTED))
+        self.written.add(key)
+        return FakeFuture(self)
+
+
+def new_client(stub):
+    client = Client.__new__(Client)
+    client._channel_provider = MagicMock()
+    client._channel_provider.get_token.return_value = None
+    client._get_transact_stub = lambda: stub
+    client._record_cache = None
+    client._search_cache = None
+    client.closed = False
+    return client
+
+
+def test_aimd_controller_increase_and_decrease():
+    controller = AimdController(
+        initial=4, minimum=1, maximum=8, additive_increase=1.0, decrease_factor=0.5
+    )
+    sequences = [controller.next_sequence() for _ in range(4)]
+
+    # the window grows by roughly one request per window of successes
+    for _ in range(5):
+        controller.on_success()
+    assert controller.limit == 5
+
+    # only the first backpressure signal from a window shrinks it
+    assert controller.on_backpressure(sequences[0])
+    assert not controller.on_backpressure(sequences[1])
+    assert controller.limit == 2
+
+    assert controller.on_backpressure(controller.next_sequence())
+    assert controller.on_backpressure(controller.next_sequence())
+    assert controller.limit == 1
+
+
+def test_bulk_loader_adapts_to_backpressure():
+    stub = FakeTransactStub(capacity=4)
+    loader = BulkLoader(
+        client=new_client(stub),
+        namespace="test",
+        initial_in_flight=16,
+        retry_backoff=0,
+    )
+
+    stats = loader.load((i, {"vector": [float(i)] * 4}) for i in range(200))
+
+    assert stats.records_written == 200
+    assert stats.records_failed == 0
+    assert stub.written == set(range(200))
+    assert stats.backpressure_events > 0
+    assert stats.retries == stats.errors["RESOURCE_EXHAUSTED"]
+    assert stats.in_flight_limit <= 8
+    assert stats.elapsed > 0
+
+
+def test_bulk_loader_reports_failures():
+    stub = FakeTransactStub(capacity=100, fail_keys=(3,))
+    loader = BulkLoader(client=new_client(stub), namespace="test")
+
+    stats = loader.load([(i, {"a": i}) for i in range(5)] + [(5, {"bad": object()})])
+
+    assert stats.records_written == 4
+    assert stats.records_failed == 2
+    assert sorted(f.key for f in stats.failures) == [3, 5]
+    assert stats.errors == {"INVALID_ARGUMENT": 1}
+    assert stats.retries == 0
+
+
+def test_bulk_loader_gives_up_after_max_retries():
+    stub = FakeTransactStub(capacity=0)
+    loader = BulkLoader(
+        client=new_client(stub),
+        namespace="test",
+        max_retries=2,
+        retry_backoff=0,
+    )
+
+    stats = loader.load([(1, {"a": 1})])
+
+    assert stats.records_written == 0
+    assert stats.records_failed == 1
+    assert stats.retries == 2
+    assert isinstance(stats.failures[0].error, types.AVSServerError)
+
+
+def test_bulk_loader_invalid_limits():
+    with pytest.raises(types.AVSClientError):
+        BulkLoader(client=MagicMock(), namespace="test", min_in_flight=4, max_in_flight=2)
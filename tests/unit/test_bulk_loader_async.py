@@ -0,0 +1,75 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+import grpc
+
+from aerospike_vector_search.aio import BulkLoader, Client
+
+
+@pytest.fixture
+def aiolib():
+    # the bulk loader is built on asyncio tasks
+    return "asyncio"
+
+
+class FakeRpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return ""
+
+
+class FakeTransactStub:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.outstanding = 0
+        self.written = set()
+
+    async def Put(self, request, **kwargs):
+        self.outstanding += 1
+        try:
+            await asyncio.sleep(0)
+            if self.outstanding > self.capacity:
+                raise FakeRpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            self.written.add(request.key.longValue)
+        finally:
+            self.outstanding -= 1
+
+
+def new_client(stub):
+    client = Client.__new__(Client)
+
+    async def is_ready():
+        pass
+
+    client._channel_provider = MagicMock()
+    client._channel_provider._is_ready = is_ready
+    client._channel_provider.get_token.return_value = None
+    client._get_transact_stub = lambda: stub
+    client._record_cache = None
+    client._search_cache = None
+    client.closed = False
+    return client
+
+
+async def test_bulk_loader_adapts_to_backpressure():
+    stub = FakeTransactStub(capacity=4)
+    loader = BulkLoader(
+        client=new_client(stub),
+        namespace="test",
+        initial_in_flight=16,
+        retry_backoff=0.001,
+    )
+
+    stats = await loader.load((i, {"vector": [float(i)] * 4}) for i in range(200))
+
+    assert stats.records_written == 200
+    assert stats.records_failed == 0
+    assert stub.written == set(range(200))
+    assert stats.backpressure_events > 0
+    assert stats.retries == stats.errors["RESOURCE_EXHAUSTED"]
@@ -0,0 +1,246 @@
+import numpy as np
+import pytest
+
+from aerospike_vector_search import types
+from aerospike_vector_search.shared import cache
+from aerospike_vector_search.shared.cache import LruTtlCache, RecordCache, SearchCache
+from aerospike_vector_search.shared.proto_generated import types_pb2
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    return fake
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LruTtlCache(types.CacheConfig(max_entries=2, ttl=None))
+
+    lru.put("a", 1, "a", lru.generation())
+    lru.put("b", 2, "b", lru.generation())
+    assert lru.get("a") == (True, 1)
+    lru.put("c", 3, "c", lru.generation())
+
+    assert lru.get("b") == (False, None)
+    assert lru.get("a") == (True, 1)
+    assert lru.get("c") == (True, 3)
+    assert lru.stats() == types.CacheStats(hits=3, misses=1, evictions=1, size=2)
+
+
+def test_entries_expire_after_ttl(clock):
+    lru = LruTtlCache(types.CacheConfig(max_entries=10, ttl=5))
+
+    lru.put("a", 1, "a", lru.generation())
+    clock.now = 4.9
+    assert lru.get("a") == (True, 1)
+    clock.now = 5.0
+    assert lru.get("a") == (False, None)
+    assert lru.stats().expirations == 1
+    assert lru.stats().size == 0
+
+
+def test_invalidate_drops_every_entry_in_group():
+    lru = LruTtlCache(types.CacheConfig(max_entries=10, ttl=None))
+
+    lru.put("a1", 1, "a", lru.generation())
+    lru.put("a2", 2, "a", lru.generation())
+    lru.put("b1", 3, "b", lru.generation())
+    lru.invalidate("a")
+
+    assert lru.get("a1") == (False, None)
+    assert lru.get("a2") == (False, None)
+    assert lru.get("b1") == (True, 3)
+    assert lru.stats().invalidations == 2
+
+
+def test_put_is_skipped_if_invalidated_while_fetching():
+    lru = LruTtlCache(types.CacheConfig(max_entries=10, ttl=None))
+
+    generation = lru.generation()
+    lru.invalidate("a")
+    lru.put("a", "stale", "a", generation)
+
+    assert lru.get("a") == (False, None)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [types.CacheConfig(max_entries=0), types.CacheConfig(ttl=0)],
+)
+def test_invalid_config(config):
+    with pytest.raises(types.AVSClientError):
+        LruTtlCache(config)
+
+
+def test_record_cache_keys_on_projection_and_normalized_key():
+    records = RecordCache(types.CacheConfig())
+    record = types.RecordWithKey(
+        key=types.Key(namespace="test", set="", key=b"k"), fields={"a": 1}
+    )
+
+    (cache_key, generation, cached) = records.lookup("test", None, bytearray(b"k"), None, None)
+    assert cached is None
+    records.store(cache_key, generation, record)
+
+    (_, _, cached) = records.lookup("test", "", np.frombuffer(b"k", dtype=np.uint8), None, None)
+    assert cached.key == record.key
+    assert cached.fields == record.fields
+    # Callers get a copy they can modify.
+    cached.fields["a"] = 2
+    assert records.lookup("test", None, b"k", None, None)[2].fields == {"a": 1}
+
+    assert records.lookup("test", None, b"k", ["a"], None)[2] is None
+
+    records.invalidate("test", None, b"k")
+    assert records.lookup("test", None, b"k", None, None)[2] is None
+
+
+def test_record_cache_copies_vectors_and_arrays():
+    records = RecordCache(types.CacheConfig())
+    record = types.RecordWithKey(
+        key=types.Key(namespace="test", set="", key="k"),
+        fields={"list": [1.0, 2.0], "array": np.array([1.0, 2.0]), "map": {"tags": ["a"]}},
+    )
+    (cache_key, generation, _) = records.lookup("test", None, "k", None, None)
+    records.store(cache_key, generation, record)
+
+    # Changing the stored record or a returned one leaves the cache alone.
+    record.fields["list"].append(3.0)
+    cached = records.lookup("test", None, "k", None, None)[2]
+    cached.fields["array"][0] = 9.0
+    cached.fields["map"]["tags"].append("b")
+
+    cached = records.lookup("test", None, "k", None, None)[2]
+    assert cached.fields["list"] == [1.0, 2.0]
+    assert cached.fields["array"].tolist() == [1.0, 2.0]
+    assert cached.fields["map"] == {"tags": ["a"]}
+
+
+def search_lookup(searches, query, **kwargs):
+    options = dict(
+        namespace="test",
+        index_name="index",
+        query=query,
+        limit=10,
+        search_params=None,
+        include_fields=None,
+        exclude_fields=None,
+        result_format=types.SearchResultFormat.NEIGHBORS,
+    )
+    options.update(kwargs)
+    return searches.lookup(**options)
+
+
+def test_search_cache_keys_on_query_and_options():
+    searches = SearchCache(types.SearchCacheConfig())
+
+    (cache_key, generation, results) = search_lookup(searches, [0.5, 1.0])
+    assert results is None
+    searches.store(cache_key, generation, ["hit"])
+
+    assert search_lookup(searches, np.array([0.5, 1.0], dtype=np.float32))[2] == ["hit"]
+    assert search_lookup(searches, [0.5, 1.0], limit=5)[2] is None
+    assert search_lookup(searches, [0.5, 1.0], search_params=types.HnswSearchParams(ef=5))[2] is None
+    assert search_lookup(searches, [0.5, 1.0], index_name="other")[2] is None
+    assert search_lookup(searches, [0.5, 1.0], exclude_fields=["vector"])[2] is None
+    assert search_lookup(
+        searches, [0.5, 1.0], result_format=types.SearchResultFormat.ARRAYS
+    )[2] is None
+    assert search_lookup(searches, [0.5, 1.0001])[2] is None
+
+
+def test_search_cache_quantization():
+    searches = SearchCache(types.SearchCacheConfig(quantization=0.01))
+
+    (cache_key, generation, _) = search_lookup(searches, [0.5, 1.0])
+    searches.store(cache_key, generation, ["hit"])
+
+    assert search_lookup(searches, [0.5001, 0.9999])[2] == ["hit"]
+    assert search_lookup(searches, [0.52, 1.0])[2] is None
+
+
+def test_search_cache_invalidated_per_namespace():
+    searches = SearchCache(types.SearchCacheConfig())
+
+    for namespace in ("a", "b"):
+        (cache_key, generation, _) = search_lookup(searches, [1.0], namespace=namespace)
+        searches.store(cache_key, generation, [namespace])
+    searches.invalidate("a")
+
+    assert search_lookup(searches, [1.0], namespace="a")[2] is None
+    assert search_lookup(searches, [1.0], namespace="b")[2] == ["b"]
+
+
+def test_search_cache_invalid_quantization():
+    with pytest.raises(types.AVSClientError):
+        SearchCache(types.SearchCacheConfig(quantization=0))
+
+
+def test_search_cache_copies_neighbors_and_arrays():
+    searches = SearchCache(types.SearchCacheConfig())
+    neighbor = types.Neighbor(
+        key=types.Key(namespace="test", set="", key=1),
+        fields={"vector": [1.0, 2.0]},
+        distance=0.5,
+    )
+    (cache_key, generation, _) = search_lookup(searches, [1.0])
+    searches.store(cache_key, generation, [neighbor])
+
+    neighbor.fields["vector"].append(3.0)
+    (cached,) = search_lookup(searches, [1.0])[2]
+    cached.fields["vector"][0] = 9.0
+    cached.distance = 2.0
+
+    (cached,) = search_lookup(searches, [1.0])[2]
+    assert cached.fields == {"vector": [1.0, 2.0]}
+    assert cached.distance == 0.5
+
+    arrays = types.SearchResult(
+        keys=np.array([1, 2]),
+        distances=np.array([0.5, 1.0], dtype=np.float32),
+        fields={"vector": np.ones((2, 2), dtype=np.float32), "tags": np.array([["a"], None], dtype=object)},
+    )
+    (cache_key, generation, _) = search_lookup(
+        searches, [1.0], result_format=types.SearchResultFormat.ARRAYS
+    )
+    searches.store(cache_key, generation, arrays)
+
+    cached = search_lookup(searches, [1.0], result_format=types.SearchResultFormat.ARRAYS)[2]
+    cached.keys[0] = 7
+    cached.distances[0] = 7.0
+    cached.fields["vector"][0, 0] = 7.0
+    cached.fields["tags"][0].append("b")
+
+    cached = search_lookup(searches, [1.0], result_format=types.SearchResultFormat.ARRAYS)[2]
+    assert cached.keys.tolist() == [1, 2]
+    assert cached.distances.tolist() == [0.5, 1.0]
+    assert cached.fields["vector"].tolist() == [[1.0, 1.0], [1.0, 1.0]]
+    assert cached.fields["tags"].tolist() == [["a"], None]
+
+
+def test_search_cache_copies_lazy_neighbors():
+    searches = SearchCache(types.SearchCacheConfig())
+    message = types_pb2.Neighbor(
+        key=types_pb2.Key(namespace="test", longValue=1),
+        record=types_pb2.Record(
+            fields=[types_pb2.Field(name="a", value=types_pb2.Value(stringValue="x"))]
+        ),
+    )
+    (cache_key, generation, _) = search_lookup(searches, [1.0])
+    searches.store(cache_key, generation, [types.LazyNeighbor(neighbor=message)])
+
+    (cached,) = search_lookup(searches, [1.0])[2]
+    cached.fields["a"] = "changed"
+
+    (cached,) = search_lookup(searches, [1.0])[2]
+    assert isinstance(cached, types.LazyNeighbor)
+    assert cached.fields == {"a": "x"}
@@ -0,0 +1,562 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import grpc
+import pytest
+
+from aerospike_vector_search import types
+from aerospike_vector_search.internal import channel_provider
+from aerospike_vector_search.shared import base_channel_provider, token_manager
+from aerospike_vector_search.shared.base_channel_provider import BaseChannelProvider
+from aerospike_vector_search.shared.proto_generated import transact_pb2_grpc
+from aerospike_vector_search.shared.proto_generated import index_pb2_grpc
+from aerospike_vector_search.shared.proto_generated import vector_db_pb2
+
+
+class FakeChannelProvider(BaseChannelProvider):
+    # A channel provider that never touches the network.
+
+    def __init__(self, seeds=(types.HostPort(host="seed", port=5000),), **kwargs):
+        self.closed_channels = []
+        super().__init__(seeds, **kwargs)
+
+    def _create_channel(self, host, port):
+        return MagicMock(name=f"{host}:{port}")
+
+    def _call_close_on_channel(self, channel_endpoints):
+        self.closed_channels.extend(channel_endpoints.channels)
+
+
+def endpoints(*addresses, port=5000):
+    return vector_db_pb2.ServerEndpointList(
+        endpoints=[
+            vector_db_pb2.ServerEndpoint(address=address, port=port)
+            for address in addresses
+        ]
+    )
+
+
+def test_stubs_are_reused_per_channel():
+    provider = FakeChannelProvider()
+
+    stub = provider.get_stub(transact_pb2_grpc.TransactServiceStub)
+
+    assert provider.get_stub(transact_pb2_grpc.TransactServiceStub) is stub
+    assert provider.get_stub(index_pb2_grpc.IndexServiceStub) is not stub
+    assert isinstance(
+        provider.get_stub(index_pb2_grpc.IndexServiceStub),
+        index_pb2_grpc.IndexServiceStub,
+    )
+
+
+def test_stubs_are_dropped_when_channel_is_replaced():
+    provider = FakeChannelProvider()
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    old_channel = provider._node_channels[1].channel
+    old_stub = provider.get_stub(transact_pb2_grpc.TransactServiceStub)
+    assert old_channel in provider._channel_stubs
+
+    provider._add_new_channels_from_temp_endpoints({1: endpoints("10.0.0.2")})
+    provider._close_drained_channels()
+
+    assert provider.closed_channels == [old_channel]
+    assert old_channel not in provider._channel_stubs
+    assert provider.get_stub(transact_pb2_grpc.TransactServiceStub) is not old_stub
+
+
+def test_stubs_are_dropped_when_node_leaves():
+    provider = FakeChannelProvider()
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    channel = provider._node_channels[1].channel
+    provider.get_stub(transact_pb2_grpc.TransactServiceStub)
+
+    provider._retire_old_channels_from_node_channels({})
+    provider._close_drained_channels()
+
+    assert provider.closed_channels == [channel]
+    assert channel not in provider._channel_stubs
+
+
+def test_get_channel_uses_balancing_policy():
+    provider = FakeChannelProvider(load_balancing_policy="least_outstanding")
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    provider.add_new_channel_to_node_channels(2, endpoints("10.0.0.2"))
+    provider._node_channels[1].stats.outstanding = 10
+
+    assert provider.get_channel() is provider._node_channels[2].channel
+
+
+def test_get_channel_skips_ejected_nodes():
+    provider = FakeChannelProvider(load_balancing_policy="round_robin")
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    provider.add_new_channel_to_node_channels(2, endpoints("10.0.0.2"))
+    provider._node_channels[1].stats.ejected_until = time.monotonic() + 60
+
+    assert {provider.get_channel() for _ in range(4)} == {provider._node_channels[2].channel}
+
+    provider._node_channels[2].stats.ejected_until = time.monotonic() + 60
+    assert len({provider.get_channel() for _ in range(4)}) == 2
+
+
+def test_get_channel_sends_one_call_to_probing_node():
+    provider = FakeChannelProvider(load_balancing_policy="round_robin")
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    provider.add_new_channel_to_node_channels(2, endpoints("10.0.0.2"))
+    probing = provider._node_channels[1]
+    probing.stats.ejected_until = time.monotonic() - 1
+
+    picked = [provider.get_channel() for _ in range(6)]
+
+    assert picked.count(probing.channel) == 1
+    assert picked.count(provider._node_channels[2].channel) == 5
+
+    (started, probe) = probing.stats.start()
+    probing.stats.finish(started)
+    probing.stats.record(False, probe)
+    assert probing.channel in {provider.get_channel() for _ in range(2)}
+
+
+def test_get_channel_without_nodes_uses_seed():
+    provider = FakeChannelProvider()
+
+    assert provider.get_channel() is provider._seedChannels[0]
+
+
+def test_channel_pool_is_used_round_robin_once_added():
+    provider = FakeChannelProvider(channels_per_node=3)
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    node = provider._node_channels[1]
+
+    assert {provider.get_channel() for _ in range(6)} == {node.channel}
+    assert node.channels == [node.channel]
+
+    created = node.create_pool_channels()
+    assert len(created) == 2
+    assert {provider.get_channel() for _ in range(6)} == {node.channel}
+
+    for channel in created:
+        node.add_channel(channel)
+    picked = [provider.get_channel() for _ in range(6)]
+
+    assert len(set(map(id, node.channels))) == 3
+    assert picked == node.channels * 2
+    assert node.create_pool_channels() == []
+
+
+def test_channel_pool_is_closed_together():
+    provider = FakeChannelProvider(channels_per_node=2)
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    node = provider._node_channels[1]
+    for channel in node.create_pool_channels():
+        node.add_channel(channel)
+    for _ in range(2):
+        provider.get_stub(transact_pb2_grpc.TransactServiceStub)
+    pool = list(node.channels)
+    assert len(pool) == 2
+
+    provider._add_new_channels_from_temp_endpoints({1: endpoints("10.0.0.2")})
+    provider._close_drained_channels()
+
+    assert provider.closed_channels == pool
+    assert all(channel not in provider._channel_stubs for channel in pool)
+    assert provider._node_channels[1].channels == [provider._node_channels[1].channel]
+
+
+def test_retired_channel_drains_before_closing():
+    provider = FakeChannelProvider()
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    old = provider._node_channels[1]
+    old.stats.outstanding = 1
+
+    provider._add_new_channels_from_temp_endpoints({1: endpoints("10.0.0.2")})
+    provider._close_drained_channels()
+
+    assert provider.get_channel() is provider._node_channels[1].channel
+    assert provider.get_channel() is not old.channel
+    assert provider.closed_channels == []
+
+    old.stats.outstanding = 0
+    provider._close_drained_channels()
+
+    assert provider.closed_channels == [old.channel]
+    assert provider._retiring_channels == []
+
+
+def test_retired_channel_closes_at_drain_deadline(monkeypatch):
+    provider = FakeChannelProvider()
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    old = provider._node_channels[1]
+    old.stats.outstanding = 1
+    provider._retire_old_channels_from_node_channels({})
+    assert provider._node_channels == {}
+
+    now = time.monotonic()
+    monkeypatch.setattr(
+        base_channel_provider.time,
+        "monotonic",
+        lambda: now + base_channel_provider.CHANNEL_DRAIN_TIMEOUT + 1,
+    )
+    provider._close_drained_channels()
+
+    assert provider.closed_channels == [old.channel]
+
+
+def test_endpoints_alternate_address_families():
+    ordered = BaseChannelProvider._order_endpoints(
+        endpoints("fd00::1", "fd00::2", "10.0.0.1", "10.0.0.2", "fd00::3")
+    )
+
+    assert [e.address for e in ordered] == [
+        "fd00::1", "10.0.0.1", "fd00::2", "10.0.0.2", "fd00::3"
+    ]
+
+
+def test_channels_per_node_must_be_positive():
+    with pytest.raises(types.AVSClientError):
+        FakeChannelProvider(channels_per_node=0)
+
+
+@pytest.mark.parametrize(
+    "settings", [{"tend_interval": 0}, {"tend_jitter": -0.1}, {"tend_jitter": 1}]
+)
+def test_tend_settings_must_be_valid(settings):
+    with pytest.raises(types.AVSClientError):
+        FakeChannelProvider(**settings)
+
+
+def test_tend_delay_is_jittered_around_interval():
+    provider = FakeChannelProvider(tend_interval=2.0, tend_jitter=0.25)
+
+    delays = [provider._next_tend_delay() for _ in range(100)]
+
+    assert all(1.5 <= delay <= 2.5 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_only_unavailable_request_calls_wake_tender():
+    provider = FakeChannelProvider()
+    provider._request_tend = MagicMock()
+
+    provider._on_node_unavailable("/aerospike.vector.ClusterInfoService/GetClusterId")
+    provider._on_node_unavailable(b"/aerospike.vector.ClusterInfoService/GetClusterEndpoints")
+    provider._request_tend.assert_not_called()
+
+    provider._on_node_unavailable(b"/aerospike.vector.TransactService/Get")
+    provider._request_tend.assert_called_once()
+
+
+class FakeFuture:
+    def __init__(self, events, name, response=None, error=None):
+        self._events = events
+        self._name = name
+        self._response = response
+        self._error = error
+
+    def result(self):
+        self._events.append(("result", self._name))
+        if self._error:
+            raise self._error
+        return self._response
+
+
+class FakeUnaryMethod:
+    def __init__(self, events, name, response=None, error=None):
+        self._events = events
+        self._name = name
+        self._response = response
+        self._error = error
+        self.timeouts = []
+
+    def future(self, request, credentials=None, timeout=None):
+        self._events.append(("start", self._name))
+        self.timeouts.append(timeout)
+        return FakeFuture(self._events, self._name, self._response, self._error)
+
+
+class FakeClusterInfoStub:
+    def __init__(self, events, name, cluster_id=None, cluster_endpoints=None, error=None):
+        self.GetClusterId = FakeUnaryMethod(
+            events, name, vector_db_pb2.ClusterId(id=cluster_id) if cluster_id else None, error
+        )
+        self.GetClusterEndpoints = FakeUnaryMethod(
+            events,
+            name,
+            vector_db_pb2.ClusterNodeEndpoints(endpoints=cluster_endpoints or {}),
+            error,
+        )
+
+
+class FakeSyncChannelProvider(channel_provider.ChannelProvider):
+    # The sync provider's tend cycle, without connecting or starting the tend thread.
+
+    def __init__(self, stubs, **kwargs):
+        BaseChannelProvider.__init__(self, (types.HostPort(host="seed", port=5000),), **kwargs)
+        self._tend_ended = threading.Event()
+        self._tend_wakeup = threading.Event()
+        self._stubs = stubs
+
+    def _create_channel(self, host, port, extra_options=None):
+        return MagicMock(name=f"{host}:{port}")
+
+    def _get_channel_stub(self, channel, stub_class):
+        return self._stubs[channel]
+
+
+def test_sync_tend_starts_every_call_before_waiting(monkeypatch):
+    monkeypatch.setattr(
+        channel_provider.grpc, "channel_ready_future", lambda channel: FakeReadyFuture(True)
+    )
+    events = []
+    provider = FakeSyncChannelProvider({})
+    for node in range(3):
+        provider.add_new_channel_to_node_channels(node, endpoints(f"10.0.0.{node}"))
+    first = provider._node_channels[0].channel
+    provider._stubs = {
+        first: FakeClusterInfoStub(
+            events,
+            "node0",
+            cluster_id=7,
+            cluster_endpoints={1: endpoints("10.0.0.1"), 3: endpoints("10.0.0.3")},
+        ),
+        provider._node_channels[1].channel: FakeClusterInfoStub(
+            events,
+            "node1",
+            error=grpc.RpcError("deadline exceeded"),
+        ),
+        provider._node_channels[2].channel: FakeClusterInfoStub(events, "node2", cluster_id=7),
+    }
+
+    provider._tend_cluster()
+
+    assert events[:6] == [
+        ("start", "node0"),
+        ("start", "node1"),
+        ("start", "node2"),
+        ("result", "node0"),
+        ("result", "node1"),
+        ("result", "node2"),
+    ]
+    assert set(provider._node_channels) == {1, 3}
+    assert provider._stubs[first].GetClusterId.timeouts == [channel_provider.TEND_CALL_TIMEOUT]
+
+
+def test_sync_tend_retries_when_endpoints_are_unavailable():
+    events = []
+    provider = FakeSyncChannelProvider({})
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    stub = FakeClusterInfoStub(events, "node1", cluster_id=7)
+    stub.GetClusterEndpoints = FakeUnaryMethod(
+        events, "node1", error=grpc.RpcError("unavailable")
+    )
+    provider._stubs = {provider._node_channels[1].channel: stub}
+
+    provider._tend_cluster()
+
+    assert set(provider._node_channels) == {1}
+    assert provider._cluster_id == 0
+
+
+def test_sync_tend_thread_wakes_early_and_stops_on_close():
+    provider = FakeSyncChannelProvider({}, tend_interval=60)
+    tended = threading.Semaphore(0)
+
+    def tend_cluster():
+        if provider._closed:
+            provider._tend_ended.set()
+            return False
+        tended.release()
+        return True
+
+    provider._tend_cluster = tend_cluster
+    thread = threading.Thread(target=provider._tend_loop)
+    thread.start()
+
+    provider._request_tend()
+    assert tended.acquire(timeout=5)
+
+    provider.close()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+class FakeReadyFuture:
+    def __init__(self, ready):
+        self._ready = ready
+        self._cancelled = False
+
+    def add_done_callback(self, callback):
+        if self._ready:
+            callback(self)
+
+    def cancel(self):
+        self._cancelled = True
+
+    def cancelled(self):
+        return self._cancelled
+
+
+def test_sync_connect_races_endpoints(monkeypatch):
+    monkeypatch.setattr(channel_provider, "CONNECTION_ATTEMPT_DELAY", 0.01)
+    monkeypatch.setattr(channel_provider, "ENDPOINT_RACE_TIMEOUT", 0.1)
+    provider = FakeSyncChannelProvider({})
+    created = {}
+
+    def create_node_channel(host, port, stats):
+        created[host] = MagicMock(name=host)
+        return created[host]
+
+    provider._create_node_channel = create_node_channel
+    monkeypatch.setattr(
+        channel_provider.grpc,
+        "channel_ready_future",
+        lambda channel: FakeReadyFuture(channel is created.get("10.0.0.1")),
+    )
+
+    connected = provider._connect_nodes(
+        {1: endpoints("fd00::1", "10.0.0.1"), 2: endpoints("fd00::2", "fd00::3")}
+    )
+
+    assert connected[1].channel is created["10.0.0.1"]
+    created["fd00::1"].close.assert_called_once()
+    created["10.0.0.1"].close.assert_not_called()
+    assert connected[2] is None
+    created["fd00::2"].close.assert_called_once()
+    created["fd00::3"].close.assert_called_once()
+
+    provider._cluster_id = 7
+    provider._add_new_channels_from_temp_endpoints(
+        {1: endpoints("fd00::1", "10.0.0.1"), 2: endpoints("fd00::2", "fd00::3")},
+        connected,
+    )
+
+    assert set(provider._node_channels) == {1}
+    assert provider._cluster_id == 0
+
+
+def test_sync_connect_waits_for_single_endpoint_nodes(monkeypatch):
+    monkeypatch.setattr(channel_provider, "ENDPOINT_RACE_TIMEOUT", 0.05)
+    provider = FakeSyncChannelProvider({})
+    created = {}
+
+    def create_node_channel(host, port, stats):
+        created[host] = MagicMock(name=host)
+        return created[host]
+
+    provider._create_node_channel = create_node_channel
+    monkeypatch.setattr(
+        channel_provider.grpc,
+        "channel_ready_future",
+        lambda channel: FakeReadyFuture(channel is created.get("10.0.0.1")),
+    )
+
+    connected = provider._connect_nodes(
+        {1: endpoints("10.0.0.1"), 2: endpoints("10.0.0.2")}
+    )
+
+    assert connected[1].channel is created["10.0.0.1"]
+    assert connected[2] is None
+    created["10.0.0.2"].close.assert_called_once()
+
+
+def test_seeds_are_tended_only_without_reachable_nodes():
+    provider = FakeChannelProvider()
+    (seed,) = provider._seedChannels
+    assert provider.init_tend_cluster()[0] == [seed]
+
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    node = provider._node_channels[1]
+    assert provider.init_tend_cluster()[0] == [node.channel]
+
+    node.stats.ejected_until = time.monotonic() + 60
+    assert provider.init_tend_cluster()[0] == [seed, node.channel]
+
+
+def test_idle_seeds_are_parked_and_reopened(monkeypatch):
+    now = time.monotonic()
+    monkeypatch.setattr(base_channel_provider.time, "monotonic", lambda: now)
+    provider = FakeChannelProvider()
+    (seed,) = provider._seedChannels
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+
+    provider._park_seed_channels()
+    provider._close_drained_channels()
+    assert provider.closed_channels == []
+
+    now += base_channel_provider.CHANNEL_DRAIN_TIMEOUT
+    provider._park_seed_channels()
+    provider._close_drained_channels()
+    assert provider.closed_channels == [seed]
+    assert provider._seedChannels == []
+
+    del provider._node_channels[1]
+    (reopened,) = provider.init_tend_cluster()[0]
+    assert reopened is not seed
+    assert provider.get_channel() is reopened
+
+
+def test_token_refresh_uses_node_channel_after_seeds_are_parked(monkeypatch):
+    now = time.monotonic()
+    monkeypatch.setattr(base_channel_provider.time, "monotonic", lambda: now)
+    timers = []
+    monkeypatch.setattr(
+        token_manager.threading,
+        "Timer",
+        lambda interval, function, args: timers.append((function, args)) or MagicMock(),
+    )
+    stubs = {}
+    provider = FakeSyncChannelProvider(stubs, username="user", password="pass")
+    provider._get_channel_stub = lambda channel, stub_class: stubs.setdefault(
+        channel, MagicMock(name=f"stub for {channel}")
+    )
+    provider._token_manager._update_token = lambda token: None
+    (seed,) = provider._seedChannels
+
+    provider._tend_token()
+    stubs[seed].Authenticate.assert_called_once()
+
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    provider._park_seed_channels()
+    now += base_channel_provider.CHANNEL_DRAIN_TIMEOUT
+    provider._park_seed_channels()
+    provider._close_drained_channels()
+    seed.close.assert_called_once()
+
+    (function, args) = timers[-1]
+    function(*args)
+
+    stubs[seed].Authenticate.assert_called_once()
+    stubs[provider._node_channels[1].channel].Authenticate.assert_called_once()
+
+
+def test_sync_tend_adds_pool_channels_once_ready(monkeypatch):
+    monkeypatch.setattr(channel_provider, "ENDPOINT_RACE_TIMEOUT", 0.05)
+    provider = FakeSyncChannelProvider({}, channels_per_node=3)
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    node = provider._node_channels[1]
+    created = []
+
+    def create_node_channel(host, port, stats):
+        created.append(MagicMock(name=host))
+        return created[-1]
+
+    provider._create_node_channel = create_node_channel
+    monkeypatch.setattr(
+        channel_provider.grpc,
+        "channel_ready_future",
+        lambda channel: FakeReadyFuture(channel is created[0]),
+    )
+
+    provider._fill_channel_pools()
+
+    assert node.channels == [node.channel, created[0]]
+    created[0].close.assert_not_called()
+    created[1].close.assert_called_once()
+
+    monkeypatch.setattr(
+        channel_provider.grpc, "channel_ready_future", lambda channel: FakeReadyFuture(True)
+    )
+    provider._fill_channel_pools()
+
+    assert node.channels == [node.channel, created[0], created[2]]
+    assert len(created) == 3
@@ -0,0 +1,115 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aerospike_vector_search import types
+from aerospike_vector_search.aio.internal import channel_provider
+from aerospike_vector_search.shared.base_channel_provider import BaseChannelProvider
+from aerospike_vector_search.shared.proto_generated import vector_db_pb2
+
+
+@pytest.fixture
+def aiolib():
+    # the endpoint race is built on asyncio tasks
+    return "asyncio"
+
+
+class FakeChannel:
+    def __init__(self, ready_after=None):
+        self.ready_after = ready_after
+        self.close = AsyncMock()
+
+    async def channel_ready(self):
+        if self.ready_after is None:
+            await asyncio.Event().wait()
+        await asyncio.sleep(self.ready_after)
+
+
+class FakeAsyncChannelProvider(channel_provider.ChannelProvider):
+    # The aio provider's endpoint race, without connecting or tending.
+
+    def __init__(self, channels, **kwargs):
+        self._channels = channels
+        BaseChannelProvider.__init__(
+            self, (types.HostPort(host="seed", port=5000),), **kwargs
+        )
+
+    def _create_channel(self, host, port, interceptors=None, extra_options=None):
+        return self._channels.get(host, FakeChannel())
+
+
+def endpoints(*addresses, port=5000):
+    return vector_db_pb2.ServerEndpointList(
+        endpoints=[
+            vector_db_pb2.ServerEndpoint(address=address, port=port)
+            for address in addresses
+        ]
+    )
+
+
+async def test_connect_picks_first_ready_endpoint(monkeypatch):
+    monkeypatch.setattr(channel_provider, "CONNECTION_ATTEMPT_DELAY", 0.01)
+    monkeypatch.setattr(channel_provider, "ENDPOINT_RACE_TIMEOUT", 1.0)
+    channels = {
+        "fd00::1": FakeChannel(),
+        "10.0.0.1": FakeChannel(ready_after=0.2),
+        "fd00::2": FakeChannel(ready_after=0),
+    }
+    provider = FakeAsyncChannelProvider(channels)
+
+    connected = await provider._connect_nodes(
+        {1: endpoints("fd00::1", "fd00::2", "10.0.0.1")}
+    )
+
+    assert connected[1].channel is channels["fd00::2"]
+    channels["fd00::1"].close.assert_awaited_once()
+    channels["10.0.0.1"].close.assert_awaited_once()
+    channels["fd00::2"].close.assert_not_awaited()
+
+
+async def test_connect_gives_up_when_no_endpoint_is_ready(monkeypatch):
+    monkeypatch.setattr(channel_provider, "CONNECTION_ATTEMPT_DELAY", 0.01)
+    monkeypatch.setattr(channel_provider, "ENDPOINT_RACE_TIMEOUT", 0.05)
+    channels = {"fd00::1": FakeChannel(), "10.0.0.1": FakeChannel()}
+    provider = FakeAsyncChannelProvider(channels)
+
+    connected = await provider._connect_nodes({1: endpoints("fd00::1", "10.0.0.1")})
+
+    assert connected == {1: None}
+    channels["fd00::1"].close.assert_awaited_once()
+    channels["10.0.0.1"].close.assert_awaited_once()
+
+
+async def test_connect_waits_for_single_endpoint(monkeypatch):
+    monkeypatch.setattr(channel_provider, "ENDPOINT_RACE_TIMEOUT", 0.05)
+    channels = {"10.0.0.1": FakeChannel(ready_after=0), "10.0.0.2": FakeChannel()}
+    provider = FakeAsyncChannelProvider(channels)
+
+    connected = await provider._connect_nodes(
+        {1: endpoints("10.0.0.1"), 2: endpoints("10.0.0.2")}
+    )
+
+    assert connected[1].channel is channels["10.0.0.1"]
+    assert connected[2] is None
+    channels["10.0.0.2"].close.assert_awaited_once()
+
+
+async def test_tend_adds_pool_channels_once_ready(monkeypatch):
+    monkeypatch.setattr(channel_provider, "ENDPOINT_RACE_TIMEOUT", 0.05)
+    provider = FakeAsyncChannelProvider({}, channels_per_node=3)
+    provider.add_new_channel_to_node_channels(1, endpoints("10.0.0.1"))
+    node = provider._node_channels[1]
+    created = [FakeChannel(ready_after=0), FakeChannel(), FakeChannel(ready_after=0)]
+    pending = iter(created)
+    node._create_channel = lambda: next(pending)
+
+    await provider._fill_channel_pools()
+
+    assert node.channels == [node.channel, created[0]]
+    created[0].close.assert_not_awaited()
+    created[1].close.assert_awaited_once()
+
+    await provider._fill_channel_pools()
+
+    assert node.channels == [node.channel, created[0], created[2]]
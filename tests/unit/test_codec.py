@@ -0,0 +1,237 @@
+import struct
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from aerospike_vector_search import Client, types
+from aerospike_vector_search.shared import codec, conversions
+from aerospike_vector_search.shared.proto_generated import transact_pb2, types_pb2
+
+
+VALUES = [
+    "",
+    "text",
+    "é中",
+    0,
+    -1,
+    2**63 - 1,
+    -(2**63),
+    True,
+    1.5,
+    -0.0,
+    1e300,
+    b"",
+    b"\x00\xff",
+    bytearray(b"\x00\xff"),
+    [1.0, 2.5, -3.0],
+    [1.5, 1e300],
+    [True, False, True],
+    [1, 2, 3],
+    ["a", [1.0, 2.0], {"k": 1}],
+    [b"a", bytearray(b"b")],
+    {"k": bytearray(b"v")},
+    {},
+    {"s": 1, 2: "b", b"k": [1.0], 1.5: {"nested": True}},
+    np.arange(1536, dtype=np.float32) / 7,
+    np.arange(4, dtype=np.float64) / 3,
+    np.array([True, False]),
+    np.arange(4, dtype=np.int64),
+    np.arange(4, dtype=np.float32).reshape(2, 2),
+]
+
+
+def assert_same(decoded, expected):
+    # Compares decoded values, which may hold numpy arrays at any depth.
+    assert type(decoded) is type(expected)
+    if isinstance(expected, np.ndarray):
+        assert decoded.dtype == expected.dtype
+        np.testing.assert_array_equal(decoded, expected)
+    elif isinstance(expected, list):
+        assert len(decoded) == len(expected)
+        for d, e in zip(decoded, expected):
+            assert_same(d, e)
+    elif isinstance(expected, dict):
+        assert decoded.keys() == expected.keys()
+        for k in expected:
+            assert_same(decoded[k], expected[k])
+    else:
+        assert decoded == expected
+
+
+def new_client(raw_codec):
+    client = Client.__new__(Client)
+    client._channel_provider = MagicMock()
+    client._raw_codec = raw_codec
+    return client
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_encode_value_matches_protobuf(value):
+    assert codec.encode_value(value) == conversions.toVectorDbValue(value).SerializeToString()
+
+
+@pytest.mark.parametrize("value", [[], object(), {object(): 1}, 2**63])
+def test_encode_value_rejects_what_protobuf_rejects(value):
+    with pytest.raises(Exception):
+        conversions.toVectorDbValue(value)
+    with pytest.raises(Exception):
+        codec.encode_value(value)
+
+
+@pytest.mark.parametrize(
+    "key", ["k", "", 0, -5, 2**40, b"\x01", bytearray(b"\x01"), np.int64(7), np.arange(3)]
+)
+@pytest.mark.parametrize("set_name", [None, "", "s"])
+def test_encode_key_matches_protobuf(key, set_name):
+    expected = new_client(False)._get_key("test", set_name, key)
+
+    assert codec.encode_key("test", set_name, key) == expected.SerializeToString()
+
+
+@pytest.mark.parametrize("write_type", [transact_pb2.WriteType.UPSERT, transact_pb2.WriteType.INSERT_ONLY])
+@pytest.mark.parametrize("ignore_mem_queue_full", [None, False, True])
+def test_encode_put_request_matches_protobuf(write_type, ignore_mem_queue_full):
+    args = (
+        "test",
+        "k",
+        {"vector": np.arange(8, dtype=np.float32), "tags": ["a"], "": 1},
+        "s",
+        write_type,
+        ignore_mem_queue_full,
+        None,
+        MagicMock(),
+    )
+    (_, expected, _) = new_client(False)._prepare_put(*args)
+    (_, request, _) = new_client(True)._prepare_put(*args)
+
+    assert request == expected.SerializeToString()
+    assert codec.request_key(request) == expected.key.SerializeToString()
+
+
+@pytest.mark.parametrize(
+    "include_fields, exclude_fields",
+    [(None, None), (["a", "b"], None), (None, ["c"]), ([], [])],
+)
+def test_encode_get_request_matches_protobuf(include_fields, exclude_fields):
+    args = ("test", 5, include_fields, exclude_fields, None, None, MagicMock())
+    (_, expected_key, expected, _) = new_client(False)._prepare_get(*args)
+    (_, key, request, _) = new_client(True)._prepare_get(*args)
+
+    assert key == expected_key.SerializeToString()
+    assert request == expected.SerializeToString()
+
+
+@pytest.mark.parametrize("limit", [0, 10, 300])
+@pytest.mark.parametrize("search_params", [None, types.HnswSearchParams(ef=40)])
+@pytest.mark.parametrize(
+    "query", [[0.5, 1.0], np.arange(16, dtype=np.float32), [True, False], np.array([True])]
+)
+def test_encode_vector_search_request_matches_protobuf(limit, search_params, query):
+    args = ("test", "index", query, limit, search_params, ["a"], None, None, MagicMock())
+    (_, expected, _) = new_client(False)._prepare_vector_search(*args)
+    (_, request, _) = new_client(True)._prepare_vector_search(*args)
+
+    assert request == expected.SerializeToString()
+
+
+@pytest.mark.parametrize("value", VALUES)
+@pytest.mark.parametrize("vector_format", list(types.VectorFormat))
+def test_decode_value_matches_conversions(value, vector_format):
+    message = conversions.toVectorDbValue(value)
+
+    decoded = codec.decode_value(message.SerializeToString(), vector_format)
+    expected = conversions.fromVectorDbValue(message, vector_format)
+
+    assert_same(decoded, expected)
+
+
+def test_decode_value_unset_and_other_members():
+    for message in (
+        types_pb2.Value(),
+        types_pb2.Value(intValue=-7),
+        types_pb2.Value(floatValue=0.25),
+        types_pb2.Value(booleanValue=False),
+        types_pb2.Value(vectorValue=types_pb2.Vector()),
+        types_pb2.Value(vectorValue=types_pb2.Vector(floatData=types_pb2.FloatData())),
+    ):
+        assert codec.decode_value(message.SerializeToString()) == conversions.fromVectorDbValue(message)
+
+
+def test_decode_unpacked_and_padded_vectors():
+    # Parsers must also accept unpacked repeated fields and over-long varints.
+    floats = b"".join(b"\x0d" + struct.pack("<f", x) for x in (1.0, 2.0))
+    value = b"\x4a" + bytes((len(floats) + 2,)) + b"\x12" + bytes((len(floats),)) + floats
+    assert codec.decode_value(value) == [1.0, 2.0]
+
+    bools = b"\x0a\x03\x81\x00\x00"
+    value = b"\x4a" + bytes((len(bools) + 2,)) + b"\x0a" + bytes((len(bools),)) + bools
+    assert codec.decode_value(value) == types_pb2.Value.FromString(value).vectorValue.boolData.value[:] == [True, False]
+
+
+@pytest.mark.parametrize("vector_format", list(types.VectorFormat))
+def test_decode_neighbor_matches_conversions(vector_format):
+    for neighbor in (
+        types_pb2.Neighbor(),
+        types_pb2.Neighbor(
+            key=types_pb2.Key(namespace="test", set="s", intValue=-3),
+            distance=0.125,
+        ),
+        types_pb2.Neighbor(
+            key=types_pb2.Key(namespace="test", bytesValue=b"k"),
+            record=types_pb2.Record(
+                fields=[
+                    types_pb2.Field(name="vector", value=conversions.toVectorDbValue([1.0, 2.0])),
+                    types_pb2.Field(name="label", value=conversions.toVectorDbValue("a")),
+                    types_pb2.Field(name="empty"),
+                ]
+            ),
+            distance=2.5,
+        ),
+    ):
+        decoded = codec.decode_neighbor(neighbor.SerializeToString(), vector_format)
+        expected = conversions.fromVectorDbNeighbor(neighbor, vector_format)
+
+        assert decoded.key == expected.key
+        assert decoded.distance == expected.distance
+        assert_same(decoded.fields, expected.fields)
+
+
+def test_raw_codec_client_round_trip():
+    record = types_pb2.Record(
+        fields=[types_pb2.Field(name="vector", value=conversions.toVectorDbValue([1.0, 2.0]))]
+    )
+    neighbors = [
+        types_pb2.Neighbor(key=types_pb2.Key(namespace="test", longValue=i), record=record, distance=float(i))
+        for i in range(2)
+    ]
+    stub = MagicMock()
+    stub.Get.return_value = record.SerializeToString()
+    stub.VectorSearch.side_effect = lambda request, **kwargs: iter(
+        [neighbor.SerializeToString() for neighbor in neighbors]
+    )
+    client = new_client(True)
+    client._get_raw_transact_stub = lambda: stub
+    client._record_cache = None
+    client._search_cache = None
+
+    result = client.get(namespace="test", key="k", set_name="s")
+    assert result.key == types.Key(namespace="test", set="s", key="k")
+    assert result.fields == {"vector": [1.0, 2.0]}
+    assert isinstance(stub.Get.call_args.args[0], bytes)
+
+    results = client.vector_search(namespace="test", index_name="index", query=[0.0, 1.0])
+    assert results == [conversions.fromVectorDbNeighbor(neighbor) for neighbor in neighbors]
+
+    arrays = client.vector_search(
+        namespace="test", index_name="index", query=[0.0, 1.0], result_format="arrays"
+    )
+    assert arrays.keys.tolist() == [0, 1]
+    assert arrays.fields["vector"].tolist() == [[1.0, 2.0], [1.0, 2.0]]
+
+    client.upsert(namespace="test", key="k", record_data={"vector": [1.0]})
+    assert stub.Put.call_args.args[0] == transact_pb2.PutRequest(
+        key=types_pb2.Key(namespace="test", stringValue="k"),
+        writeType=transact_pb2.WriteType.UPSERT,
+        fields=[types_pb2.Field(name="vector", value=conversions.toVectorDbValue([1.0]))],
+    ).SerializeToString()
@@ -0,0 +1,300 @@
+import numpy as np
+import pytest
+
+from aerospike_vector_search import types
+from aerospike_vector_search.shared import conversions
+from aerospike_vector_search.shared.proto_generated import types_pb2
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(1536, dtype=np.float32) / 7,
+        np.arange(4, dtype=np.float64) / 3,
+        np.arange(4, dtype=">f4"),
+        (np.arange(8, dtype=np.float32) / 3)[::2],
+        np.array([1.5], dtype=np.float16),
+    ],
+)
+def test_float_ndarray_matches_list_conversion(array):
+    expected = types_pb2.Value(
+        vectorValue=types_pb2.Vector(
+            floatData={"value": [float(x) for x in array.tolist()]}
+        )
+    )
+
+    assert conversions.toVectorDbValue(array) == expected
+
+
+def test_bool_ndarray_matches_list_conversion():
+    array = np.array([True, False, False, True] * 64)
+    expected = types_pb2.Value(
+        vectorValue=types_pb2.Vector(boolData={"value": array.tolist()})
+    )
+
+    assert conversions.toVectorDbValue(array) == expected
+
+
+def test_ndarray_round_trip():
+    array = np.random.default_rng(0).random(128, dtype=np.float32)
+
+    value = conversions.toVectorDbValue(array)
+
+    assert conversions.fromVectorDbValue(value) == array.tolist()
+
+
+def test_numpy_vector_format():
+    floats = np.random.default_rng(0).random(1536, dtype=np.float32)
+    bools = np.array([True, False, True])
+    value = conversions.toVectorDbValue(
+        {"floats": floats, "bools": bools, "nested": [floats[:2], "a"]}
+    )
+
+    result = conversions.fromVectorDbValue(value, types.VectorFormat.NUMPY)
+
+    assert result["floats"].dtype == np.float32
+    np.testing.assert_array_equal(result["floats"], floats)
+    assert result["bools"].dtype == bool
+    np.testing.assert_array_equal(result["bools"], bools)
+    np.testing.assert_array_equal(result["nested"][0], floats[:2])
+    assert result["nested"][1] == "a"
+
+    # The array owns its data, so callers may modify it.
+    result["floats"][0] = 2.0
+
+
+def test_numpy_vector_format_empty_vector():
+    value = types_pb2.Value(
+        vectorValue=types_pb2.Vector(floatData=types_pb2.FloatData())
+    )
+
+    result = conversions.fromVectorDbValue(value, types.VectorFormat.NUMPY)
+
+    assert result.dtype == np.float32
+    assert result.shape == (0,)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(4, dtype=np.int64),
+        np.arange(4, dtype=np.float32).reshape(2, 2),
+    ],
+)
+def test_other_ndarray_falls_back_to_list_conversion(array):
+    assert conversions.toVectorDbValue(array) == conversions.toVectorDbValue(
+        array.tolist()
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        np.arange(300, dtype=np.float32) / 7,
+        np.arange(4, dtype=np.float64) / 3,
+        np.array([True, False, True]),
+        [1.0, 2.0],
+        [True, False],
+    ],
+)
+def test_vector_bytes_match_vector_message(query):
+    expected = conversions.toVectorDbValue(query).vectorValue
+
+    assert types_pb2.Vector.FromString(conversions.toVectorDbVectorBytes(query)) == expected
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("query", [np.array([1.5, 1e300]), [1.5, 1e300]])
+def test_vector_bytes_overflow_to_inf_without_warning(query):
+    vector = types_pb2.Vector.FromString(conversions.toVectorDbVectorBytes(query))
+
+    assert list(vector.floatData.value) == [1.5, float("inf")]
+
+
+def _neighbor(key, distance, **fields):
+    return types_pb2.Neighbor(
+        key=types_pb2.Key(namespace="test", set="s", longValue=key)
+        if isinstance(key, int)
+        else types_pb2.Key(namespace="test", set="s", stringValue=key),
+        distance=distance,
+        record=types_pb2.Record(
+            fields=[
+                types_pb2.Field(name=name, value=conversions.toVectorDbValue(value))
+                for name, value in fields.items()
+            ]
+        ),
+    )
+
+
+def test_neighbors_to_search_result_columns():
+    neighbors = [
+        _neighbor(1, 0.5, vector=[1.0, 2.0, 3.0], flags=[True, False], count=3, label="a"),
+        _neighbor(2, 1.5, vector=[4.0, 5.0, 6.0], flags=[False, True], count=4),
+    ]
+
+    result = conversions.fromVectorDbNeighbors(neighbors)
+
+    assert len(result) == 2
+    assert result.keys.dtype == np.int64
+    assert result.keys.tolist() == [1, 2]
+    assert result.distances.dtype == np.float32
+    assert result.distances.tolist() == [0.5, 1.5]
+    assert result.fields["vector"].dtype == np.float32
+    assert result.fields["vector"].tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    assert result.fields["flags"].dtype == bool
+    assert result.fields["flags"].tolist() == [[True, False], [False, True]]
+    # The columns own their data, so callers may modify them.
+    result.fields["vector"][0, 0] = 2.0
+    result.fields["flags"][0, 0] = False
+    assert result.fields["count"].dtype == np.int64
+    assert result.fields["count"].tolist() == [3, 4]
+    assert result.fields["label"].tolist() == ["a", None]
+
+
+def test_neighbors_to_search_result_mixed_columns():
+    neighbors = [
+        _neighbor("a", 0.0, flags=[True, False], vector=[1.0, 2.0]),
+        _neighbor(7, 1.0, flags=[False, True], vector=[1.0, 2.0, 3.0]),
+    ]
+
+    result = conversions.fromVectorDbNeighbors(neighbors)
+
+    assert result.keys.dtype == object
+    assert result.keys.tolist() == ["a", 7]
+    assert result.fields["flags"].dtype == bool
+    assert result.fields["flags"].tolist() == [[True, False], [False, True]]
+    # Vectors of different lengths cannot form a 2-D array.
+    assert result.fields["vector"].dtype == object
+    assert result.fields["vector"][1] == [1.0, 2.0, 3.0]
+
+
+def test_no_neighbors_to_search_result():
+    result = conversions.fromVectorDbNeighbors([])
+
+    assert len(result) == 0
+    assert result.fields == {}
+
+
+def test_bool_converts_to_boolean_value():
+    assert conversions.toVectorDbValue(True) == types_pb2.Value(booleanValue=True)
+    assert conversions.toVectorDbValue(False) == types_pb2.Value(booleanValue=False)
+    assert conversions.toVectorDbValue(False).WhichOneof("value") == "booleanValue"
+    assert conversions.toVectorDbValue(1) == types_pb2.Value(longValue=1)
+    # MapKey has no boolean member.
+    assert conversions.toMapKey(True) == types_pb2.MapKey(longValue=1)
+
+    value = conversions.toVectorDbValue({"flag": True, "items": ["a", False]})
+
+    assert conversions.fromVectorDbValue(value) == {"flag": True, "items": ["a", False]}
+
+
+def test_nested_value_matches_message():
+    value = {"s": "a", 1: [1, 2], b"k": [{"x": 1.5}, "b", 0, b"c"], 2.5: {}}
+    expected = types_pb2.Value(
+        mapValue=types_pb2.Map(
+            entries=[
+                types_pb2.MapEntry(
+                    key=types_pb2.MapKey(stringValue="s"),
+                    value=types_pb2.Value(stringValue="a"),
+                ),
+                types_pb2.MapEntry(
+                    key=types_pb2.MapKey(longValue=1),
+                    value=types_pb2.Value(
+                        listValue=types_pb2.List(
+                            entries=[
+                                types_pb2.Value(longValue=1),
+                                types_pb2.Value(longValue=2),
+                            ]
+                        )
+                    ),
+                ),
+                types_pb2.MapEntry(
+                    key=types_pb2.MapKey(bytesValue=b"k"),
+                    value=types_pb2.Value(
+                        listValue=types_pb2.List(
+                            entries=[
+                                types_pb2.Value(
+                                    mapValue=types_pb2.Map(
+                                        entries=[
+                                            types_pb2.MapEntry(
+                                                key=types_pb2.MapKey(stringValue="x"),
+                                                value=types_pb2.Value(doubleValue=1.5),
+                                            )
+                                        ]
+                                    )
+                                ),
+                                types_pb2.Value(stringValue="b"),
+                                types_pb2.Value(longValue=0),
+                                types_pb2.Value(bytesValue=b"c"),
+                            ]
+                        )
+                    ),
+                ),
+                types_pb2.MapEntry(
+                    key=types_pb2.MapKey(doubleValue=2.5),
+                    value=types_pb2.Value(mapValue=types_pb2.Map()),
+                ),
+            ]
+        )
+    )
+
+    result = conversions.toVectorDbValue(value)
+
+    assert result == expected
+    assert conversions.fromVectorDbValue(result) == value
+
+
+def test_deeply_nested_value_round_trip():
+    # Far deeper than the recursion limit.
+    value = "leaf"
+    for i in range(5000):
+        value = [value, i] if i % 2 else {"child": value}
+
+    result = conversions.fromVectorDbValue(conversions.toVectorDbValue(value))
+
+    # Walk down both values, since == would recurse too.
+    while value != "leaf":
+        if isinstance(value, list):
+            assert result[1] == value[1]
+            (value, result) = (value[0], result[0])
+        else:
+            assert result.keys() == value.keys()
+            (value, result) = (value["child"], result["child"])
+    assert result == "leaf"
+
+
+def test_scalar_subclasses_convert_like_their_base():
+    import enum
+
+    class Color(enum.IntEnum):
+        RED = 3
+
+    assert conversions.toVectorDbValue(np.float64(0.5)) == types_pb2.Value(doubleValue=0.5)
+    assert conversions.toVectorDbValue(Color.RED) == types_pb2.Value(longValue=3)
+    assert conversions.toVectorDbValue([Color.RED, 4]) == conversions.toVectorDbValue([3, 4])
+    assert conversions.toMapKey(Color.RED) == types_pb2.MapKey(longValue=3)
+
+    with pytest.raises(Exception, match="Invalid type"):
+        conversions.toVectorDbValue(np.int64(1))
+    with pytest.raises(Exception, match="Invalid map key type"):
+        conversions.toMapKey(None)
+
+
+def test_duplicate_map_keys_keep_last_value():
+    value = types_pb2.Value(
+        mapValue=types_pb2.Map(
+            entries=[
+                types_pb2.MapEntry(
+                    key=types_pb2.MapKey(stringValue="k"),
+                    value=types_pb2.Value(listValue=types_pb2.List(entries=[types_pb2.Value(longValue=1)])),
+                ),
+                types_pb2.MapEntry(key=types_pb2.MapKey(stringValue="j"), value=types_pb2.Value()),
+                types_pb2.MapEntry(
+                    key=types_pb2.MapKey(stringValue="k"),
+                    value=types_pb2.Value(stringValue="last"),
+                ),
+            ]
+        )
+    )
+
+    assert conversions.fromVectorDbValue(value) == {"k": "last", "j": None}
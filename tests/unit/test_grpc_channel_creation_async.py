@@ -23,6 +23,35 @@ async def test_channel_no_options():
         )
 
 
+async def test_channel_options():
+    channel_options = types.ChannelOptions(
+        keepalive_time=30,
+        keepalive_timeout=5,
+        bdp_probe=True,
+        max_receive_message_length=64 * 1024 * 1024,
+        gzip_compression=True,
+    )
+    with patch("grpc.aio.insecure_channel") as mock_insecure_channel:
+        try:
+            client = Client(
+                seeds=types.HostPort(host="localhost", port=8080),
+                channel_options=channel_options,
+            )
+        except Exception as e:
+            pass
+
+        mock_insecure_channel.assert_called_with(
+            "localhost:8080",
+            options=[
+                ("grpc.keepalive_time_ms", 30000),
+                ("grpc.keepalive_timeout_ms", 5000),
+                ("grpc.http2.bdp_probe", 1),
+                ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+            ],
+            compression=grpc.Compression.Gzip,
+        )
+
+
 async def test_channel_insecure():
     # NOTE: this path is relative to the tests directory
     service_config_path = "service_configs/backoff_multiplier.json"
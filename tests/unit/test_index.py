@@ -28,6 +28,7 @@ def test_index_vector_search():
         include_fields=["test_field"],
         exclude_fields=["test_field"],
         timeout=1000,
+        vector_format="numpy",
     )
 
     mock_client.vector_search.assert_called_once_with(
@@ -41,6 +42,8 @@ def test_index_vector_search():
         # so expect it to be present in the exclude_fields list
         exclude_fields=["test_vector_field", "test_field"],
         timeout=1000,
+        result_format=types.SearchResultFormat.NEIGHBORS,
+        vector_format="numpy",
     )
 
 
@@ -71,6 +74,35 @@ def test_index_vector_search_no_params():
         include_fields=None,
         exclude_fields=["test_vector_field"],
         timeout=None,
+        result_format=types.SearchResultFormat.NEIGHBORS,
+        vector_format=types.VectorFormat.LIST,
+    )
+
+
+def test_index_prepare_search():
+    mock_client = MagicMock(spec=Client)
+    index = Index(
+        client=mock_client,
+        name="test_index",
+        namespace="test_namespace",
+        vector_field="test_vector_field",
+        dimensions=10,
+        vector_distance_metric=types.VectorDistanceMetric.SQUARED_EUCLIDEAN,
+        sets="test_sets",
+    )
+
+    plan = index.prepare_search(limit=5, vector_format="numpy")
+
+    assert plan is mock_client.prepare_search.return_value
+    mock_client.prepare_search.assert_called_once_with(
+        namespace="test_namespace",
+        index_name="test_index",
+        limit=5,
+        search_params=None,
+        include_fields=None,
+        exclude_fields=["test_vector_field"],
+        result_format=types.SearchResultFormat.NEIGHBORS,
+        vector_format="numpy",
     )
 
 
@@ -442,4 +474,79 @@ def test_index_drop_no_params():
         namespace="test_namespace",
         name="test_index",
         timeout=None,
-    )
\ No newline at end of file
+    )
+
+def test_index_vector_search_many():
+    mock_client = MagicMock(spec=Client)
+    index = Index(
+        client=mock_client,
+        name="test_index",
+        namespace="test_namespace",
+        vector_field="test_vector_field",
+        dimensions=10,
+        vector_distance_metric=types.VectorDistanceMetric.SQUARED_EUCLIDEAN,
+        sets="test_sets",
+    )
+
+    queries = [[0.0] * 10, [1.0] * 10]
+    search_params = types.HnswSearchParams(
+        ef=10,
+    )
+
+    index.vector_search_many(
+        queries=queries,
+        limit=10,
+        search_params=search_params,
+        include_fields=["test_field"],
+        exclude_fields=["test_field"],
+        timeout=1000,
+        max_in_flight=8,
+        vector_format="numpy",
+    )
+
+    mock_client.vector_search_many.assert_called_once_with(
+        index_name="test_index",
+        namespace="test_namespace",
+        queries=queries,
+        limit=10,
+        search_params=search_params,
+        include_fields=["test_field"],
+        exclude_fields=["test_vector_field", "test_field"],
+        timeout=1000,
+        max_in_flight=8,
+        result_format=types.SearchResultFormat.NEIGHBORS,
+        vector_format="numpy",
+    )
+
+
+def test_index_vector_search_many_no_params():
+    mock_client = MagicMock(spec=Client)
+    index = Index(
+        client=mock_client,
+        name="test_index",
+        namespace="test_namespace",
+        vector_field="test_vector_field",
+        dimensions=10,
+        vector_distance_metric=types.VectorDistanceMetric.SQUARED_EUCLIDEAN,
+        sets="test_sets",
+    )
+
+    queries = [[0.0] * 10]
+
+    index.vector_search_many(
+        queries=queries,
+    )
+
+    mock_client.vector_search_many.assert_called_once_with(
+        index_name="test_index",
+        namespace="test_namespace",
+        queries=queries,
+        limit=10,
+        search_params=None,
+        include_fields=None,
+        exclude_fields=["test_vector_field"],
+        timeout=None,
+        max_in_flight=64,
+        result_format=types.SearchResultFormat.NEIGHBORS,
+        vector_format=types.VectorFormat.LIST,
+    )
@@ -0,0 +1,262 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import grpc
+import pytest
+
+from aerospike_vector_search import types
+from aerospike_vector_search.shared import load_balancing
+from aerospike_vector_search.shared.load_balancing import (
+    NodeStats,
+    NodeStatsInterceptor,
+    create_balancing_policy,
+)
+
+
+class Node:
+    def __init__(self, name, outstanding=0, latency_ewma=0.0):
+        self.name = name
+        self.stats = NodeStats()
+        self.stats.outstanding = outstanding
+        self.stats.latency_ewma = latency_ewma
+
+
+class FakeCall:
+    def __init__(self, code=grpc.StatusCode.OK):
+        self.callbacks = []
+        self._code = code
+
+    def code(self):
+        return self._code
+
+    def add_done_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def finish(self):
+        for callback in self.callbacks:
+            callback(self)
+
+
+def test_round_robin_cycles_through_nodes():
+    policy = create_balancing_policy("round_robin")
+    nodes = [Node("a"), Node("b"), Node("c")]
+
+    assert [policy.choose(nodes).name for _ in range(6)] == ["a", "b", "c"] * 2
+
+
+def test_least_outstanding_prefers_idle_node():
+    policy = create_balancing_policy(types.LoadBalancingPolicy.LEAST_OUTSTANDING)
+    nodes = [Node("a", outstanding=5), Node("b", outstanding=1), Node("c", outstanding=3)]
+
+    assert {policy.choose(nodes).name for _ in range(10)} == {"b"}
+
+
+def test_least_outstanding_spreads_ties():
+    policy = create_balancing_policy(types.LoadBalancingPolicy.LEAST_OUTSTANDING)
+    nodes = [Node("a"), Node("b"), Node("c")]
+
+    assert {policy.choose(nodes).name for _ in range(3)} == {"a", "b", "c"}
+
+
+def test_latency_ewma_prefers_faster_of_two(monkeypatch):
+    policy = create_balancing_policy(types.LoadBalancingPolicy.LATENCY_EWMA)
+    slow = Node("slow", latency_ewma=0.5)
+    fast = Node("fast", latency_ewma=0.01, outstanding=3)
+    monkeypatch.setattr(load_balancing.random, "sample", lambda nodes, k: [slow, fast])
+
+    assert policy.choose([slow, fast]).name == "fast"
+
+    fast.stats.outstanding = 100
+    assert policy.choose([slow, fast]).name == "slow"
+
+
+def test_single_node():
+    for policy in types.LoadBalancingPolicy:
+        node = Node("a")
+        assert create_balancing_policy(policy).choose([node]) is node
+
+
+def test_invalid_policy():
+    with pytest.raises(types.AVSClientError):
+        create_balancing_policy("fastest")
+
+
+def test_interceptor_tracks_outstanding_calls():
+    stats = NodeStats()
+    interceptor = NodeStatsInterceptor(stats)
+    calls = []
+
+    def continuation(details, request):
+        calls.append(FakeCall())
+        return calls[-1]
+
+    interceptor.intercept_unary_unary(continuation, None, None)
+    interceptor.intercept_unary_stream(continuation, None, None)
+    assert stats.outstanding == 2
+
+    calls[0].finish()
+    assert stats.outstanding == 1
+    assert stats.latency_ewma > 0
+
+    calls[1].finish()
+    assert stats.outstanding == 0
+
+
+def test_interceptor_releases_failed_calls():
+    stats = NodeStats()
+    interceptor = NodeStatsInterceptor(stats)
+
+    def continuation(details, request):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        interceptor.intercept_unary_unary(continuation, None, None)
+    assert stats.outstanding == 0
+
+
+def test_interceptor_reports_unavailable_calls():
+    reported = []
+    interceptor = NodeStatsInterceptor(NodeStats(), reported.append)
+    calls = []
+
+    def continuation(details, request):
+        calls.append(FakeCall(grpc.StatusCode.UNAVAILABLE if request else grpc.StatusCode.OK))
+        return calls[-1]
+
+    interceptor.intercept_unary_unary(continuation, SimpleNamespace(method="/ok"), False)
+    interceptor.intercept_unary_unary(continuation, SimpleNamespace(method="/down"), True)
+    for call in calls:
+        call.finish()
+
+    assert reported == ["/down"]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_node_is_ejected_after_consecutive_failures(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(load_balancing.time, "monotonic", clock)
+    stats = NodeStats()
+
+    for _ in range(load_balancing.EJECTION_CONSECUTIVE_FAILURES - 1):
+        stats.record(True)
+    stats.record(False)
+    stats.record(True)
+    assert stats.available()
+
+    for _ in range(load_balancing.EJECTION_CONSECUTIVE_FAILURES - 1):
+        stats.record(True)
+    assert not stats.available()
+
+    clock.now += load_balancing.EJECTION_BASE_TIME
+    assert stats.available()
+    stats.outstanding = 1
+    assert not stats.available()
+
+
+def test_ejected_node_is_probed_back_in(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(load_balancing.time, "monotonic", clock)
+    stats = NodeStats()
+    for _ in range(load_balancing.EJECTION_CONSECUTIVE_FAILURES):
+        stats.record(True)
+
+    clock.now += load_balancing.EJECTION_BASE_TIME
+    stats.record(True)
+    assert not stats.available()
+    clock.now += load_balancing.EJECTION_BASE_TIME
+    assert not stats.available()
+    clock.now += load_balancing.EJECTION_BASE_TIME
+    assert stats.available()
+
+    for _ in range(load_balancing.PROBE_SUCCESSES):
+        stats.record(False)
+    assert stats.ejected_until == 0.0
+
+
+def test_probe_call_is_reserved_by_one_picker(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(load_balancing.time, "monotonic", clock)
+    stats = NodeStats()
+    assert stats.reserve() and stats.reserve()
+    for _ in range(load_balancing.EJECTION_CONSECUTIVE_FAILURES):
+        stats.record(True)
+    assert not stats.reserve()
+
+    clock.now += load_balancing.EJECTION_BASE_TIME
+    assert stats.reserve()
+    assert not stats.reserve()
+    assert not stats.available()
+
+    (started, probe) = stats.start()
+    assert probe
+    stats.finish(started)
+    stats.record(False, probe)
+    assert stats.reserve()
+
+    # A reservation whose probe is never sent is given up on.
+    clock.now += load_balancing.PROBE_TIMEOUT
+    assert stats.reserve()
+
+
+def test_only_the_probe_ends_its_reservation(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(load_balancing.time, "monotonic", clock)
+    stats = NodeStats()
+    (draining, probe) = stats.start()
+    assert not probe
+    for _ in range(load_balancing.EJECTION_CONSECUTIVE_FAILURES):
+        stats.record(True)
+
+    clock.now += load_balancing.EJECTION_BASE_TIME
+    stats.finish(draining)
+    assert stats.reserve()
+    stats.record(False, probe)
+
+    assert not stats.reserve()
+    assert not stats.available()
+
+
+def test_concurrent_pickers_reserve_one_probe():
+    stats = NodeStats()
+    stats.ejected_until = time.monotonic() - 1
+    barrier = threading.Barrier(8)
+    reserved = []
+
+    def pick():
+        barrier.wait()
+        reserved.append(stats.reserve())
+
+    threads = [threading.Thread(target=pick) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(reserved) == [False] * 7 + [True]
+
+
+def test_interceptor_records_node_failures():
+    stats = NodeStats()
+    interceptor = NodeStatsInterceptor(stats)
+    calls = []
+
+    def continuation(details, request):
+        calls.append(FakeCall(request))
+        return calls[-1]
+
+    for code in (grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.NOT_FOUND):
+        interceptor.intercept_unary_unary(continuation, None, code)
+        calls[-1].finish()
+
+    assert stats.consecutive_failures == 0
+    interceptor.intercept_unary_unary(continuation, None, grpc.StatusCode.UNAVAILABLE)
+    calls[-1].finish()
+    assert stats.consecutive_failures == 1
@@ -0,0 +1,54 @@
+import asyncio
+
+import grpc
+import pytest
+
+from aerospike_vector_search.shared.load_balancing import (
+    AsyncNodeStatsInterceptor,
+    NodeStats,
+)
+
+
+@pytest.fixture
+def aiolib():
+    # the interceptor is driven by grpc.aio done callbacks
+    return "asyncio"
+
+
+class FakeAsyncCall:
+    def __init__(self, code):
+        self._code = code
+        self._callbacks = []
+
+    async def code(self):
+        return self._code
+
+    def add_done_callback(self, callback):
+        self._callbacks.append(callback)
+
+    def finish(self):
+        for callback in self._callbacks:
+            callback(self)
+
+
+async def test_interceptor_records_status_in_done_callback(monkeypatch):
+    def no_tasks(*args, **kwargs):
+        raise AssertionError("a task was created")
+
+    monkeypatch.setattr(asyncio, "ensure_future", no_tasks)
+    monkeypatch.setattr(asyncio, "create_task", no_tasks)
+    stats = NodeStats()
+    reported = []
+    interceptor = AsyncNodeStatsInterceptor(stats, on_unavailable=reported.append)
+    call = FakeAsyncCall(grpc.StatusCode.UNAVAILABLE)
+
+    async def continuation(details, request):
+        return call
+
+    details = grpc.aio.ClientCallDetails("/down", None, None, None, None)
+    await interceptor.intercept_unary_unary(continuation, details, None)
+    call.finish()
+
+    assert stats.outstanding == 0
+    assert stats.consecutive_failures == 1
+    assert reported == ["/down"]
@@ -29,6 +29,16 @@ class TestTokenManager:
         stub.Authenticate.return_value = Mock(token="test_token")
         return stub
 
+    @pytest.fixture
+    def get_auth_stub(self, mock_auth_stub):
+        """Returns the mock auth stub, like the channel provider's _get_auth_stub"""
+        return lambda: mock_auth_stub
+
+    @pytest.fixture
+    def get_async_auth_stub(self, mock_async_auth_stub):
+        """Returns the mock async auth stub, like the channel provider's _get_auth_stub"""
+        return lambda: mock_async_auth_stub
+
     @pytest.fixture
     def mock_jwt_decode(self):
         """Mock the JWT decode function"""
@@ -170,13 +180,13 @@ class TestTokenManager:
         refresh_time = manager._get_next_refresh_time()
         assert refresh_time == 0  # Minimum refresh time
 
-    def test_refresh_token(self, mock_auth_stub, mock_jwt_decode):
+    def test_refresh_token(self, mock_auth_stub, get_auth_stub, mock_jwt_decode):
         """Test refresh_token method"""
         manager = TokenManager(username="test_user", password="test_pass")
         
         # Test refresh token
         with patch.object(manager, '_schedule_token_refresh') as mock_schedule:
-            manager.refresh_token(mock_auth_stub)
+            manager.refresh_token(get_auth_stub)
             
             # Verify auth request was made
             mock_auth_stub.Authenticate.assert_called_once()
@@ -185,19 +195,19 @@ class TestTokenManager:
             assert manager._token == "test_token"
             
             # Verify refresh was scheduled
-            mock_schedule.assert_called_once_with(mock_auth_stub)
+            mock_schedule.assert_called_once_with(get_auth_stub)
 
-    def test_refresh_token_no_credentials(self, mock_auth_stub):
+    def test_refresh_token_no_credentials(self, mock_auth_stub, get_auth_stub):
         """Test refresh_token method with no credentials"""
         manager = TokenManager()  # No credentials
         
         # Test refresh token
-        manager.refresh_token(mock_auth_stub)
+        manager.refresh_token(get_auth_stub)
         
         # Verify no auth request was made
         mock_auth_stub.Authenticate.assert_not_called()
 
-    def test_refresh_token_error(self, mock_auth_stub):
+    def test_refresh_token_error(self, mock_auth_stub, get_auth_stub):
         """Test refresh_token method with error"""
         manager = TokenManager(username="test_user", password="test_pass")
         
@@ -206,7 +216,7 @@ class TestTokenManager:
         
         # Test refresh token with error
         with pytest.raises(types.AVSServerError):
-            manager.refresh_token(mock_auth_stub)
+            manager.refresh_token(get_auth_stub)
 
     def test_schedule_token_refresh(self, mock_auth_stub):
         """Test _schedule_token_refresh method"""
@@ -256,7 +266,7 @@ class TestTokenManager:
                 mock_timer.assert_called_once()
                 mock_timer_instance.start.assert_called_once()
 
-    async def test_refresh_token_async(self, mock_async_auth_stub, mock_jwt_decode):
+    async def test_refresh_token_async(self, mock_async_auth_stub, get_async_auth_stub, mock_jwt_decode):
         """Test refresh_token_async method"""
         manager = TokenManager(username="test_user", password="test_pass")
         manager._is_async = True
@@ -266,7 +276,7 @@ class TestTokenManager:
             mock_schedule.return_value = asyncio.Future()
             mock_schedule.return_value.set_result(None)
             
-            await manager.refresh_token_async(mock_async_auth_stub)
+            await manager.refresh_token_async(get_async_auth_stub)
             
             # Verify auth request was made
             mock_async_auth_stub.Authenticate.assert_called_once()
@@ -275,20 +285,20 @@ class TestTokenManager:
             assert manager._token == "test_token"
             
             # Verify refresh was scheduled
-            mock_schedule.assert_called_once_with(mock_async_auth_stub)
+            mock_schedule.assert_called_once_with(get_async_auth_stub)
 
-    async def test_refresh_token_async_no_credentials(self, mock_async_auth_stub):
+    async def test_refresh_token_async_no_credentials(self, mock_async_auth_stub, get_async_auth_stub):
         """Test refresh_token_async method with no credentials"""
         manager = TokenManager()  # No credentials
         manager._is_async = True
         
         # Test refresh token async
-        await manager.refresh_token_async(mock_async_auth_stub)
+        await manager.refresh_token_async(get_async_auth_stub)
         
         # Verify no auth request was made
         mock_async_auth_stub.Authenticate.assert_not_called()
 
-    async def test_refresh_token_async_error(self, mock_async_auth_stub):
+    async def test_refresh_token_async_error(self, mock_async_auth_stub, get_async_auth_stub):
         """Test refresh_token_async method with error"""
         manager = TokenManager(username="test_user", password="test_pass")
         manager._is_async = True
@@ -298,7 +308,7 @@ class TestTokenManager:
         
         # Test refresh token async with error
         with pytest.raises(types.AVSServerError):
-            await manager.refresh_token_async(mock_async_auth_stub)
+            await manager.refresh_token_async(get_async_auth_stub)
 
     async def test_schedule_token_refresh_async_cancel_existing(self):
         """Test that scheduling a token refresh cancels any existing refresh"""
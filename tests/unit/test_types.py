@@ -0,0 +1,118 @@
+import copy
+import pickle
+
+import pytest
+
+from aerospike_vector_search import types
+from aerospike_vector_search.shared import conversions
+from aerospike_vector_search.shared.proto_generated import types_pb2
+
+
+def test_key_is_hashable_and_immutable():
+    key = types.Key(namespace="test", set="s", key=1)
+    same = types.Key(namespace="test", set="s", key=1)
+
+    assert key == same
+    assert hash(key) == hash(same)
+    assert {key: "a"}[same] == "a"
+    assert len({key, same, types.Key(namespace="test", set="s", key=2)}) == 2
+    assert repr(key) == "Key(namespace=test, set=s, key=1)"
+
+    with pytest.raises(AttributeError):
+        key.key = 2
+    with pytest.raises(AttributeError):
+        del key.set
+    with pytest.raises(AttributeError):
+        key.extra = 1
+    assert key.key == 1
+
+
+def test_key_with_unhashable_value_is_not_hashable():
+    key = types.Key(namespace="test", set="", key=bytearray(b"k"))
+
+    with pytest.raises(TypeError):
+        hash(key)
+
+
+def test_result_types_have_no_instance_dict():
+    key = types.Key(namespace="test", set="", key="k")
+    neighbor = types.Neighbor(key=key, fields={}, distance=0.5)
+    record = types.RecordWithKey(key=key, fields={})
+    lazy = types.LazyNeighbor(neighbor=types_pb2.Neighbor())
+
+    for value in (key, neighbor, record, lazy):
+        assert not hasattr(value, "__dict__")
+
+
+def test_neighbor_equality_and_repr():
+    neighbor = types.Neighbor(
+        key=types.Key(namespace="test", set="s", key="k"),
+        fields={"a": 1},
+        distance=0.5,
+    )
+
+    assert neighbor.key == types.Key(namespace="test", set="s", key="k")
+    assert neighbor == types.Neighbor(
+        key=types.Key(namespace="test", set="s", key="k"), fields={"a": 1}, distance=0.5
+    )
+    assert neighbor != types.Neighbor(
+        key=types.Key(namespace="test", set="s", key="j"), fields={"a": 1}, distance=0.5
+    )
+    assert repr(neighbor) == (
+        "Neighbor(key=Key: namespace='test', set='s', key=k, fields={'a': 1}, distance=0.5)"
+    )
+
+    neighbor.key = types.Key(namespace="test", set="", key=2)
+    neighbor.distance = 1.0
+
+    assert neighbor.key == types.Key(namespace="test", set="", key=2)
+    assert neighbor.distance == 1.0
+    assert neighbor.key is neighbor.key
+
+
+def test_lazy_neighbor_carries_only_its_own_slots():
+    lazy = types.LazyNeighbor(neighbor=types_pb2.Neighbor(distance=0.5))
+
+    assert not isinstance(lazy, types.Neighbor)
+    assert set(types.Neighbor.__slots__).isdisjoint(types.LazyNeighbor.__slots__)
+    assert lazy.distance == 0.5
+
+
+def test_lazy_neighbor_matches_neighbor():
+    message = types_pb2.Neighbor(
+        key=types_pb2.Key(namespace="test", set="s", longValue=3),
+        record=types_pb2.Record(
+            fields=[types_pb2.Field(name="a", value=types_pb2.Value(stringValue="x"))]
+        ),
+        distance=0.25,
+    )
+
+    lazy = types.LazyNeighbor(neighbor=message)
+
+    assert lazy == conversions.fromVectorDbNeighbor(message)
+    assert lazy.key is lazy.key
+
+
+def test_result_types_copy_and_pickle():
+    key = types.Key(namespace="test", set="s", key=b"k")
+    neighbor = types.Neighbor(key=key, fields={"a": [1.0]}, distance=0.5)
+    record = types.RecordWithKey(key=key, fields={"a": 1})
+
+    for clone in (copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))):
+        assert clone(key) == key
+        assert clone(neighbor) == neighbor
+        cloned = clone(record)
+        assert cloned.key == key
+        assert cloned.fields == {"a": 1}
+
+
+def test_decoded_keys_share_namespace_and_set():
+    keys = [
+        conversions.fromVectorDbKey(
+            types_pb2.Key(namespace="test", set="products", longValue=i)
+        )
+        for i in range(2)
+    ]
+
+    assert keys[0].namespace is keys[1].namespace
+    assert keys[0].set is keys[1].set